@@ -31,6 +31,25 @@ a = Analysis(
         'src.config_manager',
         'src.p4_client',
         'src.n8n_client',
+        'src.endpoint_pool',
+        'src.governor',
+        'src.latency_model',
+        'src.risk_scorer',
+        'src.payload_compactor',
+        'src.payload_layout',
+        'src.context_registry',
+        'src.profile_router',
+        'src.path_filter',
+        'src.asset_summary',
+        'src.unity_yaml',
+        'src.context_extractor',
+        'src.diff_digest',
+        'src.hunk_store',
+        'src.review_history',
+        'src.changelist_snapshot',
+        'src.response_cache',
+        'src.batch_planner',
+        'src.checkpoint',
         'src.commands',
         'src.commands.description',
         'src.commands.review',
@@ -0,0 +1,128 @@
+"""
+로컬 n8n Webhook 대체 서버
+n8n 워크플로우 대신 고정 응답을 돌려주며 전문가 컨텍스트 등록(ID 참조) 동작과 요청 크기를 확인
+사용법: python local_webhook.py [--port 5678] [--forget]
+        설정의 webhook_url을 http://127.0.0.1:5678/webhook/p4v-ai-assistant 로 지정
+"""
+import argparse
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+contexts = {}          # expert_context_id -> 전문가 컨텍스트
+stats = {"requests": 0, "bytes": 0, "inline": 0, "reference": 0, "missing": 0}
+lock = threading.Lock()
+forget = False
+
+
+def resolve_context(body):
+    """워크플로우의 Resolve Expert Context 노드와 같은 등록/조회 (등록 확인 ID, 상태)"""
+    context_id = body.get("expert_context_id")
+    if not context_id:
+        return None, "inline" if body.get("expert_context") else "none"
+    with lock:
+        if body.get("expert_context"):
+            contexts[context_id] = body["expert_context"]
+            return context_id, "inline"
+        if context_id in contexts and not forget:
+            return context_id, "reference"
+    return None, "missing"
+
+
+def review_response(body, context_id):
+    """파일마다 info 코멘트 하나를 단 고정 리뷰 응답"""
+    comments = [
+        {
+            "file_path": f["depot_path"],
+            "line_number": 1,
+            "severity": "info",
+            "category": "style",
+            "message": "로컬 Webhook 테스트 코멘트",
+            "suggestion": ""
+        }
+        for f in body.get("files", [])
+    ]
+    return {
+        "success": True,
+        "expert_context_id": context_id,
+        "summary": f"로컬 Webhook 리뷰 ({len(comments)}개 파일)",
+        "overall_score": 80,
+        "comments": comments,
+        "statistics": {"critical": 0, "warning": 0, "info": len(comments), "suggestion": 0}
+    }
+
+
+def description_response(body, context_id):
+    """파일 목록으로 만든 고정 커밋 메시지 응답"""
+    files = [f["depot_path"].split("/")[-1] for f in body.get("files", [])]
+    description = "[Chore] 로컬 Webhook 테스트\n\n" + "\n".join(f"- {name}" for name in files)
+    return {
+        "success": True,
+        "expert_context_id": context_id,
+        "description": description,
+        "summary": "로컬 Webhook 테스트"
+    }
+
+
+class Handler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        raw = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = json.loads(raw.decode("utf-8"))
+        context_id, state = resolve_context(body)
+
+        with lock:
+            stats["requests"] += 1
+            stats["bytes"] += len(raw)
+            if state in stats:
+                stats[state] += 1
+
+        if state == "missing":
+            result = {
+                "success": False,
+                "error_code": "unknown_expert_context",
+                "error": "등록되지 않은 전문가 컨텍스트입니다. 전문을 다시 보내주세요."
+            }
+        elif body.get("request_type") == "review":
+            result = review_response(body, context_id)
+        else:
+            result = description_response(body, context_id)
+
+        batch = body.get("batch_info", {})
+        stage = body.get("description_stage")
+        print(f"{body.get('request_type', '?'):<11} batch {batch.get('current', 1)}/{batch.get('total', 1)} "
+              f"{len(raw):>8} bytes  context={state}" + (f"  stage={stage}" if stage else ""))
+
+        data = json.dumps(result, ensure_ascii=False).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    global forget
+    parser = argparse.ArgumentParser(description="로컬 n8n Webhook 대체 서버")
+    parser.add_argument("--port", type=int, default=5678)
+    parser.add_argument("--forget", action="store_true",
+                        help="등록된 컨텍스트를 모르는 척 응답 (전문 재전송 확인용)")
+    args = parser.parse_args()
+    forget = args.forget
+
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), Handler)
+    print(f"http://127.0.0.1:{args.port}/webhook/p4v-ai-assistant 대기 중 (Ctrl+C로 종료)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"\n요청 {stats['requests']}개, 총 {stats['bytes']} bytes "
+              f"(전문 {stats['inline']}, ID 참조 {stats['reference']}, 미등록 {stats['missing']})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+에셋 변경 요약 모듈
+바이너리/직렬화 에셋은 파일별 diff 대신 종류별 개수, 경로, 크기로 요약하여 한 번에 전송
+"""
+import posixpath
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from .p4_client import FileChange
+
+
+# 에셋 종류별 확장자
+ASSET_CATEGORIES: Dict[str, Tuple[str, ...]] = {
+    "Unity 씬/프리팹": (".unity", ".prefab"),
+    "Unity 직렬화 에셋": (
+        ".asset", ".mat", ".anim", ".controller", ".overridecontroller", ".physicmaterial",
+        ".mask", ".playable", ".spriteatlas", ".lighting", ".rendertexture", ".mixer"
+    ),
+    "Unreal 에셋/레벨": (".uasset", ".umap"),
+    "텍스처": (
+        ".png", ".jpg", ".jpeg", ".tga", ".psd", ".tif", ".tiff", ".bmp", ".gif", ".dds",
+        ".exr", ".hdr"
+    ),
+    "모델": (".fbx", ".obj", ".blend", ".max", ".ma", ".mb", ".abc"),
+    "오디오/영상": (".wav", ".mp3", ".ogg", ".bank", ".mp4", ".mov"),
+    "폰트": (".ttf", ".otf"),
+    "바이너리": (".dll", ".so", ".lib", ".a", ".exe", ".pdb", ".zip", ".7z")
+}
+
+_EXTENSION_CATEGORY = {ext: category for category, exts in ASSET_CATEGORIES.items() for ext in exts}
+
+
+def classify_asset(file: FileChange) -> Optional[str]:
+    """에셋 종류 반환 (코드/텍스트 파일이면 None)"""
+    extension = posixpath.splitext(file.depot_path.lower())[1]
+    category = _EXTENSION_CATEGORY.get(extension)
+    if category is None and "binary" in file.file_type.lower():
+        category = "바이너리"
+    return category
+
+
+@dataclass
+class AssetChange:
+    """요약 대상 에셋 변경"""
+    depot_path: str
+    action: str
+    category: str
+    size: Optional[int] = None   # 바이트 (조회하지 못하면 None)
+
+
+@dataclass
+class AssetSummary:
+    """에셋 변경 요약"""
+    changes: List[AssetChange] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.changes)
+
+    def to_payload(self, max_paths: int = 20) -> Dict[str, Any]:
+        """
+        페이로드용 요약 (종류별 개수, 변경 타입별 개수, 총 크기, 경로 일부)
+
+        Args:
+            max_paths: 종류별로 포함할 최대 경로 수 (나머지는 개수만 표시)
+        """
+        categories: Dict[str, List[AssetChange]] = {}
+        for change in self.changes:
+            categories.setdefault(change.category, []).append(change)
+
+        sections = []
+        for category, changes in sorted(categories.items(), key=lambda item: -len(item[1])):
+            sizes = [c.size for c in changes if c.size is not None]
+            sections.append({
+                "category": category,
+                "count": len(changes),
+                "actions": dict(Counter(c.action for c in changes)),
+                "total_bytes": sum(sizes),
+                "files": [
+                    {"path": c.depot_path, "action": c.action, "size": c.size}
+                    for c in changes[:max_paths]
+                ],
+                "more": max(len(changes) - max_paths, 0)
+            })
+
+        return {
+            "total": len(self.changes),
+            "total_bytes": sum(c.size for c in self.changes if c.size is not None),
+            "categories": sections
+        }
+
+    def describe(self) -> str:
+        """한 줄 요약 텍스트"""
+        counts = Counter(c.category for c in self.changes).most_common()
+        details = ", ".join(f"{category} {count}개" for category, count in counts)
+        return f"에셋 {len(self.changes)}개는 diff 없이 요약으로 전송 ({details})"
+
+    def to_dict(self) -> List[Dict[str, Any]]:
+        """체크포인트 저장용 직렬화"""
+        return [asdict(c) for c in self.changes]
+
+    @classmethod
+    def from_dict(cls, data: List[Dict[str, Any]]) -> "AssetSummary":
+        return cls(changes=[AssetChange(**c) for c in data])
+
+
+def split_assets(files: List[FileChange]) -> Tuple[List[FileChange], List[FileChange]]:
+    """
+    파일 목록을 코드/텍스트 파일과 요약할 에셋 파일로 분리
+
+    Returns:
+        (diff를 수집할 파일 목록, 요약할 에셋 파일 목록)
+    """
+    code: List[FileChange] = []
+    assets: List[FileChange] = []
+    for f in files:
+        (assets if classify_asset(f) else code).append(f)
+    return code, assets
+
+
+def build_asset_summary(files: List[FileChange], sizes: Dict[str, int]) -> AssetSummary:
+    """
+    에셋 파일 목록으로 요약 생성
+
+    Args:
+        files: split_assets()로 분리한 에셋 파일 목록
+        sizes: depot_path -> 파일 크기 (P4Client.get_file_sizes() 결과)
+    """
+    return AssetSummary(changes=[
+        AssetChange(
+            depot_path=f.depot_path,
+            action=f.action,
+            category=classify_asset(f) or "바이너리",
+            size=sizes.get(f.depot_path)
+        )
+        for f in files
+    ])
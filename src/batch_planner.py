@@ -0,0 +1,542 @@
+"""
+리뷰 배치 계획 모듈
+파일별 토큰 수를 추정하여 모델 컨텍스트 한도 안에서 배치 구성
+"""
+import posixpath
+import re
+from dataclasses import replace
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .p4_client import FileChange
+
+
+# 배치 분할 임계값 (Gemini 2.5 Flash 기준)
+MAX_FILES_PER_BATCH = 50
+MAX_TOKENS_PER_BATCH = 60000
+
+# 파일 하나당 JSON 메타데이터 오버헤드 (depot_path, action, file_type, revision 등 키/구분자)
+FILE_OVERHEAD_TOKENS = 40
+# 배치 하나당 공통 오버헤드 (request_type, changelist, session_key, batch_info 등)
+BATCH_OVERHEAD_TOKENS = 200
+
+# unified diff hunk 헤더: @@ -old_start,old_count +new_start,new_count @@ section
+HUNK_HEADER_PATTERN = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@(.*)$")
+
+
+def estimate_tokens(text: str) -> int:
+    """텍스트의 토큰 수 추정
+
+    영문/코드는 대략 4글자당 1토큰, 한글 등 비ASCII 문자는 글자당 1토큰으로 계산.
+    줄 수 대신 글자 수를 기준으로 하므로 긴 minified 라인도 과소평가하지 않음
+
+    Args:
+        text: 대상 텍스트
+
+    Returns:
+        추정 토큰 수
+    """
+    if not text:
+        return 0
+    non_ascii = sum(1 for ch in text if ord(ch) > 127)
+    ascii_count = len(text) - non_ascii
+    return (ascii_count + 3) // 4 + non_ascii
+
+
+def estimate_file_tokens(file: FileChange) -> int:
+    """파일 하나가 페이로드에서 차지하는 토큰 수 추정 (헤더/메타데이터 포함)"""
+    return (
+        estimate_tokens(file.diff)
+        + estimate_tokens(file.depot_path)
+        + estimate_tokens(file.file_type)
+        + sum(estimate_tokens(path) for path in file.shared_paths)
+        + FILE_OVERHEAD_TOKENS
+    )
+
+
+def split_diff_into_hunks(diff: str) -> Tuple[List[str], List[List[str]]]:
+    """unified diff를 파일 헤더와 hunk 목록으로 분리
+
+    Args:
+        diff: unified diff 텍스트
+
+    Returns:
+        (첫 hunk 이전의 헤더 라인들, hunk별 라인 목록 - 각 hunk의 첫 줄은 @@ 헤더)
+    """
+    header: List[str] = []
+    hunks: List[List[str]] = []
+    for line in diff.split("\n"):
+        if HUNK_HEADER_PATTERN.match(line):
+            hunks.append([line])
+        elif hunks:
+            hunks[-1].append(line)
+        else:
+            header.append(line)
+    return header, hunks
+
+
+def hunk_new_range(hunk: List[str]) -> Optional[Tuple[int, int]]:
+    """hunk가 다루는 새 파일 라인 범위 (start, end) 반환"""
+    match = HUNK_HEADER_PATTERN.match(hunk[0]) if hunk else None
+    if not match:
+        return None
+    start = int(match.group(3))
+    count = int(match.group(4)) if match.group(4) is not None else 1
+    return max(start, 1), max(start + count - 1, start, 1)
+
+
+def _split_hunk(hunk: List[str], max_tokens: int) -> List[List[str]]:
+    """토큰 예산을 넘는 단일 hunk를 여러 hunk로 분할하고 헤더의 라인 오프셋 재계산"""
+    match = HUNK_HEADER_PATTERN.match(hunk[0])
+    if not match:
+        return [hunk]
+
+    old_line = int(match.group(1))
+    new_line = int(match.group(3))
+    section = match.group(5)
+
+    pieces: List[List[str]] = []
+    body: List[str] = []
+    body_tokens = 0
+    piece_old_start, piece_new_start = old_line, new_line
+    old_count = new_count = 0
+
+    def flush() -> None:
+        if body:
+            header = f"@@ -{piece_old_start},{old_count} +{piece_new_start},{new_count} @@{section}"
+            pieces.append([header] + body)
+
+    for line in hunk[1:]:
+        line_tokens = estimate_tokens(line) + 1
+        if body and body_tokens + line_tokens > max_tokens:
+            flush()
+            body = []
+            body_tokens = 0
+            piece_old_start, piece_new_start = old_line, new_line
+            old_count = new_count = 0
+
+        body.append(line)
+        body_tokens += line_tokens
+        if line.startswith("+"):
+            new_line += 1
+            new_count += 1
+        elif line.startswith("-"):
+            old_line += 1
+            old_count += 1
+        elif line.startswith("\\"):
+            pass  # "\ No newline at end of file"
+        else:
+            old_line += 1
+            new_line += 1
+            old_count += 1
+            new_count += 1
+
+    flush()
+    return pieces
+
+
+def split_file_change(file: FileChange, max_tokens: int) -> List[FileChange]:
+    """토큰 예산을 넘는 파일 diff를 hunk 경계에서 여러 부분으로 분할
+
+    각 부분은 원본 파일 헤더를 유지하고, hunk 헤더에 원본 파일 기준 라인 번호를 담으므로
+    AI가 반환한 라인 번호를 그대로 원본 파일에 매핑할 수 있음
+
+    Args:
+        file: 원본 FileChange
+        max_tokens: 부분 하나에 허용되는 최대 토큰 수 (메타데이터 포함)
+
+    Returns:
+        분할된 FileChange 목록 (분할이 필요 없으면 [file])
+    """
+    if estimate_file_tokens(file) <= max_tokens:
+        return [file]
+
+    header, hunks = split_diff_into_hunks(file.diff)
+    if not hunks:
+        # hunk가 없는 diff(오류 메시지 등)는 라인 단위로 분할
+        hunks = [[line] for line in header]
+        header = []
+
+    header_tokens = sum(estimate_tokens(line) + 1 for line in header)
+    overhead = (
+        estimate_tokens(file.depot_path)
+        + estimate_tokens(file.file_type)
+        + FILE_OVERHEAD_TOKENS
+        + header_tokens
+    )
+    body_budget = max(max_tokens - overhead, 1)
+
+    # 예산을 넘는 단일 hunk는 먼저 잘게 나눔
+    pieces: List[List[str]] = []
+    for hunk in hunks:
+        hunk_tokens = sum(estimate_tokens(line) + 1 for line in hunk)
+        if hunk_tokens > body_budget:
+            pieces.extend(_split_hunk(hunk, body_budget))
+        else:
+            pieces.append(hunk)
+
+    # hunk들을 순서대로 부분에 채움
+    parts: List[List[List[str]]] = []
+    current: List[List[str]] = []
+    current_tokens = 0
+    for piece in pieces:
+        piece_tokens = sum(estimate_tokens(line) + 1 for line in piece)
+        if current and current_tokens + piece_tokens > body_budget:
+            parts.append(current)
+            current = []
+            current_tokens = 0
+        current.append(piece)
+        current_tokens += piece_tokens
+    if current:
+        parts.append(current)
+
+    if len(parts) <= 1:
+        return [file]
+
+    result: List[FileChange] = []
+    for index, part_hunks in enumerate(parts, 1):
+        ranges = [r for r in (hunk_new_range(h) for h in part_hunks) if r]
+        lines = header + [line for hunk in part_hunks for line in hunk]
+        result.append(replace(
+            file,
+            diff="\n".join(lines),
+            diff_full="",
+            part_info={
+                "index": index,
+                "total": len(parts),
+                "line_start": min(r[0] for r in ranges) if ranges else 0,
+                "line_end": max(r[1] for r in ranges) if ranges else 0
+            }
+        ))
+    return result
+
+
+def drop_line_ranges(file: FileChange, ranges: List[Tuple[int, int]]) -> Optional[FileChange]:
+    """이미 요청한 새 파일 라인 범위 안에 있는 hunk를 뺀 사본
+
+    분할 전송 도중 중단된 파일을 재개할 때 요청하지 않은 부분만 다시 보내기 위해 사용
+
+    Args:
+        file: 원본 FileChange
+        ranges: 이미 요청한 부분들의 (line_start, line_end) 목록
+
+    Returns:
+        남은 hunk만 포함한 사본 (분할 정보 없음), 남은 hunk가 없으면 None
+    """
+    # 이어지는 범위를 합쳐서, 여러 부분에 걸친 hunk도 판단
+    merged: List[List[int]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+
+    header, hunks = split_diff_into_hunks(file.diff)
+    kept = []
+    for hunk in hunks:
+        span = hunk_new_range(hunk)
+        if span is None or not any(start <= span[0] and span[1] <= end for start, end in merged):
+            kept.append(hunk)
+    if not kept:
+        return None
+    return replace(
+        file,
+        diff="\n".join(header + [line for hunk in kept for line in hunk]),
+        diff_full="",
+        part_info=None
+    )
+
+
+def _trim_hunk(hunk: List[str], context: int) -> List[List[str]]:
+    """hunk에서 변경 라인 주변 context줄만 남기고, 끊어진 구간은 별도 hunk로 재구성"""
+    match = HUNK_HEADER_PATTERN.match(hunk[0])
+    if not match:
+        return [hunk]
+
+    old_line = int(match.group(1))
+    new_line = int(match.group(3))
+    section = match.group(5)
+    body = hunk[1:]
+
+    keep = set()
+    for i, line in enumerate(body):
+        if line.startswith(("+", "-")):
+            keep.update(range(max(i - context, 0), min(i + context + 1, len(body))))
+
+    pieces: List[List[str]] = []
+    current: List[str] = []
+    old_start = new_start = old_count = new_count = 0
+
+    def flush() -> None:
+        if current:
+            # 길이 0인 범위는 관례상 직전 라인 번호로 표기
+            old_pos = old_start if old_count else old_start - 1
+            new_pos = new_start if new_count else new_start - 1
+            pieces.append([f"@@ -{old_pos},{old_count} +{new_pos},{new_count} @@{section}"] + current)
+
+    for i, line in enumerate(body):
+        kept = i in keep or (line.startswith("\\") and current)
+        if kept:
+            if not current:
+                old_start, new_start = old_line, new_line
+                old_count = new_count = 0
+            current.append(line)
+        elif current:
+            flush()
+            current = []
+
+        if line.startswith("+"):
+            new_line += 1
+            new_count += 1 if kept else 0
+        elif line.startswith("-"):
+            old_line += 1
+            old_count += 1 if kept else 0
+        elif line.startswith("\\"):
+            pass  # "\ No newline at end of file"
+        else:
+            old_line += 1
+            new_line += 1
+            if kept:
+                old_count += 1
+                new_count += 1
+
+    flush()
+    return pieces
+
+
+def trim_diff_context(diff: str, context: int = 0) -> str:
+    """unified diff의 context 라인을 줄여 토큰 수 축소
+
+    변경 라인 주변 context줄만 남기고 hunk 헤더의 라인 번호를 다시 계산하므로
+    AI가 반환하는 라인 번호는 그대로 원본 파일 기준으로 유지됨
+
+    Args:
+        diff: unified diff 텍스트
+        context: 변경 라인 앞뒤로 남길 context 줄 수
+
+    Returns:
+        context가 줄어든 diff (hunk가 없으면 원본 그대로)
+    """
+    header, hunks = split_diff_into_hunks(diff)
+    if not hunks:
+        return diff
+
+    lines = list(header)
+    for hunk in hunks:
+        for piece in _trim_hunk(hunk, context):
+            lines.extend(piece)
+    return "\n".join(lines)
+
+
+class BatchPlanner:
+    """토큰 예산 기반 배치 계획기
+
+    같은 디렉토리의 파일을 하나의 그룹으로 묶고, 그룹을 토큰 크기 내림차순으로
+    First-Fit 방식으로 배치에 채워 넣어 배치 수를 최소화.
+    group_key가 있으면 키가 같은 파일끼리만 같은 배치에 넣음 (배치별 전문가 프로필)
+    """
+
+    def __init__(
+        self,
+        max_tokens: int = MAX_TOKENS_PER_BATCH,
+        max_files: int = MAX_FILES_PER_BATCH,
+        base_tokens: int = 0,
+        group_key: Optional[Callable[[str], str]] = None
+    ):
+        """
+        Args:
+            max_tokens: 배치당 최대 토큰 수
+            max_files: 배치당 최대 파일 수
+            base_tokens: 모든 배치에 공통으로 포함되는 토큰 수
+                (전문가 컨텍스트, changelist description 등)
+            group_key: depot_path -> 배치 구분 키 (예: ProfileRouter.route)
+        """
+        self.max_tokens = max_tokens
+        self.max_files = max_files
+        self.base_tokens = base_tokens + BATCH_OVERHEAD_TOKENS
+        self.group_key = group_key
+
+    def key(self, file: FileChange) -> str:
+        """파일의 배치 구분 키 (group_key가 없으면 모두 같은 키)"""
+        return self.group_key(file.depot_path) if self.group_key else ""
+
+    @property
+    def file_budget(self) -> int:
+        """배치 하나에서 파일 diff에 사용할 수 있는 토큰 수"""
+        return max(self.max_tokens - self.base_tokens, 1)
+
+    def plan(self, files: List[FileChange]) -> List[List[FileChange]]:
+        """
+        파일 목록을 배치로 분할
+
+        Args:
+            files: 파일 목록
+
+        Returns:
+            배치로 분할된 파일 목록 (각 배치 내 파일은 원래 순서 유지)
+        """
+        if not files:
+            return []
+
+        # 한 배치에 들어가지 않는 대용량 파일은 hunk 단위로 분할
+        expanded: List[FileChange] = []
+        order: Dict[int, Tuple[int, int]] = {}
+        for i, f in enumerate(files):
+            for k, part in enumerate(split_file_change(f, self.file_budget)):
+                expanded.append(part)
+                order[id(part)] = (i, k)
+        files = expanded
+
+        tokens = {id(f): estimate_file_tokens(f) for f in files}
+
+        # 분할이 필요 없는 경우
+        keys = {id(f): self.key(f) for f in files}
+        if (len(files) <= self.max_files and sum(tokens.values()) <= self.file_budget
+                and len(set(keys.values())) == 1):
+            return [list(files)]
+
+        groups = self._group_by_directory(files, tokens)
+        groups.sort(key=lambda g: sum(tokens[id(f)] for f in g), reverse=True)
+
+        # First-Fit Decreasing
+        batches: List[List[FileChange]] = []
+        batch_tokens: List[int] = []
+        for group in groups:
+            group_tokens = sum(tokens[id(f)] for f in group)
+            for i, batch in enumerate(batches):
+                if (batch_tokens[i] + group_tokens <= self.file_budget
+                        and len(batch) + len(group) <= self.max_files
+                        and keys[id(batch[0])] == keys[id(group[0])]):
+                    batch.extend(group)
+                    batch_tokens[i] += group_tokens
+                    break
+            else:
+                batches.append(list(group))
+                batch_tokens.append(group_tokens)
+
+        for batch in batches:
+            batch.sort(key=lambda f: order[id(f)])
+        batches.sort(key=lambda b: order[id(b[0])])
+        return batches
+
+    def _group_by_directory(
+        self,
+        files: List[FileChange],
+        tokens: Dict[int, int]
+    ) -> List[List[FileChange]]:
+        """디렉토리(와 구분 키)별로 파일을 묶고, 한 배치에 들어가지 않는 그룹은 순서대로 잘라냄"""
+        by_dir: Dict[Tuple[str, str], List[FileChange]] = {}
+        for f in files:
+            by_dir.setdefault((self.key(f), posixpath.dirname(f.depot_path)), []).append(f)
+
+        groups: List[List[FileChange]] = []
+        for dir_files in by_dir.values():
+            current: List[FileChange] = []
+            current_tokens = 0
+            for f in dir_files:
+                file_tokens = tokens[id(f)]
+                if current and (current_tokens + file_tokens > self.file_budget
+                                or len(current) >= self.max_files):
+                    groups.append(current)
+                    current = []
+                    current_tokens = 0
+                current.append(f)
+                current_tokens += file_tokens
+            if current:
+                groups.append(current)
+        return groups
+
+
+class StreamingBatchPlanner(BatchPlanner):
+    """파일을 하나씩 받아 배치를 구성하는 스트리밍 배치 계획기
+
+    diff 수집과 리뷰 요청을 겹치기 위해, 가득 찬 배치는 전체 파일 수집이 끝나기 전에 바로 반환.
+    같은 디렉토리 파일이 있는 열린 배치를 우선 사용하고, 남은 파일은 flush()에서
+    BatchPlanner.plan()으로 다시 묶어 배치 수를 최소화
+    """
+
+    # 남은 예산이 이 비율 미만이면 가득 찬 것으로 보고 바로 내보냄
+    FULL_RATIO = 0.1
+
+    def __init__(
+        self,
+        max_tokens: int = MAX_TOKENS_PER_BATCH,
+        max_files: int = MAX_FILES_PER_BATCH,
+        base_tokens: int = 0,
+        max_open_batches: int = 4,
+        group_key: Optional[Callable[[str], str]] = None
+    ):
+        super().__init__(
+            max_tokens=max_tokens, max_files=max_files, base_tokens=base_tokens, group_key=group_key
+        )
+        self.max_open_batches = max_open_batches
+        self._open: List[List[FileChange]] = []
+        self._open_tokens: List[int] = []
+
+    @property
+    def pending_tokens(self) -> int:
+        """아직 요청되지 않은 열린 배치의 파일 토큰 합계"""
+        return sum(self._open_tokens)
+
+    def add(self, file: FileChange) -> List[List[FileChange]]:
+        """
+        파일 추가
+
+        Args:
+            file: diff가 채워진 FileChange
+
+        Returns:
+            가득 차서 바로 요청할 수 있는 배치 목록 (없으면 빈 리스트)
+        """
+        ready: List[List[FileChange]] = []
+        for part in split_file_change(file, self.file_budget):
+            self._place(part)
+            ready.extend(self._take_ready())
+        return ready
+
+    def flush(self) -> List[List[FileChange]]:
+        """남은 파일을 모두 배치로 구성하여 반환"""
+        remaining = [f for batch in self._open for f in batch]
+        self._open = []
+        self._open_tokens = []
+        return self.plan(remaining)
+
+    def _place(self, file: FileChange) -> None:
+        file_tokens = estimate_file_tokens(file)
+        directory = posixpath.dirname(file.depot_path)
+        key = self.key(file)
+
+        def fits(i: int) -> bool:
+            return (self._open_tokens[i] + file_tokens <= self.file_budget
+                    and len(self._open[i]) < self.max_files
+                    and self.key(self._open[i][0]) == key)
+
+        candidates = [i for i in range(len(self._open)) if fits(i)]
+        same_dir = [
+            i for i in candidates
+            if any(posixpath.dirname(f.depot_path) == directory for f in self._open[i])
+        ]
+        if same_dir or candidates:
+            i = (same_dir or candidates)[0]
+            self._open[i].append(file)
+            self._open_tokens[i] += file_tokens
+        else:
+            self._open.append([file])
+            self._open_tokens.append(file_tokens)
+
+    def _take_ready(self) -> List[List[FileChange]]:
+        """가득 찬 배치를 꺼내 반환 (열린 배치가 너무 많으면 가장 큰 배치도 내보냄)"""
+        ready: List[List[FileChange]] = []
+        threshold = self.file_budget * (1 - self.FULL_RATIO)
+        i = 0
+        while i < len(self._open):
+            if self._open_tokens[i] >= threshold or len(self._open[i]) >= self.max_files:
+                ready.append(self._open.pop(i))
+                self._open_tokens.pop(i)
+            else:
+                i += 1
+
+        while len(self._open) > self.max_open_batches:
+            largest = max(range(len(self._open)), key=lambda k: self._open_tokens[k])
+            ready.append(self._open.pop(largest))
+            self._open_tokens.pop(largest)
+        return ready
@@ -0,0 +1,187 @@
+"""
+Changelist 스냅샷 모듈
+수집한 파일별 diff를 파일 변경 지문과 함께 저장하여, 같은 Changelist로 AI Description과
+AI Review를 이어서 실행할 때 (별도 프로세스) 바뀌지 않은 파일은 p4에서 다시 수집하지 않음
+"""
+import time
+from dataclasses import replace
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from .checkpoint import read_json, write_json_atomic
+from .config_manager import get_config
+from .p4_client import (
+    DIFF_ERROR_PREFIX,
+    DIFF_SUMMARY_PREFIX,
+    FETCH_REVIEW,
+    ChangelistInfo,
+    FetchProfile,
+    FileChange,
+    P4Client,
+    P4Error,
+    apply_fetch_profile
+)
+
+
+# 스냅샷 형식 버전 (바뀌면 이전 스냅샷 무시)
+SNAPSHOT_VERSION = 1
+
+
+class ChangelistSnapshot:
+    """Changelist 하나의 수집한 diff 스냅샷
+
+    파일 구성 (JSON):
+        version  - 스냅샷 형식 버전
+        files    - depot_path -> {
+                       "fingerprint": 파일 변경 지문 (P4Client.get_file_fingerprints),
+                       "created": 수집 시각,
+                       "diff": 변경사항 diff,
+                       "diff_full": 전체 소스 diff (수집하지 않았으면 None),
+                       "summarized": diff가 통계 요약으로 대체되었는지 여부
+                   }
+
+    파일 단위로 무효화하므로 수정한 파일만 다시 수집하고, 리뷰는 description이 수집하지 않은
+    전체 소스 diff만 추가로 수집
+    """
+
+    def __init__(self, path: Path, ttl_seconds: float):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+
+    @classmethod
+    def for_changelist(cls, changelist: int, ttl_seconds: float) -> "ChangelistSnapshot":
+        """Changelist 번호에 해당하는 스냅샷 반환"""
+        return cls(get_config().cache_dir / "snapshots" / f"cl_{changelist}.json", ttl_seconds)
+
+    @classmethod
+    def from_config(cls, changelist: int) -> Optional["ChangelistSnapshot"]:
+        """changelist_snapshot 설정으로 생성 (비활성화 시 None)"""
+        settings = get_config().changelist_snapshot
+        if not settings.get("enabled", True):
+            return None
+        return cls.for_changelist(changelist, settings.get("ttl_hours", 8) * 3600)
+
+    def load(self, fingerprints: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+        """지문이 일치하고 만료되지 않은 파일 항목 (depot_path -> 항목)"""
+        data = read_json(self.path)
+        if not isinstance(data, dict) or data.get("version") != SNAPSHOT_VERSION:
+            return {}
+        now = time.time()
+        return {
+            path: entry
+            for path, entry in data.get("files", {}).items()
+            if fingerprints.get(path) and entry.get("fingerprint") == fingerprints[path]
+            and now - entry.get("created", 0) <= self.ttl_seconds
+        }
+
+    def save(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        """스냅샷 저장 후 만료된 다른 스냅샷 정리 (저장 실패는 명령 결과에 영향을 주지 않음)"""
+        try:
+            write_json_atomic(self.path, {"version": SNAPSHOT_VERSION, "files": entries})
+        except (IOError, OSError, TypeError, ValueError):
+            return
+        expire_before = time.time() - self.ttl_seconds
+        for path in self.path.parent.glob("cl_*.json"):
+            try:
+                if path != self.path and path.stat().st_mtime < expire_before:
+                    path.unlink()
+            except OSError:
+                continue
+
+    def iter_diffs(
+        self,
+        p4: P4Client,
+        info: ChangelistInfo,
+        profile: FetchProfile = FETCH_REVIEW
+    ) -> Iterator[FileChange]:
+        """
+        P4Client.iter_diffs()와 같이 info.files 순서대로 diff를 채워 반환
+
+        스냅샷에 있는 파일은 저장된 diff를 쓰고, 나머지만 p4에서 수집.
+        profile이 전체 소스 diff를 요구하는데 스냅샷에 없으면 diff_full만 수집
+        """
+        try:
+            fingerprints = p4.get_file_fingerprints(info)
+        except P4Error:
+            yield from p4.iter_diffs(info, profile)
+            return
+
+        stored = self.load(fingerprints)
+        fetch_all, fetch_full = [], []
+        for file_change in info.files:
+            entry = stored.get(file_change.depot_path)
+            # 요약된 diff는 원본 diff가 필요한 요청(리뷰)에 쓸 수 없음
+            if entry is None or (entry.get("summarized") and not profile.summarize_over):
+                fetch_all.append(file_change)
+            elif profile.full_context and entry.get("diff_full") is None:
+                fetch_full.append(file_change)
+
+        # p4 수집은 info.files 순서대로 반환하므로, 필요한 파일 차례에 한 개씩 진행
+        all_ids = {id(f) for f in fetch_all}
+        full_ids = {id(f) for f in fetch_full}
+        all_iter = p4.iter_diffs(replace(info, files=fetch_all), profile) if fetch_all else iter(())
+        full_iter = (
+            p4.iter_diffs(replace(info, files=fetch_full), replace(profile, short_context=False))
+            if fetch_full else iter(())
+        )
+
+        entries = dict(stored)
+        changed = False
+        try:
+            for file_change in info.files:
+                if id(file_change) in all_ids:
+                    next(all_iter)
+                else:
+                    entry = stored[file_change.depot_path]
+                    file_change.diff = entry["diff"]
+                    if id(file_change) in full_ids:
+                        next(full_iter)
+                    elif profile.full_context:
+                        file_change.diff_full = entry["diff_full"]
+                    apply_fetch_profile(file_change, profile)
+
+                # 이번에 수집한 파일만 저장 (나중에 context 확장 등으로 바뀌기 전의 diff)
+                fingerprint = fingerprints.get(file_change.depot_path)
+                fetched = id(file_change) in all_ids or id(file_change) in full_ids
+                if fetched and fingerprint and not file_change.diff.startswith(DIFF_ERROR_PREFIX):
+                    entries[file_change.depot_path] = {
+                        "fingerprint": fingerprint,
+                        "created": time.time(),
+                        "diff": file_change.diff,
+                        "diff_full": file_change.diff_full if profile.full_context else None,
+                        "summarized": file_change.diff.startswith(DIFF_SUMMARY_PREFIX)
+                    }
+                    changed = True
+                yield file_change
+        finally:
+            # 마감 모드처럼 중간에 수집을 멈춰도 수집한 파일까지 저장
+            if changed:
+                self.save(entries)
+
+
+def iter_changelist_diffs(
+    p4: P4Client,
+    info: ChangelistInfo,
+    profile: FetchProfile = FETCH_REVIEW,
+    use_cache: bool = True
+) -> Iterator[FileChange]:
+    """스냅샷을 거쳐 diff 수집 (use_cache=False거나 비활성화 시 p4에서 직접 수집)"""
+    snapshot = ChangelistSnapshot.from_config(info.number) if use_cache else None
+    if snapshot is None:
+        return p4.iter_diffs(info, profile)
+    return snapshot.iter_diffs(p4, info, profile)
+
+
+def fill_changelist_diffs(
+    p4: P4Client,
+    info: ChangelistInfo,
+    profile: FetchProfile = FETCH_REVIEW,
+    use_cache: bool = True
+) -> List[FileChange]:
+    """
+    모든 파일의 diff를 수집하여 반환 (스냅샷을 거침)
+
+    Returns:
+        diff가 채워진 파일 목록 (info.files 순서)
+    """
+    return list(iter_changelist_diffs(p4, info, profile, use_cache))
@@ -0,0 +1,200 @@
+"""
+리뷰 실행 체크포인트 모듈
+수집한 Changelist 데이터와 완료된 배치 응답을 디스크에 저장하여 중단된 리뷰 재개
+"""
+import json
+import os
+import shutil
+import tempfile
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .config_manager import get_config
+from .p4_client import ChangelistInfo, FileChange
+
+
+def write_json_atomic(path: Path, data: Any) -> None:
+    """
+    JSON 파일을 임시 파일에 쓴 뒤 교체 (중간에 종료되어도 파일이 깨지지 않음)
+
+    임시 파일은 쓰기마다 고유한 이름으로 만들므로 여러 스레드/프로세스가 같은 파일을
+    동시에 저장해도 서로의 임시 파일을 덮어쓰지 않음 (마지막 교체가 남음)
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", dir=path.parent, prefix=f"{path.name}.", suffix=".tmp", delete=False
+    )
+    try:
+        with tmp_file:
+            json.dump(data, tmp_file, ensure_ascii=False)
+        os.replace(tmp_file.name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_file.name)
+        except OSError:
+            pass
+        raise
+
+
+def read_json(path: Path) -> Optional[Any]:
+    """JSON 파일 읽기 (없거나 손상되었으면 None)"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (IOError, OSError, json.JSONDecodeError):
+        return None
+
+
+def changelist_to_dict(info: ChangelistInfo) -> Dict[str, Any]:
+    """ChangelistInfo를 JSON 직렬화 가능한 딕셔너리로 변환"""
+    return asdict(info)
+
+
+def changelist_from_dict(data: Dict[str, Any]) -> ChangelistInfo:
+    """딕셔너리에서 ChangelistInfo 복원"""
+    data = dict(data)
+    files = [FileChange(**f) for f in data.pop("files", [])]
+    return ChangelistInfo(files=files, **data)
+
+
+class ReviewCheckpoint:
+    """Changelist 단위 리뷰 실행 체크포인트
+
+    디렉토리 구성:
+        state.json       - 실행 상태 (생성 시각, 배치 계획 완료 여부, 전체 배치 수, incremental 여부)
+        changelist.json  - Changelist 정보 (시작 시 파일 목록, 계획 완료 시 diff 포함)
+        plan_0001.json   - 배치별 파일 목록 (분할 파일 포함, 요청 전에 기록)
+        batch_0001.json  - 완료된 배치 응답
+        assets.json      - diff 없이 요약으로 보낸 에셋 변경 (있는 경우)
+        reused.json      - 이전 리뷰에서 본 hunk의 저장된 코멘트 (있는 경우)
+        carried.json     - incremental 모드에서 이어 쓴 파일별 이전 코멘트 (있는 경우)
+    """
+
+    def __init__(self, run_dir: Path):
+        self.run_dir = Path(run_dir)
+
+    @classmethod
+    def for_changelist(cls, changelist: int) -> "ReviewCheckpoint":
+        """Changelist 번호에 해당하는 체크포인트 반환"""
+        return cls(get_config().cache_dir / "runs" / f"cl_{changelist}")
+
+    def exists(self) -> bool:
+        """재개 가능한 체크포인트가 있는지 확인"""
+        return (self.run_dir / "state.json").exists()
+
+    def start(self, changelist_info: ChangelistInfo, incremental: bool = False) -> None:
+        """
+        새 실행 시작 (기존 체크포인트는 삭제)
+
+        첫 배치 요청 전에 Changelist 정보와 상태를 기록하므로, 배치 계획이 끝나기 전에
+        중단되어도 그때까지 요청한 배치는 재개 시 다시 요청하지 않음
+        """
+        self.discard()
+        write_json_atomic(self.run_dir / "changelist.json", changelist_to_dict(changelist_info))
+        write_json_atomic(self.run_dir / "state.json", {
+            "created": time.time(),
+            "complete": False,
+            "incremental": incremental
+        })
+
+    def add_batch(self, batch_number: int, batch: List[FileChange]) -> None:
+        """배치 계획 추가 (배치 요청 전에 기록)"""
+        write_json_atomic(self.run_dir / f"plan_{batch_number:04d}.json", [asdict(f) for f in batch])
+
+    def save_plan(self, changelist_info: ChangelistInfo, batches: List[List[FileChange]]) -> None:
+        """
+        배치 계획 완료 기록 (이미 저장된 배치 응답은 유지)
+
+        diff가 채워진 Changelist 정보와 전체 배치 계획을 다시 기록
+        (계획 후 추가된 shared_paths 포함)
+        """
+        state = read_json(self.run_dir / "state.json") or {}
+        write_json_atomic(self.run_dir / "changelist.json", changelist_to_dict(changelist_info))
+        for i, batch in enumerate(batches, 1):
+            self.add_batch(i, batch)
+        # state.json은 마지막에 기록 (앞선 파일이 모두 저장된 경우에만 완료로 취급)
+        write_json_atomic(self.run_dir / "state.json", {
+            "created": state.get("created", time.time()),
+            "complete": True,
+            "incremental": state.get("incremental", False),
+            "total_batches": len(batches)
+        })
+
+    def is_incremental(self) -> bool:
+        """incremental 모드로 시작한 실행인지 확인"""
+        state = read_json(self.run_dir / "state.json")
+        return bool(state and state.get("incremental"))
+
+    def save_batch(self, batch_number: int, response: Dict[str, Any]) -> None:
+        """완료된 배치 응답 저장"""
+        write_json_atomic(self.run_dir / f"batch_{batch_number:04d}.json", response)
+
+    def save_assets(self, assets: List[Dict[str, Any]]) -> None:
+        """에셋 변경 요약 저장"""
+        write_json_atomic(self.run_dir / "assets.json", assets)
+
+    def load_assets(self) -> Optional[List[Dict[str, Any]]]:
+        """에셋 변경 요약 로드 (없으면 None)"""
+        return read_json(self.run_dir / "assets.json")
+
+    def save_reused(self, reused: List[Dict[str, Any]]) -> None:
+        """재사용한 hunk 코멘트 저장"""
+        write_json_atomic(self.run_dir / "reused.json", reused)
+
+    def load_reused(self) -> Optional[List[Dict[str, Any]]]:
+        """재사용한 hunk 코멘트 로드 (없으면 None)"""
+        return read_json(self.run_dir / "reused.json")
+
+    def save_carried(self, carried: Dict[str, List[Dict[str, Any]]]) -> None:
+        """incremental 모드에서 이어 쓴 코멘트 저장"""
+        write_json_atomic(self.run_dir / "carried.json", carried)
+
+    def load_carried(self) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+        """incremental 모드에서 이어 쓴 코멘트 로드 (없으면 None)"""
+        return read_json(self.run_dir / "carried.json")
+
+    def load(
+        self
+    ) -> Optional[Tuple[ChangelistInfo, List[List[FileChange]], List[Optional[Dict[str, Any]]], bool]]:
+        """
+        체크포인트 로드
+
+        Returns:
+            (Changelist 정보, 배치 목록, 배치별 응답 - 미완료는 None, 배치 계획 완료 여부),
+            없거나 손상되었으면 None.
+            계획이 완료되지 않았으면 배치 목록은 중단 전까지 요청한 배치만 포함하고,
+            Changelist 정보에는 diff가 없음
+        """
+        state = read_json(self.run_dir / "state.json")
+        changelist_data = read_json(self.run_dir / "changelist.json")
+        if not isinstance(state, dict) or changelist_data is None:
+            return None
+
+        batches_data: List[Any] = []
+        while True:
+            batch_data = read_json(self.run_dir / f"plan_{len(batches_data) + 1:04d}.json")
+            if batch_data is None:
+                break
+            batches_data.append(batch_data)
+
+        complete = bool(state.get("complete"))
+        if complete and len(batches_data) != state.get("total_batches"):
+            return None
+
+        try:
+            changelist_info = changelist_from_dict(changelist_data)
+            batches = [[FileChange(**f) for f in batch] for batch in batches_data]
+        except TypeError:
+            return None
+
+        batch_results: List[Optional[Dict[str, Any]]] = [
+            read_json(self.run_dir / f"batch_{i:04d}.json")
+            for i in range(1, len(batches) + 1)
+        ]
+        return changelist_info, batches, batch_results, complete
+
+    def discard(self) -> None:
+        """체크포인트 삭제"""
+        shutil.rmtree(self.run_dir, ignore_errors=True)
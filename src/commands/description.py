@@ -3,10 +3,17 @@ AI Description 생성 명령
 Changelist의 diff를 분석하여 커밋 메시지 자동 생성
 """
 import re
-from typing import Callable, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from typing import Any, Callable, Dict, List, Optional
 
-from ..p4_client import P4Client, P4Error
+from ..config_manager import get_config
+from ..p4_client import FETCH_DESCRIPTION, FetchProfile, P4Client, P4Error, ChangelistInfo, FileChange
 from ..n8n_client import N8NClient, N8NError
+from ..path_filter import PathFilter, describe_excluded
+from ..batch_planner import BatchPlanner, estimate_tokens
+from ..changelist_snapshot import fill_changelist_diffs
 
 
 # 접두사 패턴: 대괄호로 감싸진 텍스트가 연속으로 나오는 부분
@@ -41,10 +48,12 @@ class DescriptionGenerator:
         port: str = "",
         user: str = "",
         client: str = "",
-        webhook_url: str = ""
+        webhook_url: str = "",
+        use_cache: bool = True
     ):
         self.p4 = P4Client(port=port, user=user, client=client)
-        self.n8n = N8NClient(webhook_url=webhook_url) if webhook_url else N8NClient()
+        self.n8n = N8NClient(webhook_url=webhook_url or None, use_cache=use_cache)
+        self.use_cache = use_cache
 
     def generate(
         self,
@@ -66,6 +75,8 @@ class DescriptionGenerator:
                 "description": str,  # 생성된 description
                 "summary": str,      # 요약
                 "applied": bool,     # 적용 여부
+                "excluded": int,     # 경로 필터로 제외한 파일 수
+                "batches": int,      # 나누어 요약한 배치 수 (한 번에 요청했으면 1)
                 "error": str         # 에러 메시지 (실패 시)
             }
         """
@@ -74,6 +85,8 @@ class DescriptionGenerator:
             "description": "",
             "summary": "",
             "applied": False,
+            "excluded": 0,
+            "batches": 0,
             "error": ""
         }
 
@@ -82,17 +95,37 @@ class DescriptionGenerator:
             if progress_callback:
                 progress_callback("Changelist 정보 수집 중...")
 
-            changelist_info = self.p4.get_changelist_with_diff(changelist)
+            changelist_info = self.p4.get_changelist_info(changelist)
 
             if not changelist_info.files:
                 result["error"] = "변경된 파일이 없습니다."
                 return result
 
-            # Step 2: n8n으로 AI 요청
-            if progress_callback:
-                progress_callback("AI Description 생성 중...")
+            # 제외 규칙에 해당하지 않는 파일만 diff 수집
+            kept, excluded = PathFilter.from_config().split(changelist_info.files)
+            result["excluded"] = len(excluded)
+            if not kept:
+                result["error"] = f"분석할 파일이 없습니다. {describe_excluded(excluded)}"
+                return result
+            if excluded:
+                changelist_info = replace(changelist_info, files=kept)
+                if progress_callback:
+                    progress_callback(describe_excluded(excluded))
 
-            response = self.n8n.request_description(changelist_info)
+            # 요청에 보내는 변경사항 diff만 수집 (전체 소스 diff_full은 수집하지 않음)
+            # 직전 리뷰/description이 수집한 파일은 스냅샷 사용
+            files = fill_changelist_diffs(self.p4, changelist_info, self._fetch_profile(), self.use_cache)
+            changelist_info = replace(changelist_info, files=files)
+
+            # Step 2: n8n으로 AI 요청 (한 요청에 들어가지 않으면 배치별 요약 후 병합)
+            batches = self._plan_batches(changelist_info)
+            result["batches"] = len(batches)
+            if len(batches) > 1:
+                response = self._request_map_reduce(changelist_info, batches, progress_callback)
+            else:
+                if progress_callback:
+                    progress_callback("AI Description 생성 중...")
+                response = self.n8n.request_description(changelist_info)
 
             ai_description = response.get("description", "")
             summary = response.get("summary", "")
@@ -130,6 +163,77 @@ class DescriptionGenerator:
 
         return result
 
+    @staticmethod
+    def _fetch_profile() -> FetchProfile:
+        """Description용 diff 수집 범위 (설정 크기를 넘는 diff는 통계 요약)"""
+        summarize_kb = float(get_config().description_fetch.get("summarize_over_kb", 256))
+        return replace(FETCH_DESCRIPTION, summarize_over=int(summarize_kb * 1024))
+
+    def _plan_batches(self, changelist_info: ChangelistInfo) -> List[List[FileChange]]:
+        """한 요청의 토큰/파일 수 한도로 파일을 배치로 분할 (map-reduce를 끄면 배치 하나)"""
+        if not get_config().description_map_reduce.get("enabled", True):
+            return [changelist_info.files]
+        planner = BatchPlanner(
+            base_tokens=estimate_tokens(self.n8n._get_expert_context("description"))
+            + estimate_tokens(changelist_info.description)
+        )
+        return planner.plan(changelist_info.files)
+
+    def _request_map_reduce(
+        self,
+        changelist_info: ChangelistInfo,
+        batches: List[List[FileChange]],
+        progress_callback: Optional[Callable[[str], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        대용량 CL description 생성
+
+        배치별 변경 요약을 병렬로 요청(map)한 뒤, 요약들을 합쳐 CL 전체의 커밋 메시지를
+        요청(reduce). reduce 요청에는 diff 없이 파일 경로만 보냄
+
+        Raises:
+            N8NError: 배치 요약 또는 병합 요청 실패
+        """
+        total = len(batches)
+        max_parallel = max(int(get_config().description_map_reduce.get("max_parallel", 3)), 1)
+        finished = [0]
+        lock = threading.Lock()
+
+        if progress_callback:
+            progress_callback(f"AI Description 생성 중 ({total}개 배치로 나누어 요약)...")
+
+        def summarize(index: int, files: List[FileChange]) -> Dict[str, Any]:
+            response = self.n8n.request_description(
+                replace(changelist_info, files=files), {"current": index + 1, "total": total}
+            )
+            with lock:
+                finished[0] += 1
+                message = f"AI Description 생성 중 (배치 요약 {finished[0]}/{total} 완료)..."
+            if progress_callback:
+                progress_callback(message)
+            return response
+
+        with ThreadPoolExecutor(max_workers=min(max_parallel, total)) as executor:
+            responses = list(executor.map(summarize, range(total), batches))
+
+        partials = []
+        for files, response in zip(batches, responses):
+            text = response.get("description", "") or response.get("summary", "")
+            if text:
+                # 분할 전송된 대용량 파일은 경로를 한 번만 표시
+                paths = list(dict.fromkeys(f.depot_path for f in files))
+                partials.append({"files": paths, "description": text})
+        if not partials:
+            raise N8NError("배치별 요약을 생성하지 못했습니다.")
+
+        if progress_callback:
+            progress_callback("배치별 요약 병합 중...")
+        overview = replace(changelist_info, files=[
+            FileChange(depot_path=f.depot_path, action=f.action, file_type=f.file_type, revision=f.revision)
+            for f in changelist_info.files
+        ])
+        return self.n8n.request_description(overview, partial_descriptions=partials)
+
 
 def run_description_command(
     changelist: int,
@@ -138,6 +242,7 @@ def run_description_command(
     client: str = "",
     webhook_url: str = "",
     auto_apply: bool = True,
+    use_cache: bool = True,
     progress_callback: Optional[Callable[[str], None]] = None
 ) -> dict:
     """Description 생성 명령 실행 헬퍼 함수"""
@@ -145,7 +250,8 @@ def run_description_command(
         port=port,
         user=user,
         client=client,
-        webhook_url=webhook_url
+        webhook_url=webhook_url,
+        use_cache=use_cache
     )
     return generator.generate(
         changelist=changelist,
@@ -2,16 +2,46 @@
 AI 코드 리뷰 명령
 Changelist의 diff를 분석하여 코드 리뷰 수행
 """
-from dataclasses import dataclass, field
-from typing import Callable, Optional, List, Dict, Any
+import math
+import queue
+import random
+import threading
+import time
+from collections import Counter
+from dataclasses import asdict, dataclass, field, replace
+from typing import Callable, Optional, List, Dict, Any, Iterator, Set, Tuple
 
+from ..config_manager import get_config
 from ..p4_client import P4Client, P4Error, ChangelistInfo, FileChange
 from ..n8n_client import N8NClient, N8NError
+from ..batch_planner import (
+    BatchPlanner,
+    StreamingBatchPlanner,
+    drop_line_ranges,
+    estimate_tokens,
+    estimate_file_tokens,
+    split_file_change,
+    trim_diff_context
+)
+from ..checkpoint import ReviewCheckpoint
+from ..risk_scorer import RiskScorer
+from ..payload_compactor import CompactionReport
+from ..path_filter import PathFilter, describe_excluded
+from ..asset_summary import AssetSummary, build_asset_summary, split_assets
+from ..context_extractor import detect_language, expand_diff_context
+from ..diff_digest import diff_digest
+from ..hunk_store import HunkStore, ReusedComments, review_scope
+from ..review_history import ReviewHistory
+from ..profile_router import ProfileRouter
+from ..changelist_snapshot import iter_changelist_diffs
 
 
-# 배치 분할 임계값 (Gemini 2.5 Flash 기준)
-MAX_FILES_PER_BATCH = 50
-MAX_LINES_PER_BATCH = 5000
+# 마감 모드에서 diff 수집에 쓸 수 있는 시간 비율 (나머지는 리뷰 요청용)
+DEADLINE_COLLECT_SHARE = 0.4
+# 마감 모드에서 지연 시간 예측 오차를 고려해 남은 시간 중 사용할 비율
+DEADLINE_SAFETY = 0.8
+# 남은 시간이 이보다 짧으면 새 배치를 요청하지 않음 (초)
+DEADLINE_MIN_REQUEST_SECONDS = 2.0
 
 
 @dataclass
@@ -25,6 +55,37 @@ class ReviewComment:
     suggestion: str = ""
 
 
+@dataclass
+class CoverageReport:
+    """마감 모드 리뷰 범위 보고"""
+    deadline: float                 # 마감 시간 (초)
+    elapsed: float = 0.0            # 실제 소요 시간 (초)
+    total_files: int = 0
+    reviewed_files: List[str] = field(default_factory=list)
+    # 리뷰했지만 context를 줄였거나 일부 hunk만 보낸 파일
+    reduced_files: List[str] = field(default_factory=list)
+    # 리뷰하지 못한 파일 depot_path -> 사유
+    skipped_files: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def ratio(self) -> float:
+        """리뷰한 파일 비율 (0~1)"""
+        return len(self.reviewed_files) / self.total_files if self.total_files else 0.0
+
+    def describe(self) -> str:
+        """한 줄 요약 텍스트"""
+        text = (
+            f"마감 {self.deadline:.0f}초 모드 ({self.elapsed:.1f}초 소요): "
+            f"전체 {self.total_files}개 파일 중 {len(self.reviewed_files)}개 리뷰"
+        )
+        if self.reduced_files:
+            text += f" (축소 리뷰 {len(self.reduced_files)}개)"
+        if self.skipped_files:
+            reasons = Counter(reason.split(":")[0] for reason in self.skipped_files.values())
+            text += ", 제외: " + ", ".join(f"{reason} {count}개" for reason, count in reasons.items())
+        return text
+
+
 @dataclass
 class ReviewResult:
     """코드 리뷰 결과"""
@@ -40,6 +101,87 @@ class ReviewResult:
     })
     error: str = ""
     files: List[FileChange] = field(default_factory=list)  # diff 데이터 포함
+    # 실패한 배치 번호(1부터) -> 오류 메시지 (부분 결과인 경우)
+    failed_batches: Dict[int, str] = field(default_factory=dict)
+    # 실패 배치 재시도용 실행 상태
+    changelist_info: Optional[ChangelistInfo] = None
+    batches: List[List[FileChange]] = field(default_factory=list)
+    batch_results: List[Optional[Dict[str, Any]]] = field(default_factory=list)
+    # 마감 모드(--deadline)로 실행한 경우의 리뷰 범위
+    coverage: Optional[CoverageReport] = None
+    # 이번 실행에서 보낸 요청들의 페이로드 압축 결과 (누적)
+    compaction: Optional[CompactionReport] = None
+    # 경로 필터로 제외한 파일 depot_path -> 일치한 규칙
+    excluded_files: Dict[str, str] = field(default_factory=dict)
+    # diff 대신 요약으로 보낸 에셋 변경
+    asset_summary: Optional[AssetSummary] = None
+    # 이전 리뷰에서 본 hunk라 전송하지 않고 저장된 코멘트를 붙인 파일
+    reused: List[ReusedComments] = field(default_factory=list)
+    # incremental 모드에서 바뀌지 않아 이전 코멘트를 이어 쓴 파일 depot_path -> 코멘트
+    carried: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
+
+    @property
+    def partial(self) -> bool:
+        """일부 배치가 실패하여 성공한 배치 결과만 포함하는지 여부"""
+        return bool(self.failed_batches)
+
+    @property
+    def shared_files(self) -> Dict[str, str]:
+        """diff가 같아 전송하지 않은 파일 depot_path -> 대신 전송된 파일 depot_path"""
+        return {
+            path: f.depot_path
+            for batch in self.batches for f in batch for path in f.shared_paths
+        }
+
+
+class _EtaEstimator:
+    """지연 시간 모델로 배치 리뷰 진행률과 남은 시간(ETA) 계산"""
+
+    def __init__(
+        self,
+        n8n: N8NClient,
+        base_tokens: int,
+        callback: Optional[Callable[[float, Optional[float]], None]] = None
+    ):
+        self.n8n = n8n
+        self.base_tokens = base_tokens
+        self.callback = callback
+
+    def batch_tokens(self, files: List[FileChange]) -> int:
+        """배치 페이로드의 토큰 수 추정"""
+        return self.base_tokens + sum(estimate_file_tokens(f) for f in files)
+
+    def split_tokens(self, file_tokens: int, file_budget: int) -> List[int]:
+        """아직 배치로 묶이지 않은 파일 토큰을 예상 배치별 토큰 목록으로 변환"""
+        if file_tokens <= 0:
+            return []
+        count = math.ceil(file_tokens / max(file_budget, 1))
+        return [self.base_tokens + file_tokens // count] * count
+
+    def report(self, done: List[int], remaining: List[int]) -> None:
+        """
+        진행률/ETA 콜백 호출
+
+        Args:
+            done: 완료된 배치별 토큰 수
+            remaining: 남은(진행 중 포함) 배치별 토큰 수
+        """
+        if not self.callback:
+            return
+
+        model = self.n8n.latency_model
+        done_seconds = [model.predict(t, "review") for t in done]
+        remaining_seconds = [model.predict(t, "review") for t in remaining]
+
+        if None in done_seconds or None in remaining_seconds:
+            # 기록이 부족하면 토큰 비율로 진행률만 표시
+            total = sum(done) + sum(remaining)
+            self.callback(sum(done) / total if total else 0.0, None)
+            return
+
+        elapsed, left = sum(done_seconds), sum(remaining_seconds)
+        total = elapsed + left
+        self.callback(elapsed / total if total else 0.0, left)
 
 
 class ReviewGenerator:
@@ -50,15 +192,35 @@ class ReviewGenerator:
         port: str = "",
         user: str = "",
         client: str = "",
-        webhook_url: str = ""
+        webhook_url: str = "",
+        use_cache: bool = True
     ):
         self.p4 = P4Client(port=port, user=user, client=client)
-        self.n8n = N8NClient(webhook_url=webhook_url) if webhook_url else N8NClient()
+        self.n8n = N8NClient(webhook_url=webhook_url or None, use_cache=use_cache)
+        self.use_cache = use_cache
+        # diff 없이 첫 배치에 요약으로 함께 보내는 에셋 변경
+        self.asset_summary: Optional[AssetSummary] = None
+        # 파일 종류별 전문가 프로필 (배치마다 한 프로필의 파일만 묶음)
+        self.router = ProfileRouter.from_config("review")
+        routing = self.router.signature("review")
+        # 이전에 리뷰한 hunk의 코멘트 저장소 (use_cache=False면 사용하지 않음)
+        expert_context = self.n8n._get_expert_context("review")
+        self.hunk_store = HunkStore.from_config(expert_context, routing) if use_cache else None
+        self.reused: List[ReusedComments] = []
+        # 리뷰 이력 (incremental 모드에서 바뀌지 않은 파일의 이전 코멘트를 이어 씀)
+        self.scope = review_scope(get_config().expert_profile, expert_context, routing)
+        self.history: Optional[ReviewHistory] = None
+        self.previous_run: Dict[str, Any] = {}
+        self.digests: Dict[str, str] = {}
+        self.carried: Dict[str, List[Dict[str, Any]]] = {}
 
     def generate(
         self,
         changelist: int,
-        progress_callback: Optional[Callable[[str], None]] = None
+        progress_callback: Optional[Callable[[str], None]] = None,
+        eta_callback: Optional[Callable[[float, Optional[float]], None]] = None,
+        deadline: Optional[float] = None,
+        incremental: bool = False
     ) -> ReviewResult:
         """
         AI 코드 리뷰 수행
@@ -68,52 +230,579 @@ class ReviewGenerator:
         Args:
             changelist: Changelist 번호
             progress_callback: 진행 상황 콜백 함수
+            eta_callback: 진행률(0~1)과 남은 시간(초, 추정 불가 시 None) 콜백 함수
+            deadline: 마감 시간 (초). 지정하면 위험도가 높은 파일부터 리뷰하고
+                마감 시각까지 완료된 결과만 반환 (result.coverage에 리뷰 범위 기록)
+            incremental: 이 Changelist의 마지막 리뷰 이후 diff가 바뀐 파일만 요청하고,
+                바뀌지 않은 파일은 이전 코멘트를 이어 씀 (result.carried에 기록)
 
         Returns:
             ReviewResult: 리뷰 결과
         """
         result = ReviewResult()
+        started = time.time()
 
         try:
-            # Step 1: Changelist 정보 수집
+            # Step 1: Changelist 기본 정보 수집 (p4 describe -s)
             if progress_callback:
                 progress_callback("Changelist 정보 수집 중...")
 
-            changelist_info = self.p4.get_changelist_with_diff(changelist)
+            changelist_info = self.p4.get_changelist_info(changelist)
 
             if not changelist_info.files:
                 result.error = "변경된 파일이 없습니다."
                 return result
 
-            # Step 2: 배치 분할
-            batches = self._split_into_batches(changelist_info.files)
-            total_batches = len(batches)
+            # 제외 규칙(생성 파일, 엔진 캐시 등)에 해당하는 파일은 diff를 수집하지 않음
+            kept, excluded = PathFilter.from_config().split(changelist_info.files)
+            result.excluded_files = excluded
+            if not kept:
+                result.error = f"리뷰할 파일이 없습니다. {describe_excluded(excluded)}"
+                return result
+            if excluded:
+                changelist_info = replace(changelist_info, files=kept)
+                if progress_callback:
+                    progress_callback(describe_excluded(excluded))
+
+            # 바이너리/직렬화 에셋은 diff를 받지 않고 종류별 요약으로 첫 배치에 포함
+            self.asset_summary = None
+            self.reused = []
+            self.digests = {}
+            self.carried = {}
+            # 마감 모드는 일부 파일만 리뷰하므로 이력을 남기지 않음
+            self.history = None if deadline else ReviewHistory.for_changelist(changelist, self.scope)
+            self.previous_run = self.history.load() if self.history and incremental else {}
+            fast_path = get_config().asset_fast_path
+            if fast_path.get("enabled", True):
+                code_files, asset_files = split_assets(changelist_info.files)
+                if asset_files:
+                    if progress_callback:
+                        progress_callback(f"에셋 {len(asset_files)}개 정보 수집 중...")
+                    sizes = self.p4.get_file_sizes(asset_files, changelist_info.status)
+                    self.asset_summary = build_asset_summary(asset_files, sizes)
+                    changelist_info = replace(changelist_info, files=code_files)
+
+            if not changelist_info.files:
+                # 에셋만 있는 CL은 요약 요청 하나로 처리
+                result = self._run_batches(changelist_info, [[]], [None], [1], progress_callback)
+            elif deadline:
+                result = self._review_with_deadline(
+                    changelist_info, started, started + deadline, progress_callback, eta_callback
+                )
+            else:
+                result = self._review_pipelined(
+                    changelist_info, progress_callback, eta_callback
+                )
+            result.excluded_files = excluded
+            result.asset_summary = self.asset_summary
+
+        except P4Error as e:
+            result.error = f"Perforce 오류: {str(e)}"
+        except N8NError as e:
+            result.error = f"AI 서비스 오류: {str(e)}"
+        except Exception as e:
+            result.error = f"예상치 못한 오류: {str(e)}"
+
+        return result
+
+    def _review_pipelined(
+        self,
+        changelist_info: ChangelistInfo,
+        progress_callback: Optional[Callable[[str], None]] = None,
+        eta_callback: Optional[Callable[[float, Optional[float]], None]] = None,
+        planned: Optional[Tuple[List[List[FileChange]], List[Optional[Dict[str, Any]]]]] = None
+    ) -> ReviewResult:
+        """
+        diff 수집과 배치 요청을 겹쳐 실행하고 체크포인트를 남기는 기본 리뷰 경로
+
+        체크포인트는 첫 요청 전에 시작하고 배치마다 요청 전에 계획을 추가하므로,
+        중간에 중단되어도 resume()으로 이어서 리뷰 가능
+
+        Args:
+            changelist_info: 리뷰할 Changelist 정보
+            progress_callback: 진행 상황 콜백 함수
+            eta_callback: 진행률(0~1)과 남은 시간(초) 콜백 함수
+            planned: 배치 계획 도중 중단된 실행의 (배치 목록, 배치별 응답).
+                지정하면 기존 체크포인트를 이어서 사용
+        """
+        checkpoint = ReviewCheckpoint.for_changelist(changelist_info.number)
+        if planned is None:
+            checkpoint.start(changelist_info, incremental=bool(self.previous_run))
+            if self.asset_summary:
+                checkpoint.save_assets(self.asset_summary.to_dict())
+
+        # Step 2~3: diff 수집 → 배치 구성 → 리뷰 요청 (파이프라인)
+        estimator = _EtaEstimator(self.n8n, self._base_tokens(changelist_info), eta_callback)
+        batches, batch_results, failed = self._run_pipeline(
+            changelist_info, progress_callback, checkpoint, estimator, planned
+        )
+
+        # diff가 채워진 Changelist 정보와 배치 계획을 완료로 기록
+        if self.reused:
+            checkpoint.save_reused([asdict(r) for r in self.reused])
+        if self.carried:
+            checkpoint.save_carried(self.carried)
+        checkpoint.save_plan(changelist_info, batches)
+
+        # Step 4: 결과 병합
+        return self._finalize(
+            changelist_info, batches, batch_results, failed, progress_callback, checkpoint
+        )
+
+    def _run_pipeline(
+        self,
+        changelist_info: ChangelistInfo,
+        progress_callback: Optional[Callable[[str], None]] = None,
+        checkpoint: Optional[ReviewCheckpoint] = None,
+        estimator: Optional[_EtaEstimator] = None,
+        planned: Optional[Tuple[List[List[FileChange]], List[Optional[Dict[str, Any]]]]] = None
+    ):
+        """
+        diff 수집(생산자 스레드)과 배치 리뷰 요청(소비자)을 겹쳐서 실행
+
+        수집된 FileChange는 스트리밍 배치 계획기로 전달되고, 가득 찬 배치는
+        나머지 파일의 diff 수집이 끝나기 전에 바로 요청됨.
+        배치 요청 자체는 Redis Memory 세션 순서를 유지하기 위해 순차 실행.
+        risk.prioritize 설정이 켜져 있으면 위험도가 높은 파일부터 수집하고 배치도 위험도 순으로
+        요청하므로, 중요한 코멘트가 먼저 도착하고 병합 결과에서도 앞쪽에 표시됨.
+        planned가 있으면 응답이 없는 배치를 먼저 요청하고, 이미 계획된 파일(분할 파일은 요청한 hunk)은
+        다시 배치에 넣지 않음
+
+        Returns:
+            (배치 목록, 배치별 응답 - 실패는 None, 실패한 배치 번호 -> 오류 메시지)
+        """
+        total_files = len(changelist_info.files)
+
+        # 위험도가 높은 파일부터 diff를 수집하고 배치도 위험도 순으로 요청
+        scorer = RiskScorer.from_config()
+        prioritize = get_config().risk.get("prioritize", True)
+        collect_info = (
+            replace(changelist_info, files=scorer.rank(changelist_info.files))
+            if prioritize else changelist_info
+        )
+
+        file_queue: "queue.Queue" = queue.Queue()
+        done = object()
+        status = {"collected": 0, "batch": ""}
+        status_lock = threading.Lock()
 
+        def report() -> None:
+            if not progress_callback:
+                return
+            with status_lock:
+                message = f"diff 수집 중 ({status['collected']}/{total_files})"
+                if status["batch"]:
+                    message = f"{status['batch']} · {message}"
+            progress_callback(message)
+
+        def produce() -> None:
+            try:
+                for file_change in self._iter_diffs(collect_info):
+                    file_queue.put(self._expand_context(file_change))
+            except Exception as e:
+                file_queue.put(e)
+            finally:
+                file_queue.put(done)
+
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+
+        planner = StreamingBatchPlanner(
+            base_tokens=self._base_tokens(changelist_info), group_key=self.router.route
+        )
+        batches: List[List[FileChange]] = list(planned[0]) if planned else []
+        batch_results: List[Optional[Dict[str, Any]]] = list(planned[1]) if planned else []
+        covered, partial = self._planned_coverage(batches)
+        failed: Dict[int, str] = {}
+        done_tokens: List[int] = []
+        collected_tokens = [0]
+        # 정규화 diff 다이제스트 -> 처음 수집된 파일 (같은 diff는 한 번만 전송)
+        unique: Dict[str, FileChange] = {}
+
+        def report_eta(upcoming: List[int]) -> None:
+            if not estimator:
+                return
+            # 아직 수집하지 않은 파일은 지금까지 수집한 파일의 평균 토큰 수로 추정
+            collected = status["collected"]
+            average = collected_tokens[0] / collected if collected else 0
+            future = planner.pending_tokens + int(average * (total_files - collected))
+            estimator.report(
+                done_tokens,
+                upcoming + estimator.split_tokens(future, planner.file_budget)
+            )
+
+        def send(number: int, total: int, upcoming: List[int]) -> None:
+            batch = batches[number - 1]
+            tokens = estimator.batch_tokens(batch) if estimator else 0
+            report_eta([tokens] + upcoming)
+            with status_lock:
+                status["batch"] = f"배치 {number} 리뷰 중" if not total else f"배치 {number}/{total} 리뷰 중"
             if progress_callback:
-                if total_batches > 1:
-                    progress_callback(f"총 {total_batches}개 배치로 리뷰 진행...")
+                progress_callback(f"{status['batch']}...")
+
+            # 전체 배치 수는 diff 수집이 끝나야 확정되므로 그 전에는 0(미정)으로 전송
+            batch_index_info = {"current": number, "total": total}
+            try:
+                response = self._review_batch_with_retry(
+                    batch, changelist_info, batch_index_info, progress_callback
+                )
+            except N8NError as e:
+                failed[number] = str(e)
+                return
+            finally:
+                done_tokens.append(tokens)
+                report_eta(upcoming)
+
+            batch_results[number - 1] = response
+            if checkpoint:
+                checkpoint.save_batch(number, response)
+
+        def dispatch(batch: List[FileChange], total: int, upcoming: List[int]) -> None:
+            # 요청 전에 계획을 기록해야 중단 후 재개 시 이 배치의 응답을 찾을 수 있음
+            batches.append(batch)
+            batch_results.append(None)
+            if checkpoint:
+                checkpoint.add_batch(len(batches), batch)
+            send(len(batches), total, upcoming)
+
+        # 중단된 실행에서 요청했지만 응답을 저장하지 못한 배치
+        for number, response in enumerate(list(batch_results), 1):
+            if response is None:
+                send(number, 0, [])
+
+        while True:
+            item = file_queue.get()
+            if item is done:
+                break
+            if isinstance(item, Exception):
+                raise item
+
+            with status_lock:
+                status["collected"] += 1
+            collected_tokens[0] += estimate_file_tokens(item)
+            report()
+            if self._carry_over(item) or item.depot_path in covered:
+                continue
+            if item.depot_path in partial:
+                # 분할 전송 도중 중단된 파일은 요청하지 않은 hunk만 (이미 받은 hunk는 저장소에도 기록됨)
+                item = drop_line_ranges(item, partial[item.depot_path])
+            elif self._dedupe(item, unique):
+                continue
+            else:
+                reused_count = len(self.reused)
+                item = self._reuse_hunks(item)
+                if checkpoint and len(self.reused) != reused_count:
+                    checkpoint.save_reused([asdict(r) for r in self.reused])
+            if item is None:
+                continue
+
+            ready = planner.add(item)
+            if prioritize:
+                ready.sort(key=scorer.batch_score, reverse=True)
+            for batch in ready:
+                dispatch(batch, 0, [])
+
+        remaining = planner.flush()
+        if prioritize:
+            remaining.sort(key=scorer.batch_score, reverse=True)
+        total_batches = len(batches) + len(remaining)
+        for k, batch in enumerate(remaining):
+            upcoming = [estimator.batch_tokens(b) for b in remaining[k + 1:]] if estimator else []
+            dispatch(batch, total_batches, upcoming)
+
+        return batches, batch_results, failed
+
+    @staticmethod
+    def _planned_coverage(
+        batches: List[List[FileChange]]
+    ) -> Tuple[Set[str], Dict[str, List[Tuple[int, int]]]]:
+        """
+        배치 계획에 이미 포함된 파일
+
+        Returns:
+            (모두 계획된 파일 경로, 일부 부분만 계획된 분할 파일 경로 -> 계획된 라인 범위 목록)
+        """
+        covered: Set[str] = set()
+        parts: Dict[str, List[Dict[str, int]]] = {}
+        for batch in batches:
+            for f in batch:
+                covered.update(f.shared_paths)
+                if f.part_info:
+                    parts.setdefault(f.depot_path, []).append(f.part_info)
                 else:
-                    progress_callback("AI 코드 리뷰 중...")
+                    covered.add(f.depot_path)
+
+        partial: Dict[str, List[Tuple[int, int]]] = {}
+        for path, infos in parts.items():
+            indexes = {info.get("index") for info in infos}
+            if all(len(indexes) >= info.get("total", 0) for info in infos):
+                covered.add(path)
+            elif path not in covered:
+                partial[path] = [(info.get("line_start", 0), info.get("line_end", 0)) for info in infos]
+        return covered, partial
 
-            # Step 3: 배치별 리뷰 요청
-            batch_results = []
-            for i, batch_files in enumerate(batches, 1):
-                if progress_callback and total_batches > 1:
-                    progress_callback(f"배치 {i}/{total_batches} 리뷰 중...")
+    def _review_with_deadline(
+        self,
+        changelist_info: ChangelistInfo,
+        started: float,
+        deadline_at: float,
+        progress_callback: Optional[Callable[[str], None]] = None,
+        eta_callback: Optional[Callable[[float, Optional[float]], None]] = None
+    ) -> ReviewResult:
+        """
+        마감 시각 안에 위험도가 높은 파일부터 리뷰
 
-                # 배치 인덱스 정보 (Redis Memory 세션 컨텍스트용)
-                batch_index_info = {"current": i, "total": total_batches}
-                batch_result = self._review_batch(batch_files, changelist_info, batch_index_info)
-                batch_results.append(batch_result)
+        1. 에셋/바이너리/삭제 등 저가치 파일은 제외하고, 메타데이터 기준 위험도 순으로 diff 수집
+           (마감 시간의 일부만 사용)
+        2. 변경 규모까지 반영해 다시 정렬한 뒤, 지연 시간 모델로 남은 시간 안에 응답받을 수 있는
+           크기만큼 배치를 구성하여 순차 요청. 예산이 부족하면 diff context를 줄이거나
+           파일의 앞부분 hunk만 전송
+        3. 마감 시각까지 완료된 배치 결과만 병합하고 리뷰 범위를 CoverageReport로 기록
 
-            # Step 4: 결과 병합
-            if progress_callback:
-                progress_callback("리뷰 결과 처리 중...")
+        마감 모드는 체크포인트를 남기지 않으며, 배치 재시도 대기 없이 한 번씩만 요청
+
+        Returns:
+            ReviewResult: 리뷰 결과 (coverage 포함)
+
+        Raises:
+            P4Error: diff 수집 실패
+        """
+        scorer = RiskScorer.from_config()
+        coverage = CoverageReport(deadline=deadline_at - started, total_files=len(changelist_info.files))
 
-            result = self._merge_results(batch_results)
-            result.success = True
-            result.files = changelist_info.files  # diff 데이터 포함
+        def report_time() -> None:
+            if eta_callback:
+                now = time.time()
+                eta_callback(min((now - started) / coverage.deadline, 1.0), max(deadline_at - now, 0.0))
 
+        # Step 1: 저가치 파일 제외 후 위험도 순서로 diff 수집
+        candidates: List[FileChange] = []
+        for f in changelist_info.files:
+            if scorer.is_low_value(f):
+                coverage.skipped_files[f.depot_path] = "저가치 파일 (에셋/삭제/외부 코드)"
+            else:
+                candidates.append(f)
+        ordered = scorer.rank(candidates)
+
+        collect_until = started + coverage.deadline * DEADLINE_COLLECT_SHARE
+        collected: List[FileChange] = []
+        if ordered:
+            for file_change in self._iter_diffs(replace(changelist_info, files=ordered)):
+                collected.append(file_change)
+                if progress_callback:
+                    progress_callback(f"diff 수집 중 ({len(collected)}/{len(ordered)})...")
+                report_time()
+                if time.time() >= collect_until:
+                    break
+        for f in ordered[len(collected):]:
+            coverage.skipped_files[f.depot_path] = "시간 부족: diff 미수집"
+
+        # Step 2: 변경 규모 반영 후 남은 시간에 맞춰 배치 구성/요청
+        unique: Dict[str, FileChange] = {}
+        to_send: List[FileChange] = []
+        for f in collected:
+            if self._carry_over(f) or self._dedupe(f, unique):
+                continue
+            sent = self._reuse_hunks(f)
+            if sent is not None:
+                to_send.append(sent)
+        pending = scorer.rank(to_send)
+        planner = BatchPlanner(base_tokens=self._base_tokens(changelist_info), group_key=self.router.route)
+        batches: List[List[FileChange]] = []
+        batch_results: List[Optional[Dict[str, Any]]] = []
+        failed: Dict[int, str] = {}
+        reduced: set = set()
+
+        self.n8n.deadline = deadline_at
+        try:
+            while pending:
+                remaining = deadline_at - time.time()
+                if remaining < DEADLINE_MIN_REQUEST_SECONDS:
+                    break
+
+                budget = planner.file_budget
+                model_budget = self.n8n.latency_model.tokens_within(remaining * DEADLINE_SAFETY, "review")
+                if model_budget is not None:
+                    budget = min(budget, model_budget - planner.base_tokens)
+                if budget <= 0:
+                    break
+
+                batch, pending, trimmed = self._take_deadline_batch(
+                    pending, budget, planner.max_files, self.router.route
+                )
+                if not batch:
+                    break
+                reduced.update(trimmed)
+
+                batches.append(batch)
+                number = len(batches)
+                if progress_callback:
+                    progress_callback(f"배치 {number} 리뷰 중 (남은 시간 {remaining:.0f}초)...")
+                try:
+                    response = self._review_batch(
+                        batch, changelist_info, {"current": number, "total": 0}
+                    )
+                except N8NError as e:
+                    batch_results.append(None)
+                    failed[number] = str(e)
+                    continue
+                finally:
+                    report_time()
+                batch_results.append(response)
+        finally:
+            self.n8n.deadline = None
+
+        # Step 3: 리뷰 범위 정리
+        reviewed = {
+            path
+            for batch, response in zip(batches, batch_results) if response is not None
+            for f in batch
+            for path in [f.depot_path, *f.shared_paths]
+        }
+        unfinished = {
+            path: "시간 부족: 리뷰 미요청"
+            for f in pending for path in [f.depot_path, *f.shared_paths]
+        }
+        for number, error in failed.items():
+            for f in batches[number - 1]:
+                for path in [f.depot_path, *f.shared_paths]:
+                    unfinished.setdefault(path, f"리뷰 실패: {error}")
+
+        for f in collected:
+            path = f.depot_path
+            if path in reviewed:
+                if path not in coverage.reviewed_files:
+                    coverage.reviewed_files.append(path)
+                if path in reduced or path in unfinished:
+                    coverage.reduced_files.append(path)
+            elif path in unfinished:
+                coverage.skipped_files[path] = unfinished[path]
+        coverage.elapsed = time.time() - started
+
+        if not reviewed:
+            result = ReviewResult(error=f"마감 시간 내에 리뷰를 완료한 파일이 없습니다. {coverage.describe()}")
+            result.coverage = coverage
+            return result
+
+        result = self._finalize(changelist_info, batches, batch_results, failed, progress_callback)
+        result.coverage = coverage
+        result.summary = f"[{coverage.describe()}] {result.summary}"
+        return result
+
+    @staticmethod
+    def _take_deadline_batch(
+        files: List[FileChange],
+        budget: int,
+        max_files: int,
+        group_key: Optional[Callable[[str], str]] = None
+    ):
+        """
+        위험도 순서를 유지하며 토큰 예산 안에 들어가는 파일로 배치 구성
+
+        그대로 넣을 수 없는 파일은 diff context를 0줄로 줄여서 시도하고,
+        빈 배치에도 들어가지 않는 큰 파일은 hunk 단위로 분할해 앞부분만 포함.
+        group_key가 있으면 첫 파일과 키(전문가 프로필)가 같은 파일만 포함
+
+        Returns:
+            (배치, 남은 파일 목록, context를 줄인 파일 경로 목록)
+        """
+        batch: List[FileChange] = []
+        rest: List[FileChange] = []
+        trimmed_paths: List[str] = []
+        used = 0
+
+        for f in files:
+            if len(batch) >= max_files or (
+                batch and group_key and group_key(f.depot_path) != group_key(batch[0].depot_path)
+            ):
+                rest.append(f)
+                continue
+
+            tokens = estimate_file_tokens(f)
+            if used + tokens > budget:
+                trimmed = replace(f, diff=trim_diff_context(f.diff, 0))
+                tokens = estimate_file_tokens(trimmed)
+                if used + tokens <= budget:
+                    f = trimmed
+                elif not batch:
+                    parts = split_file_change(trimmed, budget)
+                    f, tokens = parts[0], estimate_file_tokens(parts[0])
+                    rest.extend(parts[1:])
+                    if tokens > budget:
+                        rest.append(f)
+                        continue
+                else:
+                    rest.append(f)
+                    continue
+                trimmed_paths.append(f.depot_path)
+
+            batch.append(f)
+            used += tokens
+
+        return batch, rest, trimmed_paths
+
+    def resume(
+        self,
+        changelist: int,
+        progress_callback: Optional[Callable[[str], None]] = None,
+        eta_callback: Optional[Callable[[float, Optional[float]], None]] = None
+    ) -> ReviewResult:
+        """
+        중단된 리뷰를 체크포인트에서 재개
+
+        저장된 Changelist 데이터와 배치 계획을 그대로 사용하고,
+        완료되지 않은 배치만 요청. 배치 계획 도중 중단된 실행이면 계획된 배치를 이어서 요청하고
+        나머지 파일은 diff를 다시 수집해 배치로 구성. 체크포인트가 없으면 새로 리뷰 수행
+
+        Args:
+            changelist: Changelist 번호
+            progress_callback: 진행 상황 콜백 함수
+            eta_callback: 진행률(0~1)과 남은 시간(초) 콜백 함수
+
+        Returns:
+            ReviewResult: 리뷰 결과
+        """
+        checkpoint = ReviewCheckpoint.for_changelist(changelist)
+        loaded = checkpoint.load() if checkpoint.exists() else None
+        if loaded is None:
+            return self.generate(changelist, progress_callback, eta_callback)
+
+        changelist_info, batches, batch_results, complete = loaded
+        pending = [i for i, r in enumerate(batch_results, 1) if r is None]
+        assets = checkpoint.load_assets()
+        self.asset_summary = AssetSummary.from_dict(assets) if assets else None
+        self.reused = [ReusedComments(**r) for r in checkpoint.load_reused() or []]
+        self.carried = checkpoint.load_carried() or {}
+        self.digests = {}
+        # 체크포인트는 마감 모드가 아닌 실행만 남기므로 완료되면 이력 저장
+        self.history = ReviewHistory.for_changelist(changelist, self.scope)
+
+        result = ReviewResult()
+        try:
+            if progress_callback:
+                progress_callback(
+                    f"이전 리뷰 재개: {len(batches)}개 배치 중 {len(batches) - len(pending)}개 완료됨"
+                )
+            if complete:
+                result = self._run_batches(
+                    changelist_info,
+                    batches,
+                    batch_results,
+                    pending,
+                    progress_callback,
+                    checkpoint,
+                    _EtaEstimator(self.n8n, self._base_tokens(changelist_info), eta_callback)
+                )
+            else:
+                # 계획되지 않은 파일의 이전 코멘트/재사용 hunk는 다시 수집하면서 새로 판단
+                self.previous_run = self.history.load() if checkpoint.is_incremental() else {}
+                self.carried = {}
+                covered, partial = self._planned_coverage(batches)
+                self.reused = [r for r in self.reused if r.depot_path in covered or r.depot_path in partial]
+                result = self._review_pipelined(
+                    changelist_info, progress_callback, eta_callback, planned=(batches, batch_results)
+                )
+            result.asset_summary = self.asset_summary
         except P4Error as e:
             result.error = f"Perforce 오류: {str(e)}"
         except N8NError as e:
@@ -123,46 +812,344 @@ class ReviewGenerator:
 
         return result
 
-    def _split_into_batches(self, files: List[FileChange]) -> List[List[FileChange]]:
+    def retry_failed(
+        self,
+        previous: ReviewResult,
+        progress_callback: Optional[Callable[[str], None]] = None,
+        eta_callback: Optional[Callable[[float, Optional[float]], None]] = None
+    ) -> ReviewResult:
         """
-        파일 목록을 배치로 분할
+        부분 결과에서 실패한 배치만 다시 요청
+
+        성공한 배치 결과는 재사용하므로 LLM 호출은 실패한 배치 수만큼만 발생
 
         Args:
-            files: 파일 목록
+            previous: 이전 generate()/retry_failed() 결과 (partial=True)
+            progress_callback: 진행 상황 콜백 함수
+            eta_callback: 진행률(0~1)과 남은 시간(초) 콜백 함수
 
         Returns:
-            배치로 분할된 파일 목록
+            ReviewResult: 다시 병합된 리뷰 결과
         """
-        total_files = len(files)
-        total_lines = sum(len(f.diff.split('\n')) if f.diff else 0 for f in files)
+        if not previous.partial or previous.changelist_info is None:
+            return previous
 
-        # 분할이 필요 없는 경우
-        if total_files <= MAX_FILES_PER_BATCH and total_lines <= MAX_LINES_PER_BATCH:
-            return [files]
+        self.asset_summary = previous.asset_summary
+        self.reused = previous.reused
+        self.carried = previous.carried
+        self.digests = {}
+        # 마감 모드 결과는 일부 파일만 리뷰했으므로 이력을 남기지 않음
+        self.history = (
+            None if previous.coverage
+            else ReviewHistory.for_changelist(previous.changelist_info.number, self.scope)
+        )
+        result = ReviewResult()
+        try:
+            result = self._run_batches(
+                previous.changelist_info,
+                previous.batches,
+                list(previous.batch_results),
+                sorted(previous.failed_batches),
+                progress_callback,
+                ReviewCheckpoint.for_changelist(previous.changelist_info.number),
+                _EtaEstimator(self.n8n, self._base_tokens(previous.changelist_info), eta_callback)
+            )
+            result.excluded_files = previous.excluded_files
+            result.asset_summary = previous.asset_summary
+        except N8NError as e:
+            result.error = f"AI 서비스 오류: {str(e)}"
+        except Exception as e:
+            result.error = f"예상치 못한 오류: {str(e)}"
 
-        batches = []
-        current_batch: List[FileChange] = []
-        current_lines = 0
+        return result
 
-        for file in files:
-            file_lines = len(file.diff.split('\n')) if file.diff else 0
+    def _run_batches(
+        self,
+        changelist_info: ChangelistInfo,
+        batches: List[List[FileChange]],
+        batch_results: List[Optional[Dict[str, Any]]],
+        batch_numbers: List[int],
+        progress_callback: Optional[Callable[[str], None]] = None,
+        checkpoint: Optional[ReviewCheckpoint] = None,
+        estimator: Optional[_EtaEstimator] = None
+    ) -> ReviewResult:
+        """
+        지정한 배치들을 요청하고 전체 결과 병합
 
-            # 현재 배치에 추가하면 임계값 초과하는지 확인
-            would_exceed_files = len(current_batch) >= MAX_FILES_PER_BATCH
-            would_exceed_lines = current_lines + file_lines > MAX_LINES_PER_BATCH
+        개별 배치가 재시도 후에도 실패하면 나머지 배치는 계속 진행하고,
+        성공한 배치만으로 부분 결과를 반환 (모두 실패한 경우에만 오류)
 
-            if current_batch and (would_exceed_files or would_exceed_lines):
-                batches.append(current_batch)
-                current_batch = []
-                current_lines = 0
+        Args:
+            changelist_info: 원본 Changelist 정보
+            batches: 전체 배치 목록
+            batch_results: 배치별 응답 (미완료는 None, in-place 갱신)
+            batch_numbers: 이번에 요청할 배치 번호 목록 (1부터)
+            progress_callback: 진행 상황 콜백 함수
+            checkpoint: 완료된 배치 응답을 저장할 체크포인트
+            estimator: 진행률/ETA 계산기
+
+        Returns:
+            ReviewResult: 병합된 리뷰 결과
+        """
+        total_batches = len(batches)
+        failed: Dict[int, str] = {}
+
+        if estimator:
+            done_tokens = [
+                estimator.batch_tokens(batches[i - 1])
+                for i in range(1, total_batches + 1)
+                if i not in batch_numbers and batch_results[i - 1] is not None
+            ]
+            remaining_tokens = [estimator.batch_tokens(batches[i - 1]) for i in batch_numbers]
+
+        for i in batch_numbers:
+            if estimator:
+                estimator.report(done_tokens, remaining_tokens)
+
+            if progress_callback and total_batches > 1:
+                progress_callback(f"배치 {i}/{total_batches} 리뷰 중...")
+
+            # 배치 인덱스 정보 (Redis Memory 세션 컨텍스트용)
+            batch_index_info = {"current": i, "total": total_batches}
+            try:
+                batch_results[i - 1] = self._review_batch_with_retry(
+                    batches[i - 1], changelist_info, batch_index_info, progress_callback
+                )
+            except N8NError as e:
+                failed[i] = str(e)
+                continue
+            finally:
+                if estimator:
+                    done_tokens.append(remaining_tokens.pop(0))
+                    estimator.report(done_tokens, remaining_tokens)
+
+            if checkpoint:
+                checkpoint.save_batch(i, batch_results[i - 1])
+
+        return self._finalize(
+            changelist_info, batches, batch_results, failed, progress_callback, checkpoint
+        )
+
+    def _finalize(
+        self,
+        changelist_info: ChangelistInfo,
+        batches: List[List[FileChange]],
+        batch_results: List[Optional[Dict[str, Any]]],
+        failed: Dict[int, str],
+        progress_callback: Optional[Callable[[str], None]] = None,
+        checkpoint: Optional[ReviewCheckpoint] = None
+    ) -> ReviewResult:
+        """
+        배치 응답을 병합하여 최종 ReviewResult 생성
+
+        Raises:
+            N8NError: 모든 배치가 실패한 경우
+        """
+        total_batches = len(batches)
+
+        # 이전 실행에서 실패한 뒤 이번에 요청하지 않은 배치도 실패로 유지
+        for i, batch_result in enumerate(batch_results, 1):
+            if batch_result is None and i not in failed:
+                failed[i] = "요청되지 않음"
+
+        if failed and len(failed) == total_batches:
+            raise N8NError(next(iter(failed.values())))
+
+        # 모든 배치가 완료되면 체크포인트 정리 (실패 배치가 있으면 재개용으로 유지)
+        if checkpoint and not failed:
+            checkpoint.discard()
+
+        if progress_callback:
+            progress_callback("리뷰 결과 처리 중...")
 
-            current_batch.append(file)
-            current_lines += file_lines
+        completed = [(r, b) for r, b in zip(batch_results, batches) if r is not None]
+        result = self._merge_results([r for r, _ in completed], [b for _, b in completed])
+        result.success = True
+        result.files = changelist_info.files  # diff 데이터 포함
+        result.failed_batches = failed
+        result.changelist_info = changelist_info
+        result.batches = batches
+        result.batch_results = batch_results
+        if self.n8n.total_compaction.tokens_before:
+            result.compaction = self.n8n.total_compaction
 
-        if current_batch:
-            batches.append(current_batch)
+        # 이전 리뷰에서 본 hunk의 저장된 코멘트 (같은 diff를 가진 파일에도 복제)
+        carried_over: List[Tuple[str, Dict[str, Any]]] = [
+            (path, comment_data)
+            for reused in self.reused
+            for comment_data in reused.comments
+            for path in [reused.depot_path, *reused.shared_paths]
+        ]
+        # incremental 모드에서 바뀌지 않은 파일의 이전 코멘트
+        carried_over += [
+            (path, comment_data)
+            for path, comments in self.carried.items()
+            for comment_data in comments
+        ]
+        for path, comment_data in carried_over:
+            comment = ReviewComment(
+                file_path=path,
+                line_number=comment_data.get("line_number", 0),
+                severity=comment_data.get("severity", "info"),
+                category=comment_data.get("category", ""),
+                message=comment_data.get("message", ""),
+                suggestion=comment_data.get("suggestion", "")
+            )
+            result.comments.append(comment)
+            if comment.severity in result.statistics:
+                result.statistics[comment.severity] += 1
+        result.reused = self.reused
+        result.carried = self.carried
+        # 이력에는 안내 문구 없이 리뷰 요약만 저장 (다음 실행에서 문구가 쌓이지 않도록)
+        history_summary = result.summary
+        scored = True
+        if not total_batches and self.carried and self.previous_run:
+            result.overall_score = self.previous_run.get("overall_score", 0)
+            history_summary = self.previous_run.get("summary", "")
+            result.summary = f"마지막 리뷰 이후 바뀐 파일이 없습니다. {history_summary}".strip()
+        elif not total_batches and self.reused:
+            # 재사용한 hunk를 리뷰한 배치의 점수/요약 복원 (점수가 없으면 이력에 남기지 않음)
+            scores = [score for reused in self.reused for score in reused.scores]
+            scored = bool(scores)
+            result.overall_score = sum(scores) // len(scores) if scores else 0
+            history_summary = " ".join(dict.fromkeys(
+                summary for reused in self.reused for summary in reused.summaries
+            ))
+            result.summary = f"모든 변경이 이전에 리뷰한 hunk라 저장된 코멘트를 표시합니다. {history_summary}".strip()
 
-        return batches
+        # 다음 incremental 리뷰용 이력 (모든 배치가 성공한 경우에만, 재개/재시도 경로 포함)
+        digests = self.digests or {f.depot_path: diff_digest(f.diff) for f in changelist_info.files}
+        if self.history and digests and not failed and scored:
+            self.history.save(
+                digests,
+                [asdict(c) for c in result.comments],
+                result.overall_score,
+                history_summary
+            )
+
+        if failed:
+            result.summary = (
+                f"[부분 결과: {total_batches}개 배치 중 {len(failed)}개 실패] {result.summary}"
+            )
+
+        return result
+
+    def _review_batch_with_retry(
+        self,
+        files: List[FileChange],
+        original_info: ChangelistInfo,
+        batch_index_info: Dict[str, int],
+        progress_callback: Optional[Callable[[str], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        일시적 오류(타임아웃, 연결 실패, 5xx)에 대해 지수 백오프 + jitter로 재시도
+
+        Raises:
+            N8NError: 재시도 횟수를 모두 소진했거나 재시도 대상이 아닌 오류
+        """
+        settings = get_config().retry
+        max_attempts = max(int(settings.get("max_attempts", 3)), 1)
+        base_delay = float(settings.get("base_delay", 2.0))
+        max_delay = float(settings.get("max_delay", 30.0))
+
+        attempt = 1
+        while True:
+            try:
+                return self._review_batch(files, original_info, batch_index_info)
+            except N8NError as e:
+                if not e.transient or attempt >= max_attempts:
+                    raise
+
+            # Full jitter: 0 ~ min(max_delay, base_delay * 2^(attempt-1))
+            delay = random.uniform(0, min(max_delay, base_delay * (2 ** (attempt - 1))))
+            attempt += 1
+            if progress_callback:
+                current, total = batch_index_info["current"], batch_index_info["total"]
+                label = f"배치 {current}/{total}" if total else f"배치 {current}"
+                progress_callback(f"{label} 재시도 중 ({attempt}/{max_attempts})...")
+            time.sleep(delay)
+
+    @staticmethod
+    def _dedupe(file_change: FileChange, unique: Dict[str, FileChange]) -> bool:
+        """
+        같은 정규화 diff를 가진 파일이 이미 수집되었으면 그 파일의 shared_paths에 경로 추가
+
+        먼저 수집된 파일이 이미 요청된 배치에 있어도 코멘트는 _merge_results()에서 복제되므로
+        중복 파일은 전송하지 않음. 오류/삭제 메시지처럼 hunk가 없는 diff는 비교하지 않음
+
+        Args:
+            file_change: 새로 수집된 파일
+            unique: 다이제스트 -> 먼저 수집된 파일 (in-place 갱신)
+
+        Returns:
+            중복이면 True
+        """
+        if not file_change.diff or "@@" not in file_change.diff:
+            return False
+        original = unique.setdefault(diff_digest(file_change.diff), file_change)
+        if original is file_change:
+            return False
+        original.shared_paths.append(file_change.depot_path)
+        return True
+
+    def _carry_over(self, file_change: FileChange) -> bool:
+        """
+        diff 다이제스트를 기록하고, 마지막 리뷰 이후 바뀌지 않은 파일이면 이전 코멘트를 이어 씀
+
+        Returns:
+            이전 코멘트를 이어 써서 전송하지 않을 파일이면 True
+        """
+        digest = diff_digest(file_change.diff)
+        self.digests[file_change.depot_path] = digest
+        previous = self.previous_run.get("files", {}).get(file_change.depot_path)
+        if not previous or previous.get("digest") != digest:
+            return False
+        self.carried[file_change.depot_path] = previous.get("comments", [])
+        return True
+
+    def _reuse_hunks(self, file_change: FileChange) -> Optional[FileChange]:
+        """
+        이전에 리뷰한 hunk는 전송 대상에서 빼고 저장된 코멘트를 self.reused에 기록
+
+        Returns:
+            전송할 파일 (남은 hunk만 포함한 사본), 모든 hunk를 재사용하면 None
+        """
+        if self.hunk_store is None:
+            return file_change
+        sent, reused = self.hunk_store.split(file_change)
+        if reused:
+            self.reused.append(reused)
+        return sent
+
+    def _iter_diffs(self, info: ChangelistInfo) -> Iterator[FileChange]:
+        """diff 수집 (직전 description/리뷰가 수집한 파일은 Changelist 스냅샷 사용)"""
+        return iter_changelist_diffs(self.p4, info, use_cache=self.use_cache)
+
+    @staticmethod
+    def _expand_context(file_change: FileChange) -> FileChange:
+        """
+        리뷰할 diff의 context를 변경이 속한 함수/클래스 전체로 확장 (in-place)
+
+        context_expansion 설정의 파일별 토큰 상한 안에서만 확장하므로 배치 계획은
+        확장된 diff 크기를 기준으로 이루어짐
+        """
+        settings = get_config().context_expansion
+        language = detect_language(file_change.depot_path)
+        if settings.get("enabled", True) and language:
+            file_change.diff = expand_diff_context(
+                file_change.diff,
+                file_change.diff_full,
+                language,
+                int(settings.get("max_file_tokens", 3000))
+            )
+        return file_change
+
+    def _base_tokens(self, changelist_info: ChangelistInfo) -> int:
+        """모든 배치에 반복 포함되는 내용(전문가 컨텍스트, description)의 토큰 수 (라우팅되는 프로필 중 최대)"""
+        return (
+            max(estimate_tokens(self.n8n._get_expert_context("review", p)) for p in self.router.profiles)
+            + estimate_tokens(changelist_info.description)
+        )
 
     def _review_batch(
         self,
@@ -191,14 +1178,33 @@ class ReviewGenerator:
             files=files
         )
 
-        return self.n8n.request_review(batch_changelist, batch_index_info)
+        # 에셋 요약은 첫 배치에만 포함 (Redis Memory로 이후 배치에도 공유됨)
+        asset_summary = None
+        if self.asset_summary and (batch_index_info or {}).get("current", 1) == 1:
+            max_paths = int(get_config().asset_fast_path.get("max_paths_per_category", 20))
+            asset_summary = self.asset_summary.to_payload(max_paths)
 
-    def _merge_results(self, batch_results: List[Dict[str, Any]]) -> ReviewResult:
+        # 배치의 파일은 모두 같은 전문가 프로필로 라우팅됨 (에셋 요약만 있는 배치는 설정된 프로필)
+        profile = self.router.route(files[0].depot_path) if files else self.router.default
+        response = self.n8n.request_review(batch_changelist, batch_index_info, asset_summary, profile)
+        if self.hunk_store and response.get("success", False):
+            self.hunk_store.remember(files, response)
+        return response
+
+    def _merge_results(
+        self,
+        batch_results: List[Dict[str, Any]],
+        batches: Optional[List[List[FileChange]]] = None
+    ) -> ReviewResult:
         """
         여러 배치의 결과를 병합
 
+        hunk 단위로 분할 전송된 파일의 코멘트는 원본 파일 기준 라인 번호로 보정하고,
+        diff가 같아 한 번만 전송된 파일의 코멘트는 shared_paths의 모든 파일에 복제
+
         Args:
             batch_results: 배치별 결과 리스트
+            batches: 배치별 파일 목록 (분할 파일 라인 보정용)
 
         Returns:
             병합된 ReviewResult
@@ -209,17 +1215,33 @@ class ReviewGenerator:
         valid_batches = 0
         summaries: List[str] = []
 
-        for result in batch_results:
+        for index, result in enumerate(batch_results):
             if not result.get("success", False):
                 continue
 
             valid_batches += 1
 
+            # 배치 내 분할 파일 (depot_path -> 부분 정보 목록)
+            parts: Dict[str, List[Dict[str, int]]] = {}
+            # 배치 내 대표 파일 depot_path -> 같은 diff를 가진 파일 경로
+            shared: Dict[str, List[str]] = {}
+            if batches and index < len(batches):
+                for f in batches[index]:
+                    if f.part_info:
+                        parts.setdefault(f.depot_path, []).append(f.part_info)
+                    if f.shared_paths:
+                        shared[f.depot_path] = f.shared_paths
+
             # 코멘트 병합
             for comment_data in result.get("comments", []):
+                file_path = comment_data.get("file_path", "")
+                line_number = comment_data.get("line_number", 0)
+                if file_path in parts:
+                    line_number = self._remap_part_line(line_number, parts[file_path])
+
                 comment = ReviewComment(
-                    file_path=comment_data.get("file_path", ""),
-                    line_number=comment_data.get("line_number", 0),
+                    file_path=file_path,
+                    line_number=line_number,
                     severity=comment_data.get("severity", "info"),
                     category=comment_data.get("category", ""),
                     message=comment_data.get("message", ""),
@@ -227,6 +1249,11 @@ class ReviewGenerator:
                 )
                 all_comments.append(comment)
 
+                for path in shared.get(file_path, []):
+                    all_comments.append(replace(comment, file_path=path))
+                    if comment.severity in merged.statistics:
+                        merged.statistics[comment.severity] += 1
+
             # 점수 누적 (평균용)
             total_score += result.get("overall_score", 0)
 
@@ -245,6 +1272,36 @@ class ReviewGenerator:
 
         return merged
 
+    @staticmethod
+    def _remap_part_line(line_number: int, part_infos: List[Dict[str, int]]) -> int:
+        """
+        분할 전송된 파일 코멘트의 라인 번호를 원본 파일 기준으로 보정
+
+        hunk 헤더에 원본 라인 번호가 있으므로 대부분 그대로 사용하지만,
+        AI가 부분 diff 기준 상대 라인 번호를 반환한 경우 부분 시작 라인만큼 이동
+
+        Args:
+            line_number: AI가 반환한 라인 번호
+            part_infos: 해당 파일의 부분 정보 목록
+
+        Returns:
+            원본 파일 기준 라인 번호
+        """
+        if not isinstance(line_number, int) or line_number <= 0:
+            return line_number
+
+        for info in part_infos:
+            if info.get("line_start", 0) <= line_number <= info.get("line_end", 0):
+                return line_number
+
+        if len(part_infos) == 1:
+            info = part_infos[0]
+            shifted = line_number + info.get("line_start", 1) - 1
+            if info.get("line_start", 0) <= shifted <= info.get("line_end", 0):
+                return shifted
+
+        return line_number
+
 
 def run_review_command(
     changelist: int,
@@ -252,16 +1309,56 @@ def run_review_command(
     user: str = "",
     client: str = "",
     webhook_url: str = "",
-    progress_callback: Optional[Callable[[str], None]] = None
+    use_cache: bool = True,
+    resume: bool = False,
+    progress_callback: Optional[Callable[[str], None]] = None,
+    eta_callback: Optional[Callable[[float, Optional[float]], None]] = None,
+    deadline: Optional[float] = None,
+    incremental: bool = False
 ) -> ReviewResult:
     """코드 리뷰 명령 실행 헬퍼 함수"""
     generator = ReviewGenerator(
         port=port,
         user=user,
         client=client,
-        webhook_url=webhook_url
+        webhook_url=webhook_url,
+        use_cache=use_cache
     )
+    if resume:
+        return generator.resume(
+            changelist=changelist,
+            progress_callback=progress_callback,
+            eta_callback=eta_callback
+        )
     return generator.generate(
         changelist=changelist,
-        progress_callback=progress_callback
+        progress_callback=progress_callback,
+        eta_callback=eta_callback,
+        deadline=deadline,
+        incremental=incremental
+    )
+
+
+def run_review_retry(
+    previous: ReviewResult,
+    port: str = "",
+    user: str = "",
+    client: str = "",
+    webhook_url: str = "",
+    use_cache: bool = True,
+    progress_callback: Optional[Callable[[str], None]] = None,
+    eta_callback: Optional[Callable[[float, Optional[float]], None]] = None
+) -> ReviewResult:
+    """부분 결과의 실패한 배치만 재요청하는 헬퍼 함수"""
+    generator = ReviewGenerator(
+        port=port,
+        user=user,
+        client=client,
+        webhook_url=webhook_url,
+        use_cache=use_cache
+    )
+    return generator.retry_failed(
+        previous=previous,
+        progress_callback=progress_callback,
+        eta_callback=eta_callback
     )
@@ -11,17 +11,101 @@ from typing import Optional
 class ConfigManager:
     DEFAULT_CONFIG = {
         "webhook_url": "",
+        "webhook_urls": [],
         "timeout": 60,
         "language": "ko",
         "expert_profile": "generic",
         "custom_prompts": {
             "description": "",
             "review": ""
+        },
+        "response_cache": {
+            "enabled": True,
+            "ttl_hours": 24,
+            "max_size_mb": 50
+        },
+        "hunk_reuse": {
+            "enabled": True,
+            "ttl_hours": 168,
+            "max_size_mb": 20
+        },
+        "retry": {
+            "max_attempts": 3,
+            "base_delay": 2.0,
+            "max_delay": 30.0
+        },
+        "hedging": {
+            "enabled": False,
+            "percentile": 90,
+            "initial_delay": 20.0
+        },
+        "governor": {
+            "enabled": True,
+            "max_concurrent_p4": 4,
+            "max_concurrent_webhook": 2,
+            "webhook_rate_per_minute": 0
+        },
+        "adaptive_timeout": {
+            "enabled": True,
+            "min_timeout": 15,
+            "max_timeout": 600
+        },
+        "path_filter": {
+            "enabled": True,
+            "include": [],
+            "exclude": ["*/node_modules/*", "*/vendor/*", "*.min.js", "*.designer.cs"]
+        },
+        "asset_fast_path": {
+            "enabled": True,
+            "max_paths_per_category": 20
+        },
+        "context_expansion": {
+            "enabled": True,
+            "max_file_tokens": 3000
+        },
+        "payload_compaction": {
+            "enabled": True,
+            "drop_whitespace_hunks": True
+        },
+        "payload_layout": {
+            "stable_prefix": True
+        },
+        "context_handshake": {
+            "enabled": True
+        },
+        "profile_routing": {
+            "enabled": False,
+            "profiles": ["unity", "unreal"]
+        },
+        "description_map_reduce": {
+            "enabled": True,
+            "max_parallel": 3
+        },
+        "description_fetch": {
+            "summarize_over_kb": 256
+        },
+        "changelist_snapshot": {
+            "enabled": True,
+            "ttl_hours": 8
+        },
+        "risk": {
+            "prioritize": True,
+            "critical_paths": [
+                "*auth*", "*security*", "*crypt*", "*password*", "*login*",
+                "*payment*", "*billing*", "*purchase*", "*network*", "*/net/*", "*server*"
+            ],
+            "low_value_paths": [
+                "*/thirdparty/*", "*/third_party/*", "*/external/*", "*/generated/*",
+                "*.designer.cs", "*.min.js"
+            ]
         }
     }
 
     def __init__(self):
-        self.config_dir = Path(os.environ.get("APPDATA", "")) / "P4V-AI-Assistant"
+        # APPDATA가 없으면 (Windows 외 환경) 작업 디렉토리 대신 사용자 홈 아래에 저장
+        appdata = os.environ.get("APPDATA")
+        base_dir = Path(appdata) if appdata else Path.home() / ".config"
+        self.config_dir = base_dir / "P4V-AI-Assistant"
         self.config_file = self.config_dir / "config.json"
         self._config: dict = {}
         self._load()
@@ -51,6 +135,12 @@ class ConfigManager:
     def webhook_url(self, value: str) -> None:
         self._config["webhook_url"] = value
 
+    @property
+    def webhook_urls(self) -> list:
+        """요청을 분산할 webhook URL 목록 (webhook_url + 추가 엔드포인트, 중복 제거)"""
+        urls = [self.webhook_url] + list(self._config.get("webhook_urls", []))
+        return [url for url in dict.fromkeys(urls) if url]
+
     @property
     def timeout(self) -> int:
         return self._config.get("timeout", 60)
@@ -75,6 +165,102 @@ class ConfigManager:
     def custom_prompts(self, value: dict) -> None:
         self._config["custom_prompts"] = value
 
+    def _get_section(self, key: str) -> dict:
+        """딕셔너리 형태의 설정 섹션 반환 (누락된 키는 기본값으로 채움)"""
+        settings = dict(self.DEFAULT_CONFIG[key])
+        settings.update(self._config.get(key, {}))
+        return settings
+
+    @property
+    def response_cache(self) -> dict:
+        """응답 캐시 설정"""
+        return self._get_section("response_cache")
+
+    @property
+    def hunk_reuse(self) -> dict:
+        """hunk 단위 리뷰 코멘트 재사용 설정"""
+        return self._get_section("hunk_reuse")
+
+    @property
+    def retry(self) -> dict:
+        """배치 요청 재시도 설정"""
+        return self._get_section("retry")
+
+    @property
+    def hedging(self) -> dict:
+        """hedged 요청 설정"""
+        return self._get_section("hedging")
+
+    @property
+    def governor(self) -> dict:
+        """프로세스 간 동시 실행 제한 설정"""
+        return self._get_section("governor")
+
+    @property
+    def adaptive_timeout(self) -> dict:
+        """지연 시간 모델 기반 요청별 타임아웃 설정"""
+        return self._get_section("adaptive_timeout")
+
+    @property
+    def path_filter(self) -> dict:
+        """리뷰/Description 대상 경로 필터 설정 (glob 또는 "re:" 정규식)"""
+        return self._get_section("path_filter")
+
+    @property
+    def asset_fast_path(self) -> dict:
+        """에셋 변경 요약 전송 설정"""
+        return self._get_section("asset_fast_path")
+
+    @property
+    def context_expansion(self) -> dict:
+        """리뷰 diff의 함수 단위 context 확장 설정 (파일별 토큰 상한)"""
+        return self._get_section("context_expansion")
+
+    @property
+    def payload_compaction(self) -> dict:
+        """요청 페이로드 압축 설정"""
+        return self._get_section("payload_compaction")
+
+    @property
+    def payload_layout(self) -> dict:
+        """페이로드 배치 순서 설정 (고정 prefix 사용 여부)"""
+        return self._get_section("payload_layout")
+
+    @property
+    def context_handshake(self) -> dict:
+        """전문가 컨텍스트 등록 설정 (등록 후 ID로 참조)"""
+        return self._get_section("context_handshake")
+
+    @property
+    def profile_routing(self) -> dict:
+        """파일 종류별 전문가 프로필 라우팅 설정 (라우팅 대상 프로필)"""
+        return self._get_section("profile_routing")
+
+    @property
+    def description_map_reduce(self) -> dict:
+        """대용량 CL description 배치 요약/병합 설정 (동시 요약 요청 수)"""
+        return self._get_section("description_map_reduce")
+
+    @property
+    def description_fetch(self) -> dict:
+        """Description diff 수집 설정 (통계 요약으로 대체할 diff 크기, 0이면 사용 안 함)"""
+        return self._get_section("description_fetch")
+
+    @property
+    def changelist_snapshot(self) -> dict:
+        """Description/Review가 공유하는 diff 스냅샷 설정 (스냅샷 유효 시간)"""
+        return self._get_section("changelist_snapshot")
+
+    @property
+    def risk(self) -> dict:
+        """파일 위험도 평가 설정 (위험도 순 배치 요청 여부, 중요 경로, 저가치 경로 패턴)"""
+        return self._get_section("risk")
+
+    @property
+    def cache_dir(self) -> Path:
+        """캐시 데이터 저장 디렉토리"""
+        return self.config_dir / "cache"
+
     def get(self, key: str, default=None):
         return self._config.get(key, default)
 
@@ -83,7 +269,7 @@ class ConfigManager:
 
     def is_configured(self) -> bool:
         """필수 설정이 되어 있는지 확인"""
-        return bool(self.webhook_url)
+        return bool(self.webhook_urls)
 
 
 # 싱글톤 인스턴스
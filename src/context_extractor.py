@@ -0,0 +1,264 @@
+"""
+함수 단위 context 추출 모듈
+전체 소스 diff(diff_full)에서 변경이 속한 함수/클래스 범위를 찾아, 파일별 토큰 예산 안에서
+3줄 context diff를 함수 전체가 보이는 diff로 확장
+"""
+import posixpath
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+from .batch_planner import HUNK_HEADER_PATTERN, estimate_tokens
+
+
+# 확장자별 범위 탐색 방식
+LANGUAGE_EXTENSIONS = {
+    ".cs": "brace", ".c": "brace", ".cc": "brace", ".cpp": "brace", ".cxx": "brace",
+    ".h": "brace", ".hh": "brace", ".hpp": "brace", ".inl": "brace",
+    ".py": "python",
+    ".lua": "lua"
+}
+
+# 기본 diff의 context 라인 수 (p4 diff -du)
+DEFAULT_CONTEXT = 3
+
+# hunk 헤더 뒤에 붙일 함수 시그니처 최대 길이
+MAX_SECTION_LENGTH = 80
+
+# 함수가 아닌 제어 블록 (더 바깥 블록을 계속 탐색)
+CONTROL_PATTERN = re.compile(
+    r"^\s*(}\s*)?(if|else|for|foreach|while|do|switch|case|default|try|catch|finally|using|lock|"
+    r"unsafe|fixed|checked|unchecked)\b|=>\s*$|=\s*$|^\s*\{?\s*$"
+)
+# 범위가 너무 넓어 확장하지 않는 블록
+NAMESPACE_PATTERN = re.compile(r"^\s*(namespace|extern\s+\"C\")\b")
+# 문자열/문자 리터럴과 // 주석 (중괄호 개수 계산에서 제외)
+LITERAL_PATTERN = re.compile(r'"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'|//.*')
+
+PYTHON_SCOPE_PATTERN = re.compile(r"^(\s*)(async\s+def|def|class)\b")
+LUA_FUNCTION_PATTERN = re.compile(r"^(\s*)(local\s+)?(function\b|[\w.:\[\]\"']+\s*=\s*function\b)")
+LUA_END_PATTERN = re.compile(r"^\s*end\b")
+
+
+@dataclass
+class _Line:
+    """diff_full의 라인 하나"""
+    kind: str      # " " context, "-" 삭제, "+" 추가
+    text: str
+    old: int       # 원본 파일 라인 번호 (추가 라인은 다음 원본 라인 번호)
+    new: int       # 새 파일 라인 번호 (삭제 라인은 다음 새 라인 번호)
+
+
+def detect_language(depot_path: str) -> Optional[str]:
+    """범위 탐색 방식 반환 (지원하지 않는 파일이면 None)"""
+    return LANGUAGE_EXTENSIONS.get(posixpath.splitext(depot_path.lower())[1])
+
+
+def _parse_lines(diff: str) -> List[_Line]:
+    """
+    unified diff의 hunk 라인 목록 (헤더 제외)
+
+    끝 공백이 제거되어 빈 문자열이 된 context 라인도 라인 번호에 포함하고,
+    hunk 헤더의 라인 수를 다 채운 뒤의 빈 라인(diff 끝 줄바꿈)은 무시
+    """
+    lines: List[_Line] = []
+    old = new = 0
+    old_left = new_left = 0
+    for raw in diff.split("\n"):
+        match = HUNK_HEADER_PATTERN.match(raw)
+        if match:
+            old, new = int(match.group(1)), int(match.group(3))
+            old_left = int(match.group(2)) if match.group(2) is not None else 1
+            new_left = int(match.group(4)) if match.group(4) is not None else 1
+            continue
+        if (old_left <= 0 and new_left <= 0) or raw.startswith("\\"):
+            continue
+        kind = raw[0] if raw and raw[0] in "+-" else " "
+        lines.append(_Line(kind, raw[1:], old, new))
+        old += kind != "+"
+        new += kind != "-"
+        old_left -= kind != "+"
+        new_left -= kind != "-"
+    return lines
+
+
+def _indent(text: str) -> int:
+    return len(text) - len(text.lstrip())
+
+
+def _brace_scope(lines: List[_Line], first: int, last: int) -> Optional[Tuple[int, int]]:
+    """중괄호 언어(C#/C++): 변경을 감싸는 가장 안쪽 함수/타입 블록"""
+    depth = 0
+    for i in range(first - 1, -1, -1):
+        if lines[i].kind == "-":
+            continue
+        code = LITERAL_PATTERN.sub("", lines[i].text)
+        depth += code.count("}") - code.count("{")
+        if depth >= 0:
+            continue
+
+        # 여는 중괄호만 있는 라인이면 앞 라인이 시그니처
+        signature = i
+        while signature > 0 and (
+            lines[signature].kind == "-" or not lines[signature].text.strip()
+            or lines[signature].text.strip() == "{"
+        ):
+            signature -= 1
+        text = lines[signature].text
+        if NAMESPACE_PATTERN.match(text):
+            return None
+        if CONTROL_PATTERN.search(text):
+            depth = 0
+            continue
+
+        # 블록 끝: 여는 중괄호부터 짝이 맞을 때까지
+        balance = 0
+        for j in range(i, len(lines)):
+            if lines[j].kind == "-":
+                continue
+            code = LITERAL_PATTERN.sub("", lines[j].text)
+            balance += code.count("{") - code.count("}")
+            if balance <= 0 and j >= last:
+                return signature, j
+        return signature, len(lines) - 1
+    return None
+
+
+def _python_scope(lines: List[_Line], first: int, last: int) -> Optional[Tuple[int, int]]:
+    """Python: 변경보다 덜 들여쓴 가장 가까운 def/class와 들여쓰기가 끝나는 지점"""
+    limit = _indent(lines[first].text) + 1
+    for i in range(first, -1, -1):
+        text = lines[i].text
+        if lines[i].kind == "-" or not text.strip():
+            continue
+        match = PYTHON_SCOPE_PATTERN.match(text)
+        if match and len(match.group(1)) < limit:
+            start_indent = len(match.group(1))
+            end = last
+            for j in range(last + 1, len(lines)):
+                if lines[j].kind != "-" and lines[j].text.strip() and _indent(lines[j].text) <= start_indent:
+                    break
+                end = j
+            while end > last and not lines[end].text.strip():
+                end -= 1
+            return i, end
+        # 함수 본문의 라인은 모두 def보다 깊게 들여쓰므로 상한을 좁혀 감
+        limit = min(limit, _indent(text))
+    return None
+
+
+def _lua_scope(lines: List[_Line], first: int, last: int) -> Optional[Tuple[int, int]]:
+    """Lua: 변경 앞의 가장 가까운 function 정의와 같은 들여쓰기의 end"""
+    for i in range(first, -1, -1):
+        if lines[i].kind == "-":
+            continue
+        match = LUA_FUNCTION_PATTERN.match(lines[i].text)
+        if not match:
+            continue
+        start_indent = len(match.group(1))
+        for j in range(max(i + 1, last), len(lines)):
+            text = lines[j].text
+            if lines[j].kind != "-" and LUA_END_PATTERN.match(text) and _indent(text) == start_indent:
+                return i, j
+        return None
+    return None
+
+
+_SCOPE_FINDERS = {
+    "brace": _brace_scope,
+    "python": _python_scope,
+    "lua": _lua_scope
+}
+
+
+def _clusters(lines: List[_Line]) -> List[Tuple[int, int]]:
+    """기본 diff의 hunk와 같은 기준으로 변경 라인 묶기 (첫 변경, 마지막 변경 인덱스)"""
+    changed = [i for i, line in enumerate(lines) if line.kind != " "]
+    clusters: List[Tuple[int, int]] = []
+    for i in changed:
+        if clusters and i - clusters[-1][1] <= DEFAULT_CONTEXT * 2 + 1:
+            clusters[-1] = (clusters[-1][0], i)
+        else:
+            clusters.append((i, i))
+    return clusters
+
+
+def _render(header: List[str], lines: List[_Line], keep: Set[int], sections: Dict[int, str]) -> str:
+    """유지할 라인으로 hunk를 다시 만들고 헤더 라인 번호 재계산"""
+    output = list(header)
+    indexes = sorted(keep)
+    start = 0
+    while start < len(indexes):
+        end = start
+        while end + 1 < len(indexes) and indexes[end + 1] == indexes[end] + 1:
+            end += 1
+        block = [lines[i] for i in indexes[start:end + 1]]
+        old_count = sum(1 for line in block if line.kind != "+")
+        new_count = sum(1 for line in block if line.kind != "-")
+        old_start = block[0].old if old_count else block[0].old - 1
+        new_start = block[0].new if new_count else block[0].new - 1
+        section = next((sections[i] for i in indexes[start:end + 1] if i in sections), "")
+        output.append(f"@@ -{old_start},{old_count} +{new_start},{new_count} @@{section}")
+        output.extend(line.kind + line.text for line in block)
+        start = end + 1
+    return "\n".join(output)
+
+
+def expand_diff_context(diff: str, diff_full: str, language: str, max_tokens: int) -> str:
+    """
+    변경이 속한 함수/클래스 전체가 보이도록 diff context 확장
+
+    diff_full(context 10000줄)에서 기본 diff와 같은 기준으로 변경을 묶고, 묶음마다 감싸는
+    범위를 찾아 파일 토큰이 max_tokens를 넘지 않는 동안 앞쪽 변경부터 확장.
+    범위를 찾지 못했거나 예산을 넘는 묶음은 기본 3줄 context를 유지
+
+    Args:
+        diff: 기본 diff (context 3줄)
+        diff_full: 전체 소스 diff
+        language: detect_language() 결과
+        max_tokens: 파일 하나의 diff 토큰 상한
+
+    Returns:
+        확장된 diff (확장할 수 없으면 원본 diff)
+    """
+    if not diff_full or diff_full == diff or estimate_tokens(diff) >= max_tokens:
+        return diff
+
+    lines = _parse_lines(diff_full)
+    clusters = _clusters(lines)
+    if not clusters:
+        return diff
+
+    # 기본 diff와 같은 범위부터 시작
+    keep: Set[int] = set()
+    for first, last in clusters:
+        keep.update(range(max(first - DEFAULT_CONTEXT, 0), min(last + DEFAULT_CONTEXT + 1, len(lines))))
+    tokens = sum(estimate_tokens(lines[i].text) + 1 for i in keep)
+
+    finder = _SCOPE_FINDERS[language]
+    sections: Dict[int, str] = {}
+    expanded = False
+    for first, last in clusters:
+        scope = finder(lines, first, last)
+        if scope is None:
+            continue
+        start, end = min(scope[0], first), max(scope[1], last)
+        extra = [i for i in range(start, end + 1) if i not in keep]
+        cost = sum(estimate_tokens(lines[i].text) + 1 for i in extra)
+        if tokens + cost > max_tokens:
+            continue
+        keep.update(extra)
+        tokens += cost
+        sections[start] = " " + lines[scope[0]].text.strip()[:MAX_SECTION_LENGTH]
+        expanded = True
+
+    if not expanded:
+        return diff
+
+    # 기본 diff 헤더 (p4 diff의 ---/+++ 라인) 유지
+    diff_header = []
+    for line in diff.split("\n"):
+        if HUNK_HEADER_PATTERN.match(line):
+            break
+        diff_header.append(line)
+    return _render(diff_header, lines, keep, sections)
@@ -0,0 +1,59 @@
+"""
+전문가 컨텍스트 등록 모듈
+엔드포인트마다 세션 첫 요청에만 전문가 프롬프트 전문을 보내 내용 해시(ID)로 등록하고,
+이후 배치는 ID만 보내 업로드 크기와 프롬프트 재처리를 줄임
+"""
+import hashlib
+import threading
+from typing import Any, Dict, Set
+
+from .payload_layout import mark_cache_prefix, normalize_text
+
+
+# 서버가 등록되지 않은 ID를 받았을 때 응답하는 error_code
+UNKNOWN_CONTEXT_ERROR = "unknown_expert_context"
+
+
+def expert_context_id(text: str) -> str:
+    """전문가 컨텍스트 ID (줄바꿈/끝 공백을 정규화한 내용의 sha256)"""
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+
+
+class ContextRegistry:
+    """엔드포인트별로 등록이 확인된 전문가 컨텍스트 ID (스레드 안전)
+
+    서버가 응답에 같은 expert_context_id를 돌려준 경우에만 등록된 것으로 보므로,
+    등록을 지원하지 않는 워크플로우에는 항상 전문을 보냄
+    """
+
+    def __init__(self):
+        self._registered: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def reference(self, url: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        전송할 페이로드 반환
+
+        url에 이미 등록된 ID면 expert_context를 뺀 사본 (cache_prefix는 뺀 본문 기준으로 다시 계산),
+        아니면 원본 그대로
+        """
+        context_id = payload.get("expert_context_id")
+        if not context_id or "expert_context" not in payload:
+            return payload
+        with self._lock:
+            if context_id not in self._registered.get(url, ()):
+                return payload
+        body = {key: value for key, value in payload.items() if key != "expert_context"}
+        return mark_cache_prefix(body) if "cache_prefix" in body else body
+
+    def acknowledge(self, url: str, payload: Dict[str, Any], result: Dict[str, Any]) -> None:
+        """응답이 ID 등록을 확인하면 url에 등록된 것으로 기록"""
+        context_id = payload.get("expert_context_id")
+        if context_id and result.get("expert_context_id") == context_id:
+            with self._lock:
+                self._registered.setdefault(url, set()).add(context_id)
+
+    def forget(self, url: str, payload: Dict[str, Any]) -> None:
+        """서버가 ID를 잃어버린 경우 (재시작, 만료) 등록 기록 삭제"""
+        with self._lock:
+            self._registered.get(url, set()).discard(payload.get("expert_context_id"))
@@ -0,0 +1,33 @@
+"""
+diff 다이제스트 모듈
+파일 경로 헤더, 줄바꿈, 라인 끝 공백 차이를 제거한 diff 내용의 해시로 같은 변경을 식별
+"""
+import hashlib
+
+from .batch_planner import HUNK_HEADER_PATTERN
+from .payload_compactor import DIFF_HEADER_PATTERN
+
+
+def normalize_diff(diff: str) -> str:
+    """
+    diff 정규화
+
+    - CRLF/CR 줄바꿈을 LF로 통일하고 라인 끝 공백 제거
+    - 첫 hunk 앞의 파일 경로 헤더(====, ---, +++ 등) 제거
+    hunk 헤더의 라인 번호는 유지하므로 같은 다이제스트면 코멘트 라인 번호도 그대로 적용 가능
+    """
+    lines = []
+    in_hunk = False
+    for line in diff.replace("\r\n", "\n").replace("\r", "\n").split("\n"):
+        if not in_hunk:
+            if HUNK_HEADER_PATTERN.match(line):
+                in_hunk = True
+            elif DIFF_HEADER_PATTERN.match(line):
+                continue
+        lines.append(line.rstrip())
+    return "\n".join(lines).strip("\n")
+
+
+def diff_digest(diff: str) -> str:
+    """정규화한 diff의 SHA-256 해시"""
+    return hashlib.sha256(normalize_diff(diff).encode("utf-8")).hexdigest()
@@ -0,0 +1,116 @@
+"""
+n8n Webhook 엔드포인트 풀
+여러 n8n 워커에 요청을 분산하고 엔드포인트별 상태(진행 중 요청 수, 지연 시간, 장애) 추적
+"""
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, List, Optional, Set
+
+
+# 연속 실패 시 엔드포인트를 제외하는 기본 시간 (초, 실패가 반복되면 두 배씩 증가)
+UNHEALTHY_COOLDOWN = 30.0
+MAX_UNHEALTHY_COOLDOWN = 300.0
+# 엔드포인트를 제외하기 시작하는 연속 실패 횟수
+FAILURE_THRESHOLD = 2
+# 지연 시간 백분위 계산에 사용할 최근 샘플 수
+LATENCY_WINDOW = 50
+
+
+@dataclass
+class Endpoint:
+    """Webhook 엔드포인트 상태"""
+    url: str
+    outstanding: int = 0
+    consecutive_failures: int = 0
+    unhealthy_until: float = 0.0
+    latencies: Deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_WINDOW))
+
+    def is_healthy(self, now: float) -> bool:
+        return now >= self.unhealthy_until
+
+    def average_latency(self) -> float:
+        return sum(self.latencies) / len(self.latencies) if self.latencies else 0.0
+
+
+class EndpointPool:
+    """least-outstanding-requests 방식의 엔드포인트 선택기 (스레드 안전)"""
+
+    def __init__(self, urls: List[str]):
+        # 중복 URL 제거 (순서 유지)
+        unique = list(dict.fromkeys(url for url in urls if url))
+        self.endpoints = [Endpoint(url=url) for url in unique]
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.endpoints)
+
+    def acquire(self, exclude: Optional[Set[str]] = None) -> Optional[Endpoint]:
+        """
+        요청을 보낼 엔드포인트 선택 후 진행 중 요청 수 증가
+
+        정상 엔드포인트 중 진행 중 요청이 가장 적은 것을 고르고, 같으면 평균 지연이 짧은 것 우선.
+        모든 엔드포인트가 장애 상태면 제외 시간이 가장 먼저 끝나는 것을 사용
+
+        Args:
+            exclude: 제외할 URL 집합 (hedged 요청, 장애 전환 시 이미 시도한 엔드포인트)
+
+        Returns:
+            선택된 Endpoint (후보가 없으면 None)
+        """
+        exclude = exclude or set()
+        with self._lock:
+            candidates = [e for e in self.endpoints if e.url not in exclude]
+            if not candidates:
+                return None
+
+            now = time.time()
+            healthy = [e for e in candidates if e.is_healthy(now)]
+            if healthy:
+                chosen = min(healthy, key=lambda e: (e.outstanding, e.average_latency()))
+            else:
+                chosen = min(candidates, key=lambda e: e.unhealthy_until)
+
+            chosen.outstanding += 1
+            return chosen
+
+    def release(self, endpoint: Endpoint, latency: float, success: Optional[bool]) -> None:
+        """
+        요청 완료 처리
+
+        Args:
+            endpoint: acquire()로 받은 엔드포인트
+            latency: 요청 소요 시간 (초)
+            success: 성공 여부 (None이면 취소된 요청으로 보고 상태에 반영하지 않음)
+        """
+        with self._lock:
+            endpoint.outstanding = max(endpoint.outstanding - 1, 0)
+            if success is None:
+                return
+
+            if success:
+                endpoint.latencies.append(latency)
+                endpoint.consecutive_failures = 0
+                endpoint.unhealthy_until = 0.0
+                return
+
+            endpoint.consecutive_failures += 1
+            if endpoint.consecutive_failures >= FAILURE_THRESHOLD:
+                extra = endpoint.consecutive_failures - FAILURE_THRESHOLD
+                cooldown = min(UNHEALTHY_COOLDOWN * (2 ** extra), MAX_UNHEALTHY_COOLDOWN)
+                endpoint.unhealthy_until = time.time() + cooldown
+
+    def latency_percentile(self, percentile: float, min_samples: int = 5) -> Optional[float]:
+        """
+        전체 엔드포인트의 최근 성공 요청 지연 시간 백분위
+
+        Returns:
+            지연 시간 (초), 샘플이 min_samples 미만이면 None
+        """
+        with self._lock:
+            samples = sorted(s for e in self.endpoints for s in e.latencies)
+        if len(samples) < min_samples:
+            return None
+        index = min(int(len(samples) * percentile / 100), len(samples) - 1)
+        return samples[index]
@@ -7,7 +7,11 @@ EXPERT_PROFILES = {
     "generic": {
         "name": "범용 전문가",
         "description_prompt": "",  # 기본 시스템 메시지만 사용
-        "review_prompt": ""
+        "review_prompt": "",
+        "risk_paths": [],
+        "exclude_paths": [],
+        "project_markers": [],
+        "file_paths": []
     },
     "unity": {
         "name": "Unity 2021.3 전문가",
@@ -25,7 +29,26 @@ EXPERT_PROFILES = {
 - MonoBehaviour 생명주기 관련 이슈를 식별합니다
 - C# 성능 안티패턴 (Boxing, string 연결 등)을 감지합니다
 - Unity API 사용법을 정확히 알고 있습니다
-- SerializeField, GetComponent 등의 올바른 사용을 검증합니다"""
+- SerializeField, GetComponent 등의 올바른 사용을 검증합니다""",
+        # 리뷰 우선순위를 높일 경로 패턴 (소문자, fnmatch)
+        "risk_paths": [
+            "*/managers/*", "*/core/*", "*/serialization/*", "*/savedata/*",
+            "*.shader", "*.compute", "*/plugins/*.cs"
+        ],
+        # 리뷰에서 제외할 경로 패턴 (생성 파일, 엔진 캐시, 패키지)
+        # "root:" 규칙은 프로젝트 루트 기준 경로로 비교 (Source/Library 같은 소스 폴더는 유지)
+        # Packages는 manifest.json과 임베디드 패키지 소스를 리뷰하도록 생성되는 lock 파일만 제외
+        # (레지스트리 패키지 캐시는 Library/PackageCache에 있음)
+        "exclude_paths": [
+            "*.meta", "root:Library/*", "root:Packages/packages-lock.json", "root:Temp/*",
+            "root:Logs/*", "root:obj/*", "root:UserSettings/*"
+        ],
+        # 프로젝트 루트를 찾는 표식 폴더 (이 폴더의 상위 폴더가 프로젝트 루트)
+        "project_markers": ["Assets", "ProjectSettings"],
+        # 배치별 프로필 라우팅에서 이 프로필로 리뷰할 파일 패턴 (소문자, fnmatch)
+        "file_paths": [
+            "*.cs", "*.shader", "*.compute", "*.cginc", "*.hlsl", "*.uss", "*.uxml", "*.asmdef"
+        ]
     },
     "unreal": {
         "name": "Unreal 5.7 전문가",
@@ -43,7 +66,19 @@ EXPERT_PROFILES = {
 - 일반적인 UE 버그 패턴 (GC 타이밍, Replicated 변수 동기화 등)을 식별합니다
 - C++ 성능 안티패턴 (불필요한 복사, 가상 함수 오버헤드 등)을 감지합니다
 - Unreal API 사용법과 베스트 프랙티스를 알고 있습니다
-- UFUNCTION, UPROPERTY 매크로의 올바른 사용을 검증합니다"""
+- UFUNCTION, UPROPERTY 매크로의 올바른 사용을 검증합니다""",
+        "risk_paths": [
+            "*.build.cs", "*.target.cs", "*/public/*.h", "*gamemode*", "*replicat*",
+            "*subsystem*", "*.usf"
+        ],
+        "exclude_paths": [
+            "*/Intermediate/*", "*/Binaries/*", "*/Saved/*", "*/DerivedDataCache/*",
+            "*.generated.h", "*.gen.cpp"
+        ],
+        "file_paths": [
+            "*.h", "*.hpp", "*.cpp", "*.inl", "*.build.cs", "*.target.cs", "*.usf", "*.ush",
+            "*.uproject", "*.uplugin"
+        ]
     }
 }
 
@@ -67,3 +102,27 @@ def get_prompt(profile_key: str, prompt_type: str) -> str:
     """
     profile = EXPERT_PROFILES.get(profile_key, EXPERT_PROFILES[DEFAULT_PROFILE])
     return profile.get(f"{prompt_type}_prompt", "")
+
+
+def get_risk_paths(profile_key: str) -> list:
+    """특정 프로필에서 리뷰 우선순위를 높일 경로 패턴 목록 반환"""
+    profile = EXPERT_PROFILES.get(profile_key, EXPERT_PROFILES[DEFAULT_PROFILE])
+    return list(profile.get("risk_paths", []))
+
+
+def get_exclude_paths(profile_key: str) -> list:
+    """특정 프로필에서 리뷰에서 제외할 경로 패턴 목록 반환"""
+    profile = EXPERT_PROFILES.get(profile_key, EXPERT_PROFILES[DEFAULT_PROFILE])
+    return list(profile.get("exclude_paths", []))
+
+
+def get_project_markers(profile_key: str) -> list:
+    """특정 프로필에서 프로젝트 루트를 찾는 표식 폴더 이름 목록 반환 ("root:" 제외 규칙용)"""
+    profile = EXPERT_PROFILES.get(profile_key, EXPERT_PROFILES[DEFAULT_PROFILE])
+    return list(profile.get("project_markers", []))
+
+
+def get_file_paths(profile_key: str) -> list:
+    """특정 프로필로 리뷰할 파일 패턴 목록 반환 (배치별 프로필 라우팅용)"""
+    profile = EXPERT_PROFILES.get(profile_key, EXPERT_PROFILES[DEFAULT_PROFILE])
+    return list(profile.get("file_paths", []))
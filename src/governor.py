@@ -0,0 +1,201 @@
+"""
+프로세스 간 동시 실행 제어 모듈
+여러 p4v_ai_assistant 프로세스가 동시에 실행될 때 p4 명령과 webhook 요청의
+동시 실행 수와 요청 속도를 머신 전체 기준으로 제한 (파일 잠금 기반)
+"""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator, List, Optional
+
+from .config_manager import get_config
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+
+# 대기 중 슬롯/대기열 확인 주기 (초)
+POLL_INTERVAL = 0.1
+
+
+def _try_lock(f: IO) -> bool:
+    """파일에 배타적 잠금 시도 (대기하지 않음)"""
+    try:
+        if os.name == "nt":
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        return False
+
+
+def _unlock(f: IO) -> None:
+    try:
+        if os.name == "nt":
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    except OSError:
+        pass
+
+
+@contextmanager
+def _file_mutex(path: Path) -> Iterator[None]:
+    """짧은 임계 구역용 파일 뮤텍스"""
+    with open(path, "a+") as f:
+        while not _try_lock(f):
+            time.sleep(POLL_INTERVAL / 10)
+        try:
+            yield
+        finally:
+            _unlock(f)
+
+
+class Governor:
+    """파일 잠금 기반 머신 전체 세마포어 + 토큰 버킷
+
+    - 슬롯: 자원별로 limit개의 슬롯 파일을 두고, 잠금에 성공한 프로세스만 실행
+    - 대기열: 대기자는 잠금을 건 대기 파일을 만들고 생성 순서대로 슬롯을 얻음 (FIFO).
+      대기 파일 잠금이 풀려 있으면 비정상 종료된 프로세스의 것으로 보고 정리
+    - 속도 제한: 분당 요청 수가 설정된 자원은 공유 토큰 버킷에서 토큰을 소비
+    """
+
+    def __init__(self, lock_dir: Path, settings: dict):
+        self.lock_dir = Path(lock_dir)
+        self.settings = settings
+
+    def _limit(self, resource: str) -> int:
+        return max(int(self.settings.get(f"max_concurrent_{resource}", 0) or 0), 0)
+
+    def _rate(self, resource: str) -> float:
+        return float(self.settings.get(f"{resource}_rate_per_minute", 0) or 0)
+
+    @contextmanager
+    def slot(self, resource: str) -> Iterator[None]:
+        """
+        자원 사용 슬롯 획득 (슬롯이 빌 때까지 대기)
+
+        Args:
+            resource: 자원 이름 ("p4", "webhook")
+        """
+        limit = self._limit(resource)
+        if not self.settings.get("enabled", True) or limit <= 0:
+            yield
+            return
+
+        slot_file = self._acquire_slot(resource, limit)
+        try:
+            self._take_token(resource)
+            yield
+        finally:
+            _unlock(slot_file)
+            slot_file.close()
+
+    def _acquire_slot(self, resource: str, limit: int) -> IO:
+        resource_dir = self.lock_dir / resource
+        queue_dir = resource_dir / "queue"
+        queue_dir.mkdir(parents=True, exist_ok=True)
+
+        # 대기열 등록 (파일 이름이 생성 순서)
+        ticket = queue_dir / f"{time.time_ns():020d}_{os.getpid()}_{threading.get_ident()}.q"
+        ticket_file = open(ticket, "w")
+        _try_lock(ticket_file)
+
+        try:
+            while True:
+                position = self._queue_position(queue_dir, ticket)
+                if position < limit:
+                    for k in range(limit):
+                        slot_file = open(resource_dir / f"slot_{k}.lock", "a+")
+                        if _try_lock(slot_file):
+                            return slot_file
+                        slot_file.close()
+                time.sleep(POLL_INTERVAL)
+        finally:
+            _unlock(ticket_file)
+            ticket_file.close()
+            try:
+                ticket.unlink()
+            except OSError:
+                pass
+
+    def _queue_position(self, queue_dir: Path, ticket: Path) -> int:
+        """대기열에서 내 순서 반환 (비정상 종료된 프로세스의 대기 파일은 정리)"""
+        alive: List[Path] = []
+        for entry in sorted(queue_dir.glob("*.q")):
+            if entry == ticket:
+                alive.append(entry)
+                break
+            if self._is_stale(entry):
+                try:
+                    entry.unlink()
+                except OSError:
+                    pass
+                continue
+            alive.append(entry)
+        return len(alive) - 1
+
+    @staticmethod
+    def _is_stale(entry: Path) -> bool:
+        """대기 파일 소유 프로세스가 종료되었는지 확인 (잠금을 얻을 수 있으면 종료된 것)"""
+        try:
+            with open(entry, "a+") as f:
+                if _try_lock(f):
+                    _unlock(f)
+                    return True
+        except OSError:
+            pass
+        return False
+
+    def _take_token(self, resource: str) -> None:
+        """공유 토큰 버킷에서 토큰 하나 소비 (없으면 채워질 때까지 대기)"""
+        rate = self._rate(resource)
+        if rate <= 0:
+            return
+
+        resource_dir = self.lock_dir / resource
+        bucket_path = resource_dir / "bucket.json"
+        capacity = max(rate / 60.0 * 10, 1.0)  # 최대 10초 분량까지 누적
+        while True:
+            with _file_mutex(resource_dir / "bucket.lock"):
+                try:
+                    with open(bucket_path, "r", encoding="utf-8") as f:
+                        bucket = json.load(f)
+                except (IOError, OSError, json.JSONDecodeError):
+                    bucket = {"tokens": capacity, "updated": time.time()}
+
+                now = time.time()
+                tokens = min(capacity, bucket["tokens"] + (now - bucket["updated"]) * rate / 60.0)
+                if tokens >= 1:
+                    tokens -= 1
+                    wait = 0.0
+                else:
+                    wait = (1 - tokens) * 60.0 / rate
+
+                with open(bucket_path, "w", encoding="utf-8") as f:
+                    json.dump({"tokens": tokens, "updated": now}, f)
+
+            if wait <= 0:
+                return
+            time.sleep(min(wait, 1.0))
+
+
+# 싱글톤 인스턴스
+_governor_instance: Optional[Governor] = None
+
+
+def get_governor() -> Governor:
+    """Governor 싱글톤 인스턴스 반환"""
+    global _governor_instance
+    if _governor_instance is None:
+        config = get_config()
+        _governor_instance = Governor(config.cache_dir / "locks", config.governor)
+    return _governor_instance
@@ -0,0 +1,161 @@
+"""
+hunk 단위 리뷰 결과 저장소
+같은 hunk가 pending CL, shelve, submitted CL에서 반복될 때 이전 리뷰 코멘트를 재사용
+"""
+import hashlib
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, List, Optional, Tuple
+
+from .batch_planner import hunk_new_range, split_diff_into_hunks
+from .config_manager import get_config
+from .p4_client import FileChange
+from .response_cache import ResponseCache
+
+
+# n8n 리뷰 프롬프트(워크플로우)를 바꾸면 올려서 이전 코멘트를 무효화
+PROMPT_VERSION = 1
+
+
+def review_scope(expert_profile: str, expert_context: str, routing: str = "") -> str:
+    """리뷰 결과가 유효한 범위의 해시 (프롬프트 버전, 전문가 프로필, 전문가 프롬프트, 프로필 라우팅)"""
+    scope = f"{PROMPT_VERSION}\n{expert_profile}\n{expert_context}"
+    if routing:
+        scope += f"\n{routing}"
+    return hashlib.sha256(scope.encode("utf-8")).hexdigest()
+
+
+def normalize_hunk(hunk: List[str]) -> str:
+    """hunk 본문 정규화 (라인 번호가 있는 @@ 헤더 제외, 라인 끝 공백/CR 제거)"""
+    return "\n".join(line.rstrip() for line in hunk[1:]).strip("\n")
+
+
+@dataclass
+class ReusedComments:
+    """파일 하나에서 저장소의 코멘트로 대체한 hunk"""
+    depot_path: str
+    # n8n 응답 형식의 코멘트 (line_number는 현재 diff 기준으로 보정됨)
+    comments: List[Dict[str, Any]] = field(default_factory=list)
+    # 같은 diff를 가진 다른 파일 (FileChange.shared_paths와 같은 리스트)
+    shared_paths: List[str] = field(default_factory=list)
+    hunks: int = 0
+    # 재사용한 hunk를 리뷰한 배치의 점수와 요약 (모든 hunk를 재사용했을 때 결과 점수/요약으로 사용)
+    scores: List[int] = field(default_factory=list)
+    summaries: List[str] = field(default_factory=list)
+
+
+class HunkStore:
+    """정규화 hunk 해시 + 전문가 프로필 + 프롬프트 버전을 키로 코멘트를 저장
+
+    코멘트 라인 번호는 hunk 시작 라인 기준 오프셋으로 저장하므로, 같은 hunk가 파일의
+    다른 위치에 나타나도 현재 라인 번호로 다시 붙일 수 있음
+    """
+
+    def __init__(self, cache: ResponseCache, expert_profile: str, expert_context: str, routing: str = ""):
+        """
+        Args:
+            cache: 엔트리를 저장할 디스크 캐시
+            expert_profile: 선택된 전문가 프로필 이름
+            expert_context: 리뷰 요청에 포함되는 전문가 프롬프트 (커스텀 프롬프트 포함)
+            routing: ProfileRouter.signature() (배치별 프로필 라우팅을 쓰지 않으면 빈 문자열)
+        """
+        self.cache = cache
+        self.scope = review_scope(expert_profile, expert_context, routing)
+
+    @classmethod
+    def from_config(cls, expert_context: str, routing: str = "") -> Optional["HunkStore"]:
+        """hunk_reuse 설정으로 생성 (비활성화되어 있으면 None)"""
+        config = get_config()
+        settings = config.hunk_reuse
+        if not settings.get("enabled", True):
+            return None
+        cache = ResponseCache(
+            cache_dir=config.cache_dir / "hunks",
+            ttl_seconds=int(settings.get("ttl_hours", 168) * 3600),
+            max_bytes=int(settings.get("max_size_mb", 20) * 1024 * 1024)
+        )
+        return cls(cache, config.expert_profile, expert_context, routing)
+
+    def key(self, hunk: List[str]) -> str:
+        """hunk 저장 키"""
+        return hashlib.sha256(f"{self.scope}\n{normalize_hunk(hunk)}".encode("utf-8")).hexdigest()
+
+    def split(self, file: FileChange) -> Tuple[Optional[FileChange], Optional[ReusedComments]]:
+        """
+        저장된 hunk를 diff에서 제거하고 코멘트를 현재 라인 번호로 보정
+
+        Args:
+            file: diff가 수집된 파일 (수정하지 않음)
+
+        Returns:
+            (전송할 파일 - 모든 hunk가 저장되어 있으면 None, 재사용한 코멘트 - 없으면 None)
+        """
+        header, hunks = split_diff_into_hunks(file.diff)
+        kept: List[List[str]] = []
+        reused = ReusedComments(depot_path=file.depot_path, shared_paths=file.shared_paths)
+        for hunk in hunks:
+            entry = self.cache.get(self.key(hunk))
+            line_range = hunk_new_range(hunk)
+            if entry is None or line_range is None:
+                kept.append(hunk)
+                continue
+            reused.hunks += 1
+            if isinstance(entry.get("overall_score"), int):
+                reused.scores.append(entry["overall_score"])
+            if entry.get("summary") and entry["summary"] not in reused.summaries:
+                reused.summaries.append(entry["summary"])
+            for comment in entry.get("comments", []):
+                comment = dict(comment)
+                comment["line_number"] = line_range[0] + comment.pop("offset", 0)
+                comment["file_path"] = file.depot_path
+                reused.comments.append(comment)
+
+        if not reused.hunks:
+            return file, None
+        if not kept:
+            return None, reused
+        diff = "\n".join(header + [line for hunk in kept for line in hunk])
+        return replace(file, diff=diff), reused
+
+    def remember(self, files: List[FileChange], response: Dict[str, Any]) -> None:
+        """
+        배치 응답의 코멘트를 hunk별로 저장 (코멘트가 없는 hunk도 "문제 없음"으로 저장)
+
+        배치 점수와 요약도 함께 저장하여, 모든 hunk를 재사용한 리뷰도 점수를 표시
+
+        hunk 범위 밖의 라인(파일 전체 코멘트 등)을 가리키는 코멘트가 있는 파일은
+        어느 hunk의 결과인지 알 수 없으므로 저장하지 않음
+        """
+        by_path: Dict[str, List[Dict[str, Any]]] = {}
+        for comment in response.get("comments", []):
+            by_path.setdefault(comment.get("file_path", ""), []).append(comment)
+
+        for f in files:
+            _, hunks = split_diff_into_hunks(f.diff)
+            ranges = [hunk_new_range(h) for h in hunks]
+            if not hunks or None in ranges:
+                continue
+
+            entries: List[List[Dict[str, Any]]] = [[] for _ in hunks]
+            assigned = True
+            for comment in by_path.get(f.depot_path, []):
+                line_number = comment.get("line_number")
+                index = next(
+                    (i for i, (start, end) in enumerate(ranges)
+                     if isinstance(line_number, int) and start <= line_number <= end),
+                    None
+                )
+                if index is None:
+                    assigned = False
+                    break
+                stored = {k: v for k, v in comment.items() if k not in ("file_path", "line_number")}
+                stored["offset"] = line_number - ranges[index][0]
+                entries[index].append(stored)
+            if not assigned:
+                continue
+
+            for hunk, comments in zip(hunks, entries):
+                self.cache.put(self.key(hunk), {
+                    "comments": comments,
+                    "overall_score": response.get("overall_score"),
+                    "summary": response.get("summary", "")
+                })
@@ -0,0 +1,153 @@
+"""
+AI 요청 지연 시간 모델
+과거 요청의 (페이로드 토큰 수, 응답 시간) 기록으로 선형 모델을 학습하여
+요청별 타임아웃과 리뷰 진행률/남은 시간(ETA) 추정에 사용
+"""
+import json
+import math
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .checkpoint import write_json_atomic
+from .config_manager import get_config
+
+
+# 보관할 최근 기록 수
+HISTORY_LIMIT = 200
+# 모델 학습에 필요한 최소 기록 수
+MIN_SAMPLES = 5
+
+
+class LatencyModel:
+    """요청 타입별 latency = intercept + slope * tokens 선형 회귀 모델"""
+
+    def __init__(self, history_file: Path):
+        self.history_file = Path(history_file)
+        self._lock = threading.Lock()
+        self._history: List[Dict] = []
+        self._fits: Dict[str, Optional[Tuple[float, float, float]]] = {}
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self.history_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, list):
+                self._history = data[-HISTORY_LIMIT:]
+        except (IOError, OSError, json.JSONDecodeError):
+            self._history = []
+
+    def record(self, tokens: int, latency: float, request_type: str) -> None:
+        """성공한 요청의 토큰 수와 응답 시간 기록"""
+        with self._lock:
+            self._history.append({
+                "tokens": tokens,
+                "latency": round(latency, 3),
+                "request_type": request_type
+            })
+            self._history = self._history[-HISTORY_LIMIT:]
+            self._fits.pop(request_type, None)
+            # 잠금 안에서 저장하여 늦게 기록한 내용이 먼저 기록한 내용에 덮어써지지 않도록 함
+            try:
+                write_json_atomic(self.history_file, self._history)
+            except (IOError, OSError):
+                pass
+
+    def _fit(self, request_type: str) -> Optional[Tuple[float, float, float]]:
+        """(intercept, slope, 잔차 표준편차) 반환, 기록이 부족하면 None"""
+        if request_type in self._fits:
+            return self._fits[request_type]
+
+        samples = [h for h in self._history if h.get("request_type") == request_type]
+        if len(samples) < MIN_SAMPLES:
+            samples = self._history
+        if len(samples) < MIN_SAMPLES:
+            self._fits[request_type] = None
+            return None
+
+        xs = [float(h["tokens"]) for h in samples]
+        ys = [float(h["latency"]) for h in samples]
+        n = len(xs)
+        mean_x = sum(xs) / n
+        mean_y = sum(ys) / n
+        var_x = sum((x - mean_x) ** 2 for x in xs)
+        slope = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / var_x if var_x else 0.0
+        if slope < 0:
+            # 토큰이 많을수록 빨라지는 모델은 의미가 없으므로 평균값 사용
+            slope = 0.0
+        intercept = mean_y - slope * mean_x
+        residuals = [y - (intercept + slope * x) for x, y in zip(xs, ys)]
+        std = math.sqrt(sum(r * r for r in residuals) / n)
+
+        fit = (intercept, slope, std)
+        self._fits[request_type] = fit
+        return fit
+
+    def predict(self, tokens: int, request_type: str = "review") -> Optional[float]:
+        """예상 응답 시간 (초), 기록이 부족하면 None"""
+        with self._lock:
+            fit = self._fit(request_type)
+        if fit is None:
+            return None
+        intercept, slope, _ = fit
+        return max(intercept + slope * tokens, 0.1)
+
+    def tokens_within(self, seconds: float, request_type: str = "review") -> Optional[int]:
+        """주어진 시간 안에 응답받을 수 있는 최대 페이로드 토큰 수, 기록이 부족하면 None"""
+        with self._lock:
+            fit = self._fit(request_type)
+        if fit is None:
+            return None
+        intercept, slope, std = fit
+        # 예측 오차를 고려해 표준편차만큼 여유를 둠
+        available = seconds - intercept - std
+        if available <= 0:
+            return 0
+        if slope <= 0:
+            return None  # 토큰 수와 무관하게 일정한 지연 -> 크기 제한 없음
+        return int(available / slope)
+
+    def timeout_for(
+        self,
+        tokens: int,
+        request_type: str,
+        default: float,
+        min_timeout: float,
+        max_timeout: float
+    ) -> float:
+        """
+        요청별 타임아웃 계산
+
+        예상 시간의 2배 + 잔차 표준편차의 3배를 [min_timeout, max_timeout] 범위로 제한.
+        기록이 부족하면 default 사용
+
+        Args:
+            tokens: 페이로드 토큰 수
+            request_type: 요청 타입 (description, review)
+            default: 모델이 없을 때 사용할 타임아웃
+            min_timeout: 최소 타임아웃
+            max_timeout: 최대 타임아웃
+
+        Returns:
+            타임아웃 (초)
+        """
+        with self._lock:
+            fit = self._fit(request_type)
+        if fit is None:
+            return default
+        intercept, slope, std = fit
+        predicted = max(intercept + slope * tokens, 0.1)
+        return min(max(predicted * 2 + std * 3, min_timeout), max_timeout)
+
+
+# 싱글톤 인스턴스
+_model_instance: Optional[LatencyModel] = None
+
+
+def get_latency_model() -> LatencyModel:
+    """LatencyModel 싱글톤 인스턴스 반환"""
+    global _model_instance
+    if _model_instance is None:
+        _model_instance = LatencyModel(get_config().cache_dir / "latency_history.json")
+    return _model_instance
@@ -10,7 +10,7 @@ import threading
 from . import __version__
 from .config_manager import get_config
 from .commands.description import run_description_command
-from .commands.review import run_review_command, ReviewResult
+from .commands.review import run_review_command, run_review_retry, ReviewResult
 from .commands.install import install_tool, uninstall_tool
 from .p4_client import P4Client
 from .ui.dialogs import (
@@ -26,9 +26,9 @@ def cmd_description(args):
     """AI Description 생성 명령"""
     config = get_config()
 
-    # 설정 확인
-    webhook_url = args.webhook_url or config.webhook_url
-    if not webhook_url:
+    # 설정 확인 (--webhook-url이 없으면 설정 파일의 엔드포인트 목록 사용)
+    webhook_url = args.webhook_url or ""
+    if not (webhook_url or config.is_configured()):
         show_error(
             "설정 오류",
             "Webhook URL이 설정되지 않았습니다.\n"
@@ -63,6 +63,7 @@ def cmd_description(args):
                 client=client,
                 webhook_url=webhook_url,
                 auto_apply=False,  # 사용자가 버튼으로 결정
+                use_cache=not args.no_cache,
                 progress_callback=dialog.update_status
             )
 
@@ -91,9 +92,9 @@ def cmd_review(args):
     """AI 코드 리뷰 명령"""
     config = get_config()
 
-    # 설정 확인
-    webhook_url = args.webhook_url or config.webhook_url
-    if not webhook_url:
+    # 설정 확인 (--webhook-url이 없으면 설정 파일의 엔드포인트 목록 사용)
+    webhook_url = args.webhook_url or ""
+    if not (webhook_url or config.is_configured()):
         show_error(
             "설정 오류",
             "Webhook URL이 설정되지 않았습니다.\n"
@@ -106,10 +107,32 @@ def cmd_review(args):
     user = args.user or ""
     client = args.client or ""
 
+    # 실패 배치 재시도 콜백 함수
+    def retry_callback(previous: ReviewResult):
+        def retry_task():
+            try:
+                result = run_review_retry(
+                    previous,
+                    port=port,
+                    user=user,
+                    client=client,
+                    webhook_url=webhook_url,
+                    use_cache=not args.no_cache,
+                    progress_callback=dialog.update_status,
+                    eta_callback=dialog.update_progress
+                )
+                dialog.show_result(result)
+            except Exception as e:
+                error_result = ReviewResult(success=False, error=str(e))
+                dialog.show_result(error_result)
+
+        threading.Thread(target=retry_task, daemon=True).start()
+
     # 리뷰 다이얼로그 생성
     dialog = ReviewDialog(
         title="AI 코드 리뷰",
-        changelist=args.changelist
+        changelist=args.changelist,
+        on_retry_callback=retry_callback
     )
 
     # 백그라운드 작업
@@ -121,7 +144,12 @@ def cmd_review(args):
                 user=user,
                 client=client,
                 webhook_url=webhook_url,
-                progress_callback=dialog.update_status
+                use_cache=not args.no_cache,
+                resume=args.resume,
+                progress_callback=dialog.update_status,
+                eta_callback=dialog.update_progress,
+                deadline=args.deadline,
+                incremental=args.incremental
             )
             dialog.show_result(result)
         except Exception as e:
@@ -149,6 +177,7 @@ def cmd_test(args):
     config = get_config()
     print(f"Config file: {config.config_file}")
     print(f"Webhook URL: {config.webhook_url}")
+    print(f"Webhook endpoints: {len(config.webhook_urls)}")
     print(f"Timeout: {config.timeout}")
     print(f"Is configured: {config.is_configured()}")
     return 0
@@ -223,6 +252,11 @@ def main():
         action="store_true",
         help="생성된 description을 자동으로 적용하지 않음"
     )
+    desc_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="응답 캐시와 diff 스냅샷을 사용하지 않고 항상 새로 수집/요청"
+    )
     desc_parser.set_defaults(func=cmd_description)
 
     # review 명령
@@ -253,6 +287,27 @@ def main():
         "--webhook-url",
         help="n8n Webhook URL (설정 파일 대신 사용)"
     )
+    review_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="응답 캐시와 diff 스냅샷을 사용하지 않고 항상 새로 수집/요청"
+    )
+    review_parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="중단된 리뷰를 체크포인트에서 이어서 진행 (완료된 배치는 재요청하지 않음)"
+    )
+    review_parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="마지막 리뷰 이후 diff가 바뀐 파일만 다시 리뷰하고 나머지는 이전 코멘트를 유지"
+    )
+    review_parser.add_argument(
+        "--deadline",
+        type=float,
+        metavar="SECONDS",
+        help="마감 시간(초) 안에 위험도가 높은 파일부터 리뷰하고 완료된 결과와 리뷰 범위를 표시"
+    )
     review_parser.set_defaults(func=cmd_review)
 
     # settings 명령
@@ -2,42 +2,102 @@
 n8n Webhook HTTP 클라이언트
 AI Description 생성 및 코드 리뷰 요청
 """
+import json
+import queue
+import threading
+import time
 import requests
-from typing import Dict, Any, Optional
-from dataclasses import asdict
+from typing import Dict, Any, List, Optional, Set
 
 from .p4_client import ChangelistInfo
 from .config_manager import get_config
+from .batch_planner import estimate_tokens
+from .context_registry import UNKNOWN_CONTEXT_ERROR, ContextRegistry, expert_context_id
+from .endpoint_pool import Endpoint, EndpointPool
+from .governor import get_governor
+from .latency_model import get_latency_model
+from .payload_compactor import CompactionReport, compact_payload
+from .payload_layout import stabilize_payload
+from .response_cache import ResponseCache, make_cache_key
+
+
+# hedged 요청에서 요청 타임아웃을 넘겨도 응답을 기다리는 여유 시간 (초, 동시 실행 제한 대기 등)
+HEDGE_GRACE_SECONDS = 30.0
 
 
 class N8NClient:
-    def __init__(self, webhook_url: Optional[str] = None, timeout: Optional[int] = None):
+    def __init__(
+        self,
+        webhook_url: Optional[str] = None,
+        timeout: Optional[int] = None,
+        use_cache: bool = True
+    ):
         config = get_config()
-        self.webhook_url = webhook_url or config.webhook_url
+        # webhook_url을 직접 지정하면 해당 엔드포인트만 사용, 아니면 설정의 엔드포인트 목록 사용
+        self.pool = EndpointPool([webhook_url] if webhook_url else config.webhook_urls)
+        self.webhook_url = self.pool.endpoints[0].url if self.pool.endpoints else ""
         self.timeout = timeout if timeout is not None else config.timeout
+        self.hedging = config.hedging
+
+        # 지연 시간 모델 기반 요청별 타임아웃 (timeout을 직접 지정하면 고정 타임아웃 사용)
+        self.adaptive_timeout = config.adaptive_timeout if timeout is None else {"enabled": False}
+        self.latency_model = get_latency_model()
+
+        # 마감 시각 (time.time() 기준, 설정되면 요청 타임아웃을 남은 시간으로 제한)
+        self.deadline: Optional[float] = None
+
+        # 페이로드 압축 (요청별 / 누적 절감량)
+        self.compaction = config.payload_compaction
+        # 고정 prefix 배치 (프롬프트 prefix 캐시용)
+        self.layout = config.payload_layout
+        # 전문가 컨텍스트 등록 (등록된 엔드포인트에는 ID만 전송)
+        self.handshake = config.context_handshake
+        self.contexts = ContextRegistry()
+        self.last_compaction: Optional[CompactionReport] = None
+        self.total_compaction = CompactionReport()
+        # Description map 단계는 여러 스레드에서 동시에 요청
+        self._compaction_lock = threading.Lock()
+
+        # 응답 캐시 (설정에서 비활성화했거나 use_cache=False면 우회)
+        cache_settings = config.response_cache
+        self.cache: Optional[ResponseCache] = None
+        if use_cache and cache_settings.get("enabled", True):
+            self.cache = ResponseCache(
+                cache_dir=config.cache_dir / "responses",
+                ttl_seconds=int(cache_settings.get("ttl_hours", 24) * 3600),
+                max_bytes=int(cache_settings.get("max_size_mb", 50) * 1024 * 1024)
+            )
 
     def _prepare_payload(
         self,
         changelist_info: ChangelistInfo,
         request_type: str,
-        batch_info: Optional[Dict[str, int]] = None
+        batch_info: Optional[Dict[str, int]] = None,
+        profile: Optional[str] = None
     ) -> Dict[str, Any]:
-        """API 요청 페이로드 생성"""
+        """API 요청 페이로드 생성 (profile: 이 요청에 쓸 전문가 프로필, None이면 설정된 프로필)"""
         files_data = []
         for f in changelist_info.files:
-            files_data.append({
+            file_data = {
                 "depot_path": f.depot_path,
                 "action": f.action,
                 "file_type": f.file_type,
                 "revision": f.revision,
                 "diff": f.diff,
                 "content": ""
-            })
+            }
+            # 대용량 파일 분할 전송 시 부분 정보 (라인 번호는 원본 파일 기준)
+            if f.part_info:
+                file_data["part"] = f.part_info
+            # 같은 diff를 가진 다른 파일 경로 (diff는 한 번만 전송)
+            if f.shared_paths:
+                file_data["shared_paths"] = f.shared_paths
+            files_data.append(file_data)
 
         # 전문가 컨텍스트 가져오기
-        expert_context = self._get_expert_context(request_type)
+        expert_context = self._get_expert_context(request_type, profile)
 
-        return {
+        payload = {
             "request_type": request_type,
             "changelist": {
                 "number": changelist_info.number,
@@ -53,11 +113,28 @@ class N8NClient:
             "expert_context": expert_context
         }
 
-    def _get_expert_context(self, request_type: str) -> str:
-        """설정된 전문가 프로필의 컨텍스트 반환
+        # 줄바꿈/끝 공백 정리, 공백만 바뀐 hunk와 중복 헤더/빈 필드 제거
+        if self.compaction.get("enabled", True):
+            report = compact_payload(payload, self.compaction.get("drop_whitespace_hunks", True))
+            with self._compaction_lock:
+                self.last_compaction = report
+                self.total_compaction.add(report)
+
+        if expert_context and self.handshake.get("enabled", True):
+            payload["expert_context_id"] = expert_context_id(expert_context)
+
+        # 바뀌지 않는 전문가 프롬프트/CL 정보를 앞쪽에 같은 바이트로 배치
+        if self.layout.get("stable_prefix", True):
+            payload = stabilize_payload(payload)
+
+        return payload
+
+    def _get_expert_context(self, request_type: str, profile: Optional[str] = None) -> str:
+        """전문가 프로필의 컨텍스트 반환
 
         Args:
             request_type: 요청 타입 (description, review)
+            profile: 프로필 키 (None이면 설정된 프로필)
 
         Returns:
             전문가 컨텍스트 문자열 (없으면 빈 문자열)
@@ -71,33 +148,265 @@ class N8NClient:
             return custom
 
         # 프로필 기본 프롬프트 사용
-        profile = EXPERT_PROFILES.get(config.expert_profile, EXPERT_PROFILES["generic"])
-        return profile.get(f"{request_type}_prompt", "")
+        settings = EXPERT_PROFILES.get(profile or config.expert_profile, EXPERT_PROFILES["generic"])
+        return settings.get(f"{request_type}_prompt", "")
 
-    def request_description(self, changelist_info: ChangelistInfo) -> Dict[str, Any]:
-        """AI Description 생성 요청"""
-        payload = self._prepare_payload(changelist_info, "description")
+    def request_description(
+        self,
+        changelist_info: ChangelistInfo,
+        batch_info: Optional[Dict[str, int]] = None,
+        partial_descriptions: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        """
+        AI Description 생성 요청
+
+        Args:
+            changelist_info: Changelist 정보 (files에 요청할 파일)
+            batch_info: 대용량 CL을 나누어 요약할 때 배치 번호 (map 단계)
+            partial_descriptions: 배치별 요약 [{"files": [경로], "description": 요약}] (reduce 단계,
+                changelist_info.files는 diff 없이 경로만 전송)
+        """
+        payload = self._prepare_payload(changelist_info, "description", batch_info)
+        if partial_descriptions is not None:
+            payload["description_stage"] = "reduce"
+            payload["partial_descriptions"] = partial_descriptions
+        elif batch_info is not None:
+            payload["description_stage"] = "map"
         return self._send_request(payload)
 
     def request_review(
         self,
         changelist_info: ChangelistInfo,
-        batch_info: Optional[Dict[str, int]] = None
+        batch_info: Optional[Dict[str, int]] = None,
+        asset_summary: Optional[Dict[str, Any]] = None,
+        profile: Optional[str] = None
     ) -> Dict[str, Any]:
-        """AI 코드 리뷰 요청"""
-        payload = self._prepare_payload(changelist_info, "review", batch_info)
+        """AI 코드 리뷰 요청 (asset_summary: diff 없이 요약으로 보내는 에셋 변경, profile: 배치의 전문가 프로필)"""
+        payload = self._prepare_payload(changelist_info, "review", batch_info, profile)
+        if asset_summary:
+            payload["asset_summary"] = asset_summary
         return self._send_request(payload)
 
     def _send_request(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        """HTTP POST 요청 전송"""
-        if not self.webhook_url:
+        """요청 전송 (캐시 적중 시 HTTP 요청 생략)"""
+        if self.cache is None:
+            return self._post_request(payload)
+
+        cache_key = make_cache_key(payload)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        result = self._post_request(payload)
+        self.cache.put(cache_key, result)
+        return result
+
+    def _post_request(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """엔드포인트 풀을 통해 요청 전송 (장애 전환, hedged 요청 처리)"""
+        if not self.pool.endpoints:
             raise N8NError("Webhook URL이 설정되지 않았습니다.")
 
+        if self.hedging.get("enabled", False) and len(self.pool) > 1:
+            return self._post_hedged(payload)
+        return self._post_with_failover(payload)
+
+    def _post_with_failover(
+        self,
+        payload: Dict[str, Any],
+        tried: Optional[Set[str]] = None
+    ) -> Dict[str, Any]:
+        """일시적 오류가 나면 아직 시도하지 않은 다른 엔드포인트로 전환하여 재전송"""
+        tried = set(tried or ())
+        last_error: Optional[N8NError] = None
+        while True:
+            endpoint = self.pool.acquire(exclude=tried)
+            if endpoint is None:
+                raise last_error or N8NError("사용 가능한 Webhook 엔드포인트가 없습니다.", transient=True)
+            tried.add(endpoint.url)
+            try:
+                return self._post_to(endpoint, payload)
+            except N8NError as e:
+                if not e.transient:
+                    raise
+                last_error = e
+
+    def _post_hedged(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        hedged 요청 전송
+
+        첫 엔드포인트 응답이 최근 지연 시간 백분위를 넘기면 두 번째 엔드포인트로 같은 요청을
+        보내고, 먼저 성공한 응답을 사용. 늦은 요청은 세션을 닫아 취소하고 결과는 버림.
+        마지막 요청의 타임아웃(마감 모드면 마감 시각)까지 응답이 없으면 일시적 오류로 처리
+        """
+        results: "queue.Queue" = queue.Queue()
+        cancel_events = []
+        timeout = self.request_timeout(self.estimate_payload_tokens(payload), payload.get("request_type", ""))
+        give_up_at = 0.0
+
+        def launch(endpoint: Endpoint) -> None:
+            nonlocal give_up_at
+            cancel_event = threading.Event()
+            cancel_events.append(cancel_event)
+
+            def run() -> None:
+                try:
+                    results.put((endpoint, self._post_to(endpoint, payload, cancel_event), None))
+                except N8NError as e:
+                    results.put((endpoint, None, e))
+                except Exception as e:
+                    # 잠금 파일 오류 등도 결과로 전달해야 대기 중인 호출자가 멈추지 않음
+                    results.put((endpoint, None, N8NError(str(e))))
+
+            threading.Thread(target=run, daemon=True).start()
+            give_up_at = time.time() + timeout + HEDGE_GRACE_SECONDS
+            if self.deadline is not None:
+                give_up_at = min(give_up_at, self.deadline)
+
+        first = self.pool.acquire()
+        launch(first)
+        tried = {first.url}
+        in_flight = 1
+
+        hedge_delay = self.pool.latency_percentile(float(self.hedging.get("percentile", 90)))
+        if hedge_delay is None:
+            hedge_delay = float(self.hedging.get("initial_delay", 20.0))
+
+        hedged = False
+        last_error: Optional[N8NError] = None
+        try:
+            while in_flight:
+                remaining = max(give_up_at - time.time(), 0.0)
+                try:
+                    wait = min(hedge_delay, remaining) if not hedged else remaining
+                    endpoint, result, error = results.get(timeout=wait)
+                except queue.Empty:
+                    if hedged or remaining <= hedge_delay:
+                        raise N8NError(f"요청 시간 초과 ({timeout:.0f}초)", transient=True)
+                    # 첫 요청이 지연 → 다른 엔드포인트로 hedged 요청
+                    hedged = True
+                    second = self.pool.acquire(exclude=tried)
+                    if second is not None:
+                        tried.add(second.url)
+                        launch(second)
+                        in_flight += 1
+                    continue
+
+                in_flight -= 1
+                if error is None:
+                    return result
+                if not error.transient:
+                    raise error
+                last_error = error
+        finally:
+            # 남은 요청 취소 (이미 끝난 요청은 세션 정리만 수행)
+            for cancel_event in cancel_events:
+                cancel_event.set()
+
+        # 모든 hedged 요청이 일시적 오류로 실패 → 남은 엔드포인트로 장애 전환
+        try:
+            return self._post_with_failover(payload, tried)
+        except N8NError:
+            raise last_error
+
+    def estimate_payload_tokens(self, payload: Dict[str, Any]) -> int:
+        """페이로드 전체의 토큰 수 추정"""
+        return estimate_tokens(json.dumps(payload, ensure_ascii=False))
+
+    def request_timeout(self, tokens: int, request_type: str) -> float:
+        """페이로드 크기에 따른 요청 타임아웃 (초)"""
+        if not self.adaptive_timeout.get("enabled", True):
+            return self.timeout
+        return self.latency_model.timeout_for(
+            tokens,
+            request_type,
+            default=self.timeout,
+            min_timeout=float(self.adaptive_timeout.get("min_timeout", 15)),
+            max_timeout=float(self.adaptive_timeout.get("max_timeout", 600))
+        )
+
+    def _post_to(
+        self,
+        endpoint: Endpoint,
+        payload: Dict[str, Any],
+        cancel_event: Optional[threading.Event] = None
+    ) -> Dict[str, Any]:
+        """단일 엔드포인트로 HTTP POST 요청 전송 (엔드포인트 상태, 지연 시간 기록 포함)"""
+        request_type = payload.get("request_type", "")
+        tokens = self.estimate_payload_tokens(payload)
+        started = time.time()
+        success: Optional[bool] = False
+        session = requests.Session()
+        watcher = None
+        if cancel_event is not None:
+            # 취소 신호가 오면 세션을 닫아 연결 정리
+            def watch() -> None:
+                cancel_event.wait()
+                session.close()
+
+            watcher = threading.Thread(target=watch, daemon=True)
+            watcher.start()
+
+        try:
+            # 여러 프로세스의 webhook 동시 요청 수/속도 제한 (대기 시간은 지연에 포함하지 않음)
+            with get_governor().slot("webhook"):
+                started = time.time()
+                timeout = self.request_timeout(tokens, request_type)
+                if self.deadline is not None:
+                    timeout = min(timeout, self.deadline - started)
+                    if timeout <= 0:
+                        raise N8NError("마감 시간이 지나 요청하지 않았습니다.")
+                result = self._post_with_context(session, endpoint.url, payload, timeout)
+            success = True
+            self.latency_model.record(tokens, time.time() - started, request_type)
+            return result
+        except N8NError as e:
+            if self.deadline is not None and time.time() >= self.deadline:
+                success = None  # 마감으로 잘린 요청은 엔드포인트 장애로 보지 않음
+                if e.transient:
+                    raise N8NError("마감 시간 내에 응답을 받지 못했습니다.") from e
+                raise
+            if cancel_event is not None and cancel_event.is_set():
+                success = None  # 취소된 요청은 엔드포인트 장애로 보지 않음
+            elif not e.transient:
+                success = True  # 요청 내용 문제는 엔드포인트 상태와 무관
+            raise
+        finally:
+            self.pool.release(endpoint, time.time() - started, success)
+            if cancel_event is None:
+                session.close()
+
+    def _post_with_context(
+        self,
+        session: requests.Session,
+        url: str,
+        payload: Dict[str, Any],
+        timeout: float
+    ) -> Dict[str, Any]:
+        """전문가 컨텍스트가 등록된 엔드포인트에는 ID만 보내고, 서버가 ID를 모르면 전문으로 재전송"""
+        body = self.contexts.reference(url, payload)
         try:
-            response = requests.post(
-                self.webhook_url,
+            result = self._post(session, url, body, timeout)
+        except N8NError as e:
+            if e.code != UNKNOWN_CONTEXT_ERROR or body is payload:
+                raise
+            self.contexts.forget(url, payload)
+            result = self._post(session, url, payload, timeout)
+        self.contexts.acknowledge(url, payload, result)
+        return result
+
+    def _post(
+        self,
+        session: requests.Session,
+        url: str,
+        payload: Dict[str, Any],
+        timeout: float
+    ) -> Dict[str, Any]:
+        """HTTP POST 요청 전송"""
+        try:
+            response = session.post(
+                url,
                 json=payload,
-                timeout=self.timeout,
+                timeout=timeout,
                 headers={"Content-Type": "application/json"}
             )
             response.raise_for_status()
@@ -110,16 +419,18 @@ class N8NClient:
 
             if not result.get("success", False):
                 error_msg = result.get("error", "알 수 없는 오류가 발생했습니다.")
-                raise N8NError(error_msg)
+                raise N8NError(error_msg, code=result.get("error_code", ""))
 
             return result
 
         except requests.exceptions.Timeout:
-            raise N8NError(f"요청 시간 초과 ({self.timeout}초)")
+            raise N8NError(f"요청 시간 초과 ({timeout:.0f}초)", transient=True)
         except requests.exceptions.ConnectionError:
-            raise N8NError("서버에 연결할 수 없습니다.")
+            raise N8NError("서버에 연결할 수 없습니다.", transient=True)
         except requests.exceptions.HTTPError as e:
-            raise N8NError(f"HTTP 오류: {e.response.status_code}")
+            status = e.response.status_code
+            # 5xx, 429(Too Many Requests)는 일시적 오류로 간주
+            raise N8NError(f"HTTP 오류: {status}", transient=status >= 500 or status == 429)
         except requests.exceptions.JSONDecodeError:
             raise N8NError("응답을 JSON으로 파싱할 수 없습니다.")
         except Exception as e:
@@ -129,5 +440,14 @@ class N8NClient:
 
 
 class N8NError(Exception):
-    """n8n 관련 에러"""
-    pass
+    """n8n 관련 에러
+
+    Attributes:
+        transient: 재시도하면 성공할 수 있는 일시적 오류 여부 (타임아웃, 연결 실패, 5xx 등)
+        code: 서버 응답의 error_code (없으면 빈 문자열)
+    """
+
+    def __init__(self, message: str = "", transient: bool = False, code: str = ""):
+        super().__init__(message)
+        self.transient = transient
+        self.code = code
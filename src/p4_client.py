@@ -2,10 +2,24 @@
 Perforce 명령어 래퍼 모듈
 p4 CLI를 통해 Changelist 정보 수집
 """
+import os
 import subprocess
 import re
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional
+
+from .governor import get_governor
+from .unity_yaml import HUNK_HEADER_PATTERN, compact_unity_yaml_diff, is_unity_yaml
+
+# 대용량 diff 요약에 남길 최대 hunk 헤더 수
+SUMMARY_MAX_HUNKS = 30
+
+# p4 fstat 한 번에 조회할 파일 수 (명령줄 길이 제한)
+FSTAT_CHUNK_SIZE = 50
+
+# 수집한 diff 대신 들어가는 텍스트의 접두사 (스냅샷에 원본 diff로 저장하지 않음)
+DIFF_SUMMARY_PREFIX = "(대용량 diff 요약"
+DIFF_ERROR_PREFIX = "(diff 실패"
 
 
 @dataclass
@@ -20,6 +34,57 @@ class FileChange:
     # 전체 소스 뷰용 필드 (향후 사용)
     original_content: str = ""  # 이전 버전 전체 내용
     new_content: str = ""       # 변경 후 전체 내용
+    # 대용량 파일을 hunk 단위로 나눠 보낼 때의 분할 정보
+    # 예: {"index": 1, "total": 3, "line_start": 1, "line_end": 850}
+    part_info: Optional[Dict[str, int]] = None
+    # diff가 같아서 이 파일 대신 함께 리뷰되는 다른 파일 경로 (코멘트를 복제해 붙임)
+    shared_paths: List[str] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class FetchProfile:
+    """명령별 diff 수집 범위
+
+    Attributes:
+        full_context: diff_full(context 10000줄) 수집 여부 (리포트 전체 소스 보기, 함수 단위 context용)
+        summarize_over: diff가 이 바이트 수를 넘으면 라인 통계와 hunk 위치 요약으로 대체 (0이면 대체하지 않음)
+        short_context: diff(context 3줄) 수집 여부 (False면 이미 채워진 diff를 유지하고 diff_full만 수집)
+    """
+    full_context: bool = True
+    summarize_over: int = 0
+    short_context: bool = True
+
+
+# 리뷰: 변경사항 diff + 전체 소스 diff
+FETCH_REVIEW = FetchProfile()
+# Description: 요청에 보내는 변경사항 diff만
+FETCH_DESCRIPTION = FetchProfile(full_context=False)
+
+
+def summarize_diff(diff: str) -> str:
+    """대용량 diff를 추가/삭제 라인 수와 hunk 위치(함수 시그니처 포함) 목록으로 요약"""
+    added = removed = 0
+    headers: List[str] = []
+    for line in diff.split("\n"):
+        if HUNK_HEADER_PATTERN.match(line):
+            headers.append(line)
+        elif line.startswith("+") and not line.startswith("+++"):
+            added += 1
+        elif line.startswith("-") and not line.startswith("---"):
+            removed += 1
+
+    # hunk 헤더는 들여써서 diff hunk로 해석되지 않게 함
+    lines = [f"{DIFF_SUMMARY_PREFIX}: +{added} / -{removed} 라인, hunk {len(headers)}개)"]
+    lines.extend(f"  {header}" for header in headers[:SUMMARY_MAX_HUNKS])
+    if len(headers) > SUMMARY_MAX_HUNKS:
+        lines.append(f"  (hunk {len(headers) - SUMMARY_MAX_HUNKS}개 생략)")
+    return "\n".join(lines)
+
+
+def apply_fetch_profile(file_change: FileChange, profile: FetchProfile) -> None:
+    """profile.summarize_over를 넘는 diff를 통계 요약으로 대체 (in-place)"""
+    if profile.summarize_over and len(file_change.diff.encode("utf-8")) > profile.summarize_over:
+        file_change.diff = summarize_diff(file_change.diff)
 
 
 @dataclass
@@ -55,13 +120,15 @@ class P4Client:
         """p4 명령어 실행"""
         cmd = self._build_cmd(*args)
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                encoding="utf-8",
-                errors="replace"
-            )
+            # 여러 프로세스가 동시에 p4 서버에 부하를 주지 않도록 머신 전체 동시 실행 수 제한
+            with get_governor().slot("p4"):
+                result = subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    text=True,
+                    encoding="utf-8",
+                    errors="replace"
+                )
             if result.returncode != 0 and result.stderr:
                 raise P4Error(f"p4 명령 실패: {result.stderr}")
             return result.stdout
@@ -73,54 +140,170 @@ class P4Client:
         output = self._run("describe", "-s", str(changelist))
         return self._parse_describe(output, changelist)
 
-    def get_changelist_with_diff(self, changelist: int) -> ChangelistInfo:
-        """Changelist 정보와 diff 조회 (변경사항만 + 전체소스 두 버전)"""
+    def get_changelist_with_diff(self, changelist: int, profile: FetchProfile = FETCH_REVIEW) -> ChangelistInfo:
+        """Changelist 정보와 diff 조회 (변경사항만 + profile.full_context면 전체소스)"""
         # 먼저 기본 정보 조회
         output = self._run("describe", "-s", str(changelist))
         info = self._parse_describe(output, changelist)
 
         # pending CL인 경우 p4 diff로 diff 수집
         if info.status == "pending":
-            self._collect_pending_diffs(info, changelist)
+            self._collect_pending_diffs(info, changelist, profile)
         else:
             # submitted CL인 경우 두 가지 버전 diff 수집
             # 1. 변경사항만 (context 3줄)
             output_short = self._run("describe", "-du", str(changelist))
             info = self._parse_describe_with_diff(output_short, changelist)
             # 2. 전체 소스 (context 10000줄)
-            output_full = self._run("describe", "-du10000", str(changelist))
-            self._parse_describe_with_diff_full(output_full, info)
+            if profile.full_context:
+                output_full = self._run("describe", "-du10000", str(changelist))
+                self._parse_describe_with_diff_full(output_full, info)
+            for file_change in info.files:
+                apply_fetch_profile(file_change, profile)
 
         return info
 
-    def _collect_pending_diffs(self, info: ChangelistInfo, changelist: int) -> None:
-        """Pending changelist의 파일별 diff 수집 (변경사항만 + 전체소스 두 버전)"""
+    def iter_diffs(self, info: ChangelistInfo, profile: FetchProfile = FETCH_REVIEW) -> Iterator[FileChange]:
+        """
+        Changelist 파일별 diff를 수집하면서 하나씩 반환 (in-place로 채움)
+
+        pending CL은 파일 단위로 p4 diff를 실행하므로 수집이 끝난 파일부터 바로 반환하고,
+        submitted CL은 p4 describe 한 번으로 전체 diff를 받은 뒤 순서대로 반환
+
+        Args:
+            info: get_changelist_info()로 조회한 Changelist 정보
+            profile: 수집 범위 (FETCH_DESCRIPTION은 diff_full을 수집하지 않음)
+
+        Yields:
+            diff(와 profile.full_context면 diff_full)가 채워진 FileChange
+        """
+        if info.status == "pending":
+            for file_change in info.files:
+                self._collect_pending_diff(file_change, info.number, profile)
+                yield file_change
+            return
+
+        short_diffs: Dict[str, str] = {}
+        if profile.short_context:
+            output_short = self._run("describe", "-du", str(info.number))
+            short_info = self._parse_describe_with_diff(output_short, info.number)
+            short_diffs = {f.depot_path: f.diff for f in short_info.files}
+        if profile.full_context:
+            output_full = self._run("describe", "-du10000", str(info.number))
+            self._parse_describe_with_diff_full(output_full, info)
+
         for file_change in info.files:
+            if profile.short_context:
+                file_change.diff = short_diffs.get(file_change.depot_path, "")
+                apply_fetch_profile(file_change, profile)
+            yield file_change
+
+    def get_file_fingerprints(self, info: ChangelistInfo) -> Dict[str, str]:
+        """
+        파일별 변경 지문 (이전에 수집한 diff를 그대로 쓸 수 있는지 판단용)
+
+        submitted CL은 내용이 바뀌지 않으므로 action#revision,
+        pending CL은 p4 fstat의 action/haveRev와 로컬 파일 크기/수정 시각
+
+        Returns:
+            depot_path -> 지문 (조회하지 못한 파일은 포함하지 않음)
+        """
+        if info.status != "pending":
+            return {f.depot_path: f"{f.action}#{f.revision}" for f in info.files}
+
+        fingerprints: Dict[str, str] = {}
+        specs = [f.depot_path for f in info.files]
+        for fields in self._fstat_chunks(specs, "-T", "depotFile,clientFile,haveRev,action"):
             try:
-                # action에 따라 다르게 처리
-                if file_change.action in ("add", "branch", "move/add"):
-                    # 새 파일은 전체 내용을 diff로 표시 (두 버전 동일)
-                    diff = self._get_new_file_content(file_change.depot_path, changelist)
+                stat = os.stat(fields.get("clientFile", ""))
+                local = f"{stat.st_size}:{stat.st_mtime_ns}"
+            except OSError:
+                local = "missing"
+            fingerprints[fields["depotFile"]] = f"{fields.get('action', '')}#{fields.get('haveRev', '')}:{local}"
+        return fingerprints
+
+    def _fstat_chunks(self, specs: List[str], *options: str) -> Iterator[Dict[str, str]]:
+        """
+        p4 -ztag fstat 결과를 파일별 필드로 반환
+
+        명령줄 길이 제한을 넘지 않도록 FSTAT_CHUNK_SIZE개씩 나눠서 조회하고,
+        실패한 묶음은 건너뜀
+
+        Args:
+            specs: 조회할 파일 (depot 경로, 리비전 지정 가능)
+            options: fstat 옵션 ("-Ol", "-T 필드 목록" 등)
+
+        Returns:
+            파일별 필드 이름 -> 값 (depotFile이 있는 레코드만)
+        """
+        for start in range(0, len(specs), FSTAT_CHUNK_SIZE):
+            try:
+                output = self._run("-ztag", "fstat", *options, *specs[start:start + FSTAT_CHUNK_SIZE])
+            except P4Error:
+                continue
+
+            # 파일별 레코드는 빈 줄로 구분
+            for record in output.split("\n\n"):
+                fields: Dict[str, str] = {}
+                for line in record.split("\n"):
+                    if line.startswith("... "):
+                        key, _, value = line[4:].partition(" ")
+                        fields[key] = value.strip()
+                if fields.get("depotFile"):
+                    yield fields
+
+    def _collect_pending_diffs(
+        self,
+        info: ChangelistInfo,
+        changelist: int,
+        profile: FetchProfile = FETCH_REVIEW
+    ) -> None:
+        """Pending changelist의 파일별 diff 수집 (변경사항만 + profile.full_context면 전체소스)"""
+        for file_change in info.files:
+            self._collect_pending_diff(file_change, changelist, profile)
+
+    def _collect_pending_diff(
+        self,
+        file_change: FileChange,
+        changelist: int,
+        profile: FetchProfile = FETCH_REVIEW
+    ) -> None:
+        """Pending changelist 파일 하나의 diff 수집 (in-place)"""
+        try:
+            # action에 따라 다르게 처리
+            if file_change.action in ("add", "branch", "move/add"):
+                # 새 파일은 전체 내용을 diff로 표시 (두 버전 동일)
+                diff = self._get_new_file_content(file_change.depot_path, changelist)
+                if profile.short_context:
                     file_change.diff = diff.strip()
+                if profile.full_context:
                     file_change.diff_full = diff.strip()
-                elif file_change.action in ("delete", "move/delete"):
-                    # 삭제 파일은 간단히 표시 (두 버전 동일)
-                    diff = f"(파일 삭제됨: {file_change.depot_path})"
+            elif file_change.action in ("delete", "move/delete"):
+                # 삭제 파일은 간단히 표시 (두 버전 동일)
+                diff = f"(파일 삭제됨: {file_change.depot_path})"
+                if profile.short_context:
                     file_change.diff = diff
+                if profile.full_context:
                     file_change.diff_full = diff
-                else:
-                    # edit, integrate 등은 p4 diff 사용
-                    # 1. 변경사항만 (context 3줄)
-                    diff_short = self._run("diff", "-du", file_change.depot_path)
-                    file_change.diff = diff_short.strip()
-                    # 2. 전체 소스 (context 10000줄)
+            else:
+                # edit, integrate 등은 p4 diff 사용
+                # 1. 변경사항만 (context 3줄)
+                if profile.short_context:
+                    diff_short = self._run("diff", "-du", file_change.depot_path).strip()
+                    if is_unity_yaml(file_change.depot_path):
+                        diff_short = compact_unity_yaml_diff(diff_short)
+                    file_change.diff = diff_short
+                # 2. 전체 소스 (context 10000줄)
+                if profile.full_context:
                     diff_full = self._run("diff", "-du10000", file_change.depot_path)
                     file_change.diff_full = diff_full.strip()
-            except P4Error as e:
-                # diff 실패 시 에러 메시지 포함
-                error_msg = f"(diff 실패: {str(e)[:100]})"
-                file_change.diff = error_msg
-                file_change.diff_full = error_msg
+            if profile.short_context:
+                apply_fetch_profile(file_change, profile)
+        except P4Error as e:
+            # diff 실패 시 에러 메시지 포함
+            error_msg = f"{DIFF_ERROR_PREFIX}: {str(e)[:100]})"
+            file_change.diff = error_msg
+            file_change.diff_full = error_msg if profile.full_context else ""
 
     def _get_new_file_content(self, depot_path: str, changelist: int) -> str:
         """새로 추가된 파일의 내용을 diff 형식으로 반환"""
@@ -239,6 +422,11 @@ class P4Client:
                     f.diff = "\n".join(diff_lines)
                     break
 
+        # Unity YAML은 참조 ID/float 노이즈 제거 (diff_full은 전체 소스 확인용으로 원본 유지)
+        for f in info.files:
+            if f.diff and is_unity_yaml(f.depot_path):
+                f.diff = compact_unity_yaml_diff(f.diff)
+
         return info
 
     def _parse_describe_with_diff_full(self, output: str, info: ChangelistInfo) -> None:
@@ -303,13 +491,14 @@ class P4Client:
         new_spec = "\n".join(new_lines)
         cmd = self._build_cmd("change", "-i")
         try:
-            result = subprocess.run(
-                cmd,
-                input=new_spec,
-                capture_output=True,
-                text=True,
-                encoding="utf-8"
-            )
+            with get_governor().slot("p4"):
+                result = subprocess.run(
+                    cmd,
+                    input=new_spec,
+                    capture_output=True,
+                    text=True,
+                    encoding="utf-8"
+                )
             if result.returncode != 0:
                 raise P4Error(f"Description 업데이트 실패: {result.stderr}")
             return True
@@ -364,6 +553,32 @@ class P4Client:
         except P4Error:
             return 0
 
+    def get_file_sizes(self, files: List[FileChange], cl_status: str) -> Dict[str, int]:
+        """파일 크기 조회 (p4 fstat -Ol, 파일 내용은 받지 않음)
+
+        submitted CL은 해당 리비전, pending CL은 depot head 리비전 크기 (새로 추가한 파일은 없음)
+
+        Args:
+            files: 대상 FileChange 목록
+            cl_status: 'pending' 또는 'submitted'
+
+        Returns:
+            depot_path -> 크기 (바이트), 조회하지 못한 파일은 포함하지 않음
+        """
+        specs = [
+            f"{f.depot_path}#{f.revision}" if cl_status != "pending" and f.revision else f.depot_path
+            for f in files
+            if f.action not in ("delete", "move/delete")
+        ]
+
+        sizes: Dict[str, int] = {}
+        for fields in self._fstat_chunks(specs, "-Ol", "-T", "depotFile,fileSize"):
+            try:
+                sizes[fields["depotFile"]] = int(fields.get("fileSize", ""))
+            except ValueError:
+                pass
+        return sizes
+
     def get_local_file_content(self, depot_path: str) -> str:
         """로컬 workspace 파일 내용 조회
 
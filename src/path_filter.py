@@ -0,0 +1,161 @@
+"""
+경로 필터 모듈
+생성 파일, 외부 라이브러리, 엔진 캐시 등 리뷰할 필요가 없는 파일을 diff 수집 전에 제외
+"""
+import re
+from collections import Counter
+from dataclasses import dataclass
+from fnmatch import translate
+from typing import Collection, Dict, List, Optional, Pattern, Set, Tuple
+
+from .config_manager import get_config
+from .expert_profiles import get_exclude_paths, get_project_markers
+from .p4_client import FileChange
+
+
+# 정규식 규칙 접두사 (없으면 glob 패턴)
+REGEX_PREFIX = "re:"
+# 프로젝트 루트 기준 glob 규칙 접두사
+ROOT_PREFIX = "root:"
+
+
+@dataclass
+class FilterRule:
+    """컴파일된 경로 규칙"""
+    pattern: str           # 설정에 적힌 원본 패턴 (제외 사유로 표시)
+    regex: Pattern
+    root_relative: bool = False  # 프로젝트 루트 기준 상대 경로와 비교하는지 여부
+
+    def matches(self, depot_path: str, roots: Collection[str] = ()) -> bool:
+        """
+        경로가 규칙과 일치하는지 확인
+
+        Args:
+            depot_path: 비교할 depot 경로
+            roots: 프로젝트 루트 목록 (root_relative 규칙만 사용, 없으면 일치하지 않음)
+        """
+        if not self.root_relative:
+            return bool(self.regex.match(depot_path))
+        lowered = depot_path.lower()
+        return any(
+            lowered.startswith(root.lower() + "/")
+            and self.regex.match(depot_path[len(root) + 1:])
+            for root in roots
+        )
+
+
+def compile_rule(pattern: str) -> FilterRule:
+    """
+    glob 또는 정규식 패턴 컴파일 (대소문자 무시)
+
+    Args:
+        pattern: "*.meta", "*/vendor/*" 같은 glob, "re:" 접두사가 붙은 정규식,
+            또는 "root:Library/*"처럼 프로젝트 루트 기준 glob
+
+    Raises:
+        ValueError: 정규식 문법 오류
+    """
+    try:
+        if pattern.startswith(REGEX_PREFIX):
+            regex = re.compile(pattern[len(REGEX_PREFIX):], re.IGNORECASE)
+        elif pattern.startswith(ROOT_PREFIX):
+            regex = re.compile(translate(pattern[len(ROOT_PREFIX):]), re.IGNORECASE)
+            return FilterRule(pattern=pattern, regex=regex, root_relative=True)
+        else:
+            regex = re.compile(translate(pattern), re.IGNORECASE)
+    except re.error as e:
+        raise ValueError(f"잘못된 경로 규칙: {pattern} ({e})")
+    return FilterRule(pattern=pattern, regex=regex)
+
+
+class PathFilter:
+    """include/exclude 규칙 기반 경로 필터
+
+    - exclude 규칙 중 하나라도 일치하면 제외
+    - include 규칙이 있으면 하나 이상 일치하는 파일만 유지
+    glob 규칙은 depot 경로 전체와 비교하므로 디렉토리는 "*/vendor/*"처럼 지정.
+    "root:" 규칙은 표식 폴더(Unity의 Assets 등)의 상위 폴더, 즉 프로젝트 루트 기준으로 비교하므로
+    "root:Library/*"는 //depot/Game/Library/...만 제외하고 //depot/Game/Source/Library/...는 유지.
+    프로젝트 루트는 함께 분리하는 파일 목록의 경로에서 찾으며, 찾지 못하면 "root:" 규칙은 적용하지 않음
+    """
+
+    def __init__(
+        self,
+        include: Optional[List[str]] = None,
+        exclude: Optional[List[str]] = None,
+        project_markers: Optional[List[str]] = None
+    ):
+        self.include = [compile_rule(p) for p in include or []]
+        self.exclude = [compile_rule(p) for p in exclude or []]
+        self.project_markers = list(project_markers or [])
+
+    @classmethod
+    def from_config(cls) -> "PathFilter":
+        """사용자 설정과 선택된 전문가 프로필의 제외 규칙으로 생성"""
+        config = get_config()
+        settings = config.path_filter
+        if not settings.get("enabled", True):
+            return cls()
+        exclude = list(settings.get("exclude", [])) + get_exclude_paths(config.expert_profile)
+        return cls(
+            settings.get("include", []),
+            list(dict.fromkeys(exclude)),
+            get_project_markers(config.expert_profile)
+        )
+
+    def project_roots(self, depot_paths: List[str]) -> Set[str]:
+        """경로 목록에서 표식 폴더의 상위 폴더(프로젝트 루트) 수집"""
+        roots: Set[str] = set()
+        for marker in self.project_markers:
+            token = f"/{marker.lower()}/"
+            for depot_path in depot_paths:
+                lowered = depot_path.lower()
+                index = lowered.find(token)
+                while index > 0:
+                    roots.add(depot_path[:index])
+                    index = lowered.find(token, index + 1)
+        return roots
+
+    def reason(self, depot_path: str, roots: Collection[str] = ()) -> Optional[str]:
+        """
+        제외 사유 반환 (유지할 파일이면 None)
+
+        Args:
+            depot_path: 확인할 depot 경로
+            roots: "root:" 규칙에 쓸 프로젝트 루트 목록 (project_roots)
+        """
+        for rule in self.exclude:
+            if rule.matches(depot_path, roots):
+                return rule.pattern
+        if self.include and not any(rule.matches(depot_path, roots) for rule in self.include):
+            return "include 규칙 불일치"
+        return None
+
+    def split(self, files: List[FileChange]) -> Tuple[List[FileChange], Dict[str, str]]:
+        """
+        파일 목록을 유지/제외로 분리
+
+        Returns:
+            (유지할 파일 목록, 제외한 파일 depot_path -> 일치한 규칙)
+        """
+        kept: List[FileChange] = []
+        excluded: Dict[str, str] = {}
+        roots = self.project_roots([f.depot_path for f in files])
+        for f in files:
+            reason = self.reason(f.depot_path, roots)
+            if reason is None:
+                kept.append(f)
+            else:
+                excluded[f.depot_path] = reason
+        return kept, excluded
+
+
+def describe_excluded(excluded: Dict[str, str]) -> str:
+    """제외된 파일 요약 텍스트 (규칙별 개수)"""
+    if not excluded:
+        return ""
+    counts = Counter(excluded.values()).most_common()
+    details = ", ".join(f"{pattern} {count}개" for pattern, count in counts[:5])
+    if len(counts) > 5:
+        details += " 등"
+    return f"제외 규칙으로 {len(excluded)}개 파일 제외 ({details})"
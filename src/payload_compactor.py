@@ -0,0 +1,144 @@
+"""
+페이로드 압축 모듈
+n8n으로 보내기 전에 diff와 파일 메타데이터에서 리뷰에 의미 없는 부분을 제거하여 토큰 절감
+"""
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+
+from .batch_planner import estimate_tokens, split_diff_into_hunks
+
+
+# 파일 경로를 반복하는 diff 헤더 라인 (경로는 depot_path 필드로 이미 전송됨)
+DIFF_HEADER_PATTERN = re.compile(r"^(====|--- |\+\+\+ |diff |Index: )")
+
+# 공백/줄바꿈만 바뀐 파일의 diff 대체 문구
+WHITESPACE_ONLY_NOTE = "(공백/줄바꿈 변경만 있음)"
+
+
+@dataclass
+class CompactionReport:
+    """페이로드 압축 결과"""
+    tokens_before: int = 0
+    tokens_after: int = 0
+    dropped_hunks: int = 0       # 공백/줄바꿈만 바뀐 hunk
+    stripped_headers: int = 0    # 제거한 diff 헤더 라인
+
+    @property
+    def saved_tokens(self) -> int:
+        return max(self.tokens_before - self.tokens_after, 0)
+
+    @property
+    def saved_ratio(self) -> float:
+        """절감 비율 (0~1)"""
+        return self.saved_tokens / self.tokens_before if self.tokens_before else 0.0
+
+    def add(self, other: "CompactionReport") -> None:
+        """다른 요청의 압축 결과 누적"""
+        self.tokens_before += other.tokens_before
+        self.tokens_after += other.tokens_after
+        self.dropped_hunks += other.dropped_hunks
+        self.stripped_headers += other.stripped_headers
+
+    def describe(self) -> str:
+        """한 줄 요약 텍스트"""
+        return (
+            f"페이로드 압축: {self.tokens_before:,} → {self.tokens_after:,} 토큰 "
+            f"({self.saved_ratio:.0%} 절감)"
+        )
+
+
+def _rstrip_line(line: str) -> str:
+    """diff 라인의 끝 공백 제거 (+/-/공백 접두사는 유지)"""
+    return line[:1] + line[1:].rstrip() if line else line
+
+
+def _is_whitespace_only(hunk: List[str]) -> bool:
+    """
+    hunk의 삭제/추가 라인이 라인 끝 공백과 줄바꿈 문자만 다른지 확인
+
+    라인 단위로 순서대로 비교하므로 들여쓰기(Python/YAML/Makefile)나 문자열 안의 공백처럼
+    동작이 바뀔 수 있는 변경은 남김
+    """
+    removed = [line[1:].rstrip() for line in hunk[1:] if line.startswith("-")]
+    added = [line[1:].rstrip() for line in hunk[1:] if line.startswith("+")]
+    return bool(removed) and removed == added
+
+
+def compact_diff(diff: str, drop_whitespace_hunks: bool = True) -> Tuple[str, int, int]:
+    """
+    diff 압축
+
+    - CRLF/CR 줄바꿈을 LF로 통일하고 라인 끝 공백 제거
+    - 파일 경로를 반복하는 헤더 라인 제거 (hunk가 있는 경우)
+    - 라인 끝 공백/줄바꿈 문자만 바뀐 hunk 제거 (hunk 헤더에 원본 라인 번호가 있으므로 나머지 hunk는 그대로 유효)
+
+    Args:
+        diff: 원본 diff
+        drop_whitespace_hunks: 공백/줄바꿈만 바뀐 hunk 제거 여부
+
+    Returns:
+        (압축된 diff, 제거한 hunk 수, 제거한 헤더 라인 수)
+    """
+    if not diff:
+        return diff, 0, 0
+
+    text = diff.replace("\r\n", "\n").replace("\r", "\n")
+    header, hunks = split_diff_into_hunks(text)
+    if not hunks:
+        # 새 파일 전체 내용, 오류 메시지 등은 줄바꿈/끝 공백만 정리
+        return "\n".join(line.rstrip() for line in text.split("\n")).strip("\n"), 0, 0
+
+    kept_header = [line for line in header if line.strip() and not DIFF_HEADER_PATTERN.match(line)]
+    stripped = len(header) - len(kept_header)
+
+    lines = list(kept_header)
+    dropped = 0
+    for hunk in hunks:
+        if drop_whitespace_hunks and _is_whitespace_only(hunk):
+            dropped += 1
+            continue
+        lines.extend(_rstrip_line(line) for line in hunk)
+
+    if dropped and dropped == len(hunks):
+        lines.append(WHITESPACE_ONLY_NOTE)
+
+    return "\n".join(lines).strip("\n"), dropped, stripped
+
+
+def compact_payload(payload: Dict[str, Any], drop_whitespace_hunks: bool = True) -> CompactionReport:
+    """
+    페이로드 in-place 압축
+
+    파일별 diff를 compact_diff()로 정리하고, 항상 비어 있는 content 필드와
+    기본값인 revision(0)/file_type("") 필드를 제거
+
+    Args:
+        payload: _prepare_payload()가 만든 페이로드 (in-place 수정)
+        drop_whitespace_hunks: 공백/줄바꿈만 바뀐 hunk 제거 여부
+
+    Returns:
+        CompactionReport: 요청 하나의 압축 결과
+    """
+    report = CompactionReport()
+    for file_data in payload.get("files", []):
+        before = sum(estimate_tokens(str(k)) + estimate_tokens(str(v)) for k, v in file_data.items())
+
+        diff, dropped, stripped = compact_diff(file_data.get("diff", ""), drop_whitespace_hunks)
+        file_data["diff"] = diff
+        report.dropped_hunks += dropped
+        report.stripped_headers += stripped
+
+        for key in ("content", "revision", "file_type"):
+            if key in file_data and not file_data[key]:
+                del file_data[key]
+
+        after = sum(estimate_tokens(str(k)) + estimate_tokens(str(v)) for k, v in file_data.items())
+        report.tokens_before += before
+        report.tokens_after += after
+
+    # 파일 외 공통 부분은 압축 전후 동일
+    common = estimate_tokens(str({k: v for k, v in payload.items() if k != "files"}))
+    report.tokens_before += common
+    report.tokens_after += common
+    return report
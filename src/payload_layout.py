@@ -0,0 +1,82 @@
+"""
+페이로드 배치 순서 모듈
+배치/실행마다 바뀌지 않는 내용을 페이로드 앞쪽에 같은 바이트로 배치하고 그 범위를 표시하여
+LLM 게이트웨이의 프롬프트 prefix 캐시가 긴 전문가 프롬프트를 세션당 한 번만 처리하도록 함
+"""
+import hashlib
+import json
+from typing import Any, Dict
+
+
+# 세션(Changelist) 안에서 바뀌지 않는 필드 (이 순서로 페이로드 맨 앞에 배치)
+STABLE_PREFIX_FIELDS = ("request_type", "expert_context_id", "expert_context", "changelist")
+
+
+def normalize_text(text: str) -> str:
+    """줄바꿈 통일 및 라인 끝 공백 제거 (실행마다 같은 바이트가 되도록)"""
+    if not text:
+        return ""
+    lines = text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    return "\n".join(line.rstrip() for line in lines).strip("\n")
+
+
+def stabilize_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    고정 prefix 배치로 페이로드 재구성
+
+    - STABLE_PREFIX_FIELDS를 맨 앞에, 배치별로 바뀌는 batch_info 등을 뒤에, files를 마지막에 배치
+    - 전문가 프롬프트와 CL 설명의 줄바꿈/끝 공백을 정규화
+    - cache_prefix 필드로 캐시 가능한 prefix 범위와 해시를 표시
+
+    Args:
+        payload: _prepare_payload()가 만든 페이로드
+
+    Returns:
+        재구성된 페이로드 (원본은 수정하지 않음)
+    """
+    prefix: Dict[str, Any] = {}
+    for key in STABLE_PREFIX_FIELDS:
+        if key in payload:
+            prefix[key] = payload[key]
+    if "expert_context" in prefix:
+        prefix["expert_context"] = normalize_text(prefix["expert_context"])
+    if "changelist" in prefix:
+        changelist = dict(prefix["changelist"])
+        changelist["current_description"] = normalize_text(changelist.get("current_description", ""))
+        prefix["changelist"] = changelist
+
+    layout = dict(prefix)
+    # 세션 정보 다음에 배치별 파일 목록
+    for key, value in payload.items():
+        if key not in layout and key != "files":
+            layout[key] = value
+    if "files" in payload:
+        layout["files"] = payload["files"]
+    return mark_cache_prefix(layout)
+
+
+def mark_cache_prefix(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    실제로 전송하는 페이로드의 고정 prefix 범위와 해시를 cache_prefix 필드로 표시
+
+    전문가 컨텍스트를 ID로 대체하는 등 prefix 필드가 바뀌면 전송 직전에 다시 호출해야
+    표시한 범위가 서버가 받는 바이트와 일치함
+
+    Args:
+        payload: stabilize_payload()로 배치한 페이로드
+
+    Returns:
+        cache_prefix를 prefix 필드 바로 뒤에 둔 사본
+    """
+    prefix = {key: payload[key] for key in STABLE_PREFIX_FIELDS if key in payload}
+    encoded = json.dumps(prefix, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    marked = dict(prefix)
+    marked["cache_prefix"] = {
+        "fields": list(prefix),
+        "sha256": hashlib.sha256(encoded).hexdigest(),
+        "bytes": len(encoded)
+    }
+    for key, value in payload.items():
+        if key not in marked:
+            marked[key] = value
+    return marked
@@ -0,0 +1,77 @@
+"""
+전문가 프로필 라우팅 모듈
+파일 종류(언어/엔진 영역)별로 맞는 전문가 프로필을 골라, 배치마다 해당 프로필의 프롬프트만 전송
+"""
+from fnmatch import fnmatch
+from typing import Dict, List, Optional
+
+from .config_manager import get_config
+from .expert_profiles import EXPERT_PROFILES, get_file_paths, get_prompt
+
+
+class ProfileRouter:
+    """파일 경로 → 전문가 프로필 키
+
+    - 가장 긴 패턴이 일치하는 프로필 선택 ("*.build.cs"가 "*.cs"보다 우선)
+    - 설정된 프로필의 패턴은 같은 길이면 우선
+    - 어느 프로필에도 해당하지 않는 파일은 설정된 프로필 사용
+    - 설정된 프로필이 라우팅 대상이 아니면 라우팅하지 않음 (사용자가 고른 프롬프트 유지)
+    """
+
+    def __init__(self, default: str, profiles: Optional[List[str]] = None):
+        """
+        Args:
+            default: 설정된 전문가 프로필 (일치하는 프로필이 없는 파일에 사용)
+            profiles: 라우팅 대상 프로필 키 목록 (None이나 빈 목록이면 라우팅하지 않음)
+        """
+        self.default = default
+        self.patterns: Dict[str, List[str]] = {
+            key: [p.lower() for p in get_file_paths(key)]
+            for key in profiles or []
+            if key in EXPERT_PROFILES and get_file_paths(key)
+        }
+
+    @classmethod
+    def from_config(cls, request_type: str = "review") -> "ProfileRouter":
+        """
+        profile_routing 설정으로 생성 (기본 비활성화)
+
+        커스텀 프롬프트가 있거나, 설정된 프로필이 라우팅 대상 엔진 프로필이 아니면
+        (generic 등) 사용자가 고른 프롬프트를 모든 배치에 쓰도록 라우팅하지 않음
+        """
+        config = get_config()
+        settings = config.profile_routing
+        if not settings.get("enabled", False) or config.custom_prompts.get(request_type, ""):
+            return cls(config.expert_profile)
+        profiles = settings.get("profiles") or list(EXPERT_PROFILES)
+        if config.expert_profile not in profiles:
+            return cls(config.expert_profile)
+        return cls(config.expert_profile, profiles)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.patterns)
+
+    @property
+    def profiles(self) -> List[str]:
+        """배치에 쓰일 수 있는 프로필 키 목록 (설정된 프로필 포함)"""
+        return list(dict.fromkeys([self.default, *self.patterns]))
+
+    def route(self, depot_path: str) -> str:
+        """파일을 리뷰할 전문가 프로필 키"""
+        path = depot_path.lower()
+        best, best_length = self.default, 0
+        for key, patterns in self.patterns.items():
+            length = max((len(p) for p in patterns if fnmatch(path, p)), default=0)
+            if length > best_length or (length and length == best_length and key == self.default):
+                best, best_length = key, length
+        return best
+
+    def signature(self, request_type: str = "review") -> str:
+        """라우팅 결과에 영향을 주는 설정 (리뷰 이력/hunk 재사용 범위 구분용, 비활성화 시 빈 문자열)"""
+        if not self.enabled:
+            return ""
+        return "\n".join(
+            f"{key}:{','.join(self.patterns.get(key, []))}\n{get_prompt(key, request_type)}"
+            for key in self.profiles
+        )
@@ -0,0 +1,146 @@
+"""
+n8n 응답 디스크 캐시
+동일한 요청(정규화된 페이로드 해시)에 대한 AI 응답을 재사용
+"""
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from .checkpoint import write_json_atomic
+
+
+# 캐시 키 계산에서 제외할 필드 (요청 내용과 무관한 세션 정보)
+_VOLATILE_FIELDS = ("session_key",)
+
+
+def _normalize_text(text: str) -> str:
+    """줄바꿈 정규화 (CRLF/CR -> LF)"""
+    return text.replace("\r\n", "\n").replace("\r", "\n") if text else ""
+
+
+def canonicalize_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """캐시 키 계산용 정규화 페이로드 생성
+
+    - 파일 목록을 depot 경로 순으로 정렬
+    - diff/description의 줄바꿈 정규화
+    - 세션 정보 등 요청 내용과 무관한 필드 제거
+
+    Args:
+        payload: N8NClient._prepare_payload() 결과
+
+    Returns:
+        정규화된 페이로드 (원본은 수정하지 않음)
+    """
+    canonical = {k: v for k, v in payload.items() if k not in _VOLATILE_FIELDS}
+
+    files = []
+    for f in payload.get("files", []):
+        normalized = dict(f)
+        normalized["diff"] = _normalize_text(f.get("diff", ""))
+        files.append(normalized)
+    canonical["files"] = sorted(files, key=lambda f: f.get("depot_path", ""))
+
+    changelist = dict(payload.get("changelist", {}))
+    if "current_description" in changelist:
+        changelist["current_description"] = _normalize_text(changelist["current_description"])
+    canonical["changelist"] = changelist
+
+    canonical["expert_context"] = _normalize_text(payload.get("expert_context", ""))
+    return canonical
+
+
+def make_cache_key(payload: Dict[str, Any]) -> str:
+    """정규화된 페이로드의 SHA-256 해시 반환"""
+    canonical = canonicalize_payload(payload)
+    encoded = json.dumps(canonical, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """TTL + 용량 제한을 가진 파일 기반 응답 캐시
+
+    엔트리 하나당 JSON 파일 하나로 저장하며, 파일 수정 시각을
+    마지막 사용 시각으로 사용하여 용량 초과 시 오래된 것부터 제거
+    """
+
+    def __init__(self, cache_dir: Path, ttl_seconds: int = 86400, max_bytes: int = 50 * 1024 * 1024):
+        self.cache_dir = Path(cache_dir)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """캐시된 응답 조회 (없거나 만료되었으면 None)"""
+        path = self._entry_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (IOError, OSError, json.JSONDecodeError):
+            return None
+
+        if time.time() - entry.get("created", 0) > self.ttl_seconds:
+            self._remove(path)
+            return None
+
+        # LRU 갱신
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        return entry.get("response")
+
+    def put(self, key: str, response: Dict[str, Any]) -> None:
+        """응답 저장 (임시 파일에 쓴 뒤 교체하여 부분 쓰기 방지)"""
+        try:
+            write_json_atomic(self._entry_path(key), {"created": time.time(), "response": response})
+        except (IOError, OSError, TypeError, ValueError):
+            # 캐시 저장 실패는 요청 결과에 영향을 주지 않음
+            return
+        self._evict()
+
+    def clear(self) -> None:
+        """모든 캐시 엔트리 삭제"""
+        for path in self._entries():
+            self._remove(path)
+
+    def _entries(self):
+        if not self.cache_dir.exists():
+            return []
+        return list(self.cache_dir.glob("*.json"))
+
+    def _evict(self) -> None:
+        """만료 엔트리 제거 후, 용량 초과 시 오래 사용하지 않은 엔트리부터 제거"""
+        now = time.time()
+        entries = []
+        for path in self._entries():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            if now - stat.st_mtime > self.ttl_seconds:
+                self._remove(path)
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+    @staticmethod
+    def _remove(path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
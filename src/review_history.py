@@ -0,0 +1,73 @@
+"""
+리뷰 이력 모듈
+Changelist별 마지막 리뷰의 파일 diff 다이제스트와 코멘트를 저장하여, 수정 후 다시 리뷰할 때
+바뀌지 않은 파일은 이전 코멘트를 이어 쓰고 바뀐 파일만 요청 (incremental 모드)
+"""
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from .checkpoint import read_json, write_json_atomic
+from .config_manager import get_config
+
+
+class ReviewHistory:
+    """Changelist 하나의 마지막 리뷰 이력
+
+    파일 구성 (JSON):
+        scope          - 리뷰 범위 해시 (전문가 프로필/프롬프트가 바뀌면 이력 무시)
+        created        - 저장 시각
+        overall_score  - 마지막 리뷰 점수
+        summary        - 마지막 리뷰 요약
+        files          - depot_path -> {"digest": diff 다이제스트, "comments": 코멘트 목록}
+    """
+
+    def __init__(self, path: Path, scope: str):
+        self.path = Path(path)
+        self.scope = scope
+
+    @classmethod
+    def for_changelist(cls, changelist: int, scope: str) -> "ReviewHistory":
+        """Changelist 번호에 해당하는 이력 반환"""
+        return cls(get_config().cache_dir / "history" / f"cl_{changelist}.json", scope)
+
+    def load(self) -> Dict[str, Any]:
+        """이력 로드 (없거나 리뷰 범위가 다르면 빈 딕셔너리)"""
+        data = read_json(self.path)
+        if not isinstance(data, dict) or data.get("scope") != self.scope:
+            return {}
+        return data
+
+    def save(
+        self,
+        digests: Dict[str, str],
+        comments: List[Dict[str, Any]],
+        overall_score: int,
+        summary: str
+    ) -> None:
+        """
+        이번 리뷰 결과 저장 (저장 실패는 리뷰 결과에 영향을 주지 않음)
+
+        Args:
+            digests: 리뷰한 파일 depot_path -> diff 다이제스트
+            comments: 리뷰 코멘트 (ReviewComment를 asdict()로 변환한 목록)
+            overall_score: 리뷰 점수
+            summary: 리뷰 요약
+        """
+        files: Dict[str, Dict[str, Any]] = {
+            path: {"digest": digest, "comments": []} for path, digest in digests.items()
+        }
+        for comment in comments:
+            entry = files.get(comment.get("file_path", ""))
+            if entry is not None:
+                entry["comments"].append(comment)
+        try:
+            write_json_atomic(self.path, {
+                "scope": self.scope,
+                "created": time.time(),
+                "overall_score": overall_score,
+                "summary": summary,
+                "files": files
+            })
+        except (IOError, OSError, TypeError, ValueError):
+            return
@@ -0,0 +1,148 @@
+"""
+파일 위험도 평가 모듈
+파일 종류, 변경 규모, 중요 경로 패턴으로 리뷰 우선순위 점수 계산
+"""
+import math
+import posixpath
+from fnmatch import fnmatch
+from typing import List, Optional
+
+from .config_manager import get_config
+from .expert_profiles import get_risk_paths
+from .p4_client import FileChange
+
+
+# 코드 리뷰 가치가 높은 소스 코드 확장자
+SOURCE_EXTENSIONS = {
+    ".c", ".cc", ".cpp", ".cxx", ".h", ".hh", ".hpp", ".inl", ".cs", ".java", ".kt",
+    ".py", ".js", ".ts", ".tsx", ".jsx", ".go", ".rs", ".lua", ".swift", ".m", ".mm",
+    ".shader", ".hlsl", ".cginc", ".compute", ".usf", ".ush", ".glsl"
+}
+
+# 동작에 영향을 주는 설정/스크립트 확장자
+CONFIG_EXTENSIONS = {
+    ".json", ".xml", ".yaml", ".yml", ".ini", ".cfg", ".toml", ".sql", ".sh", ".bat",
+    ".ps1", ".cmake", ".gradle", ".csproj", ".uproject", ".uplugin", ".build.cs"
+}
+
+# 텍스트 diff로는 리뷰하기 어려운 에셋 확장자
+ASSET_EXTENSIONS = {
+    ".png", ".jpg", ".jpeg", ".tga", ".psd", ".tif", ".tiff", ".bmp", ".gif", ".dds", ".exr",
+    ".hdr", ".fbx", ".obj", ".blend", ".max", ".ma", ".mb", ".wav", ".mp3", ".ogg", ".bank",
+    ".mp4", ".mov", ".ttf", ".otf", ".uasset", ".umap", ".dll", ".so", ".lib", ".a", ".exe",
+    ".pdb", ".zip", ".7z", ".meta"
+}
+
+# 파일 종류별 기본 가중치
+SOURCE_WEIGHT = 3.0
+CONFIG_WEIGHT = 2.0
+TEXT_WEIGHT = 1.0
+ASSET_WEIGHT = 0.2
+
+# 중요 경로 패턴에 해당하는 파일의 가산점
+CRITICAL_PATH_BONUS = 3.0
+# 전문가 프로필의 우선 경로 패턴에 해당하는 파일의 가산점
+PROFILE_PATH_BONUS = 1.5
+
+# 변경 타입별 가중치 (삭제/이동은 새 코드가 없으므로 낮게)
+ACTION_WEIGHTS = {
+    "add": 1.0,
+    "edit": 1.0,
+    "integrate": 0.8,
+    "branch": 0.6,
+    "move/add": 0.6,
+    "move/delete": 0.2,
+    "delete": 0.3
+}
+
+
+def _extension(depot_path: str) -> str:
+    name = posixpath.basename(depot_path).lower()
+    if name.endswith(".build.cs"):
+        return ".build.cs"
+    return posixpath.splitext(name)[1]
+
+
+def count_changed_lines(diff: str) -> int:
+    """diff에서 추가/삭제된 라인 수 (파일 헤더 제외)"""
+    return sum(
+        1 for line in diff.split("\n")
+        if line.startswith(("+", "-")) and not line.startswith(("+++", "---"))
+    )
+
+
+class RiskScorer:
+    """파일별 리뷰 위험도 점수 계산기
+
+    점수 = (파일 종류 가중치 + 경로 가산점) × 변경 타입 가중치 + log2(1 + 변경 라인 수)
+    diff를 수집하기 전에는 변경 라인 수 항목이 0이므로 메타데이터만으로 순서를 정할 수 있음
+    """
+
+    def __init__(self, settings: dict, profile_paths: Optional[List[str]] = None):
+        """
+        Args:
+            settings: 위험도 설정 (critical_paths, low_value_paths)
+            profile_paths: 전문가 프로필의 우선 경로 패턴
+        """
+        self.critical_paths = [p.lower() for p in settings.get("critical_paths", [])]
+        self.low_value_paths = [p.lower() for p in settings.get("low_value_paths", [])]
+        self.profile_paths = [p.lower() for p in (profile_paths or [])]
+
+    @classmethod
+    def from_config(cls) -> "RiskScorer":
+        """현재 설정과 선택된 전문가 프로필로 생성"""
+        config = get_config()
+        return cls(config.risk, get_risk_paths(config.expert_profile))
+
+    def is_critical(self, file: FileChange) -> bool:
+        """중요 경로 패턴에 해당하는지 확인"""
+        path = file.depot_path.lower()
+        return any(fnmatch(path, pattern) for pattern in self.critical_paths)
+
+    def is_asset(self, file: FileChange) -> bool:
+        """텍스트 리뷰가 어려운 에셋/바이너리 파일인지 확인"""
+        return "binary" in file.file_type.lower() or _extension(file.depot_path) in ASSET_EXTENSIONS
+
+    def is_low_value(self, file: FileChange) -> bool:
+        """
+        시간이 부족할 때 먼저 제외할 파일인지 확인
+
+        에셋/바이너리, 삭제된 파일, low_value_paths 패턴에 해당하는 파일 (중요 경로는 제외하지 않음)
+        """
+        if self.is_critical(file):
+            return False
+        path = file.depot_path.lower()
+        return (
+            self.is_asset(file)
+            or file.action in ("delete", "move/delete")
+            or any(fnmatch(path, pattern) for pattern in self.low_value_paths)
+        )
+
+    def score(self, file: FileChange) -> float:
+        """파일의 위험도 점수 (높을수록 먼저 리뷰)"""
+        extension = _extension(file.depot_path)
+        if self.is_asset(file):
+            weight = ASSET_WEIGHT
+        elif extension in SOURCE_EXTENSIONS:
+            weight = SOURCE_WEIGHT
+        elif extension in CONFIG_EXTENSIONS:
+            weight = CONFIG_WEIGHT
+        else:
+            weight = TEXT_WEIGHT
+
+        path = file.depot_path.lower()
+        if self.is_critical(file):
+            weight += CRITICAL_PATH_BONUS
+        elif any(fnmatch(path, pattern) for pattern in self.profile_paths):
+            weight += PROFILE_PATH_BONUS
+
+        weight *= ACTION_WEIGHTS.get(file.action, 1.0)
+        return weight + math.log2(1 + count_changed_lines(file.diff))
+
+    def rank(self, files: List[FileChange]) -> List[FileChange]:
+        """위험도 내림차순으로 정렬 (같은 점수는 원래 순서 유지)"""
+        return sorted(files, key=self.score, reverse=True)
+
+    def batch_score(self, files: List[FileChange]) -> float:
+        """배치의 위험도 (가장 위험한 파일 기준)"""
+        return max((self.score(f) for f in files), default=0.0)
@@ -5,8 +5,11 @@ tkinter 기반 진행률 표시, 메시지 박스, 결과 표시
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import threading
+import time
 from typing import Callable, Optional
 
+from ..path_filter import describe_excluded
+
 
 class ProgressDialog:
     """진행률 표시 다이얼로그"""
@@ -331,7 +334,8 @@ class ReviewDialog:
     def __init__(
         self,
         title: str = "AI 코드 리뷰",
-        changelist: int = 0
+        changelist: int = 0,
+        on_retry_callback: Optional[Callable[[object], None]] = None
     ):
         self.root = tk.Tk()
         self.root.title(title)
@@ -347,6 +351,7 @@ class ReviewDialog:
         self.root.attributes("-topmost", True)
 
         self.changelist = changelist
+        self.on_retry_callback = on_retry_callback
         self.review_result = None
         self._closed = False
 
@@ -391,13 +396,129 @@ class ReviewDialog:
         )
         self.status_label.pack()
 
+        # 남은 시간
+        self.eta_label = ttk.Label(
+            self.progress_frame,
+            text="",
+            font=("", 9),
+            foreground="gray"
+        )
+        self.eta_label.pack(pady=(5, 0))
+        self._eta_deadline: Optional[float] = None
+        self._eta_tick_id = None
+
     def _build_result_ui(self, success: bool, error: str = "") -> None:
         """결과 상태 UI 구성"""
+        self._stop_eta_countdown()
         self.progress_frame.destroy()
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
         result_frame = ttk.Frame(self.main_frame)
         result_frame.pack(fill=tk.BOTH, expand=True)
+        self.result_frame = result_frame
+
+        if success and self.review_result and self.review_result.partial:
+            # 부분 결과 경고
+            failed = self.review_result.failed_batches
+            total = len(self.review_result.batches)
+            partial_label = ttk.Label(
+                result_frame,
+                text=(
+                    f"일부 배치 리뷰 실패 ({total}개 중 {len(failed)}개) - 성공한 배치 결과만 표시됩니다.\n"
+                    f"실패 원인: {next(iter(failed.values()))}"
+                ),
+                font=("", 9, "bold"),
+                foreground="orange",
+                wraplength=780
+            )
+            partial_label.pack(anchor=tk.W, pady=(0, 5))
+
+        if self.review_result and self.review_result.excluded_files:
+            # 경로 필터로 제외한 파일
+            excluded_label = ttk.Label(
+                result_frame,
+                text=describe_excluded(self.review_result.excluded_files),
+                font=("", 9),
+                foreground="gray",
+                wraplength=780
+            )
+            excluded_label.pack(anchor=tk.W, pady=(0, 5))
+
+        if self.review_result and self.review_result.asset_summary:
+            # diff 대신 요약으로 보낸 에셋
+            asset_label = ttk.Label(
+                result_frame,
+                text=self.review_result.asset_summary.describe(),
+                font=("", 9),
+                foreground="gray",
+                wraplength=780
+            )
+            asset_label.pack(anchor=tk.W, pady=(0, 5))
+
+        shared_files = self.review_result.shared_files if self.review_result else {}
+        if shared_files:
+            # diff가 같아 한 번만 전송한 파일
+            shared_label = ttk.Label(
+                result_frame,
+                text=(
+                    f"같은 diff를 가진 {len(shared_files)}개 파일은 한 번만 전송하고 "
+                    f"코멘트를 복제했습니다."
+                ),
+                font=("", 9),
+                foreground="gray",
+                wraplength=780
+            )
+            shared_label.pack(anchor=tk.W, pady=(0, 5))
+
+        carried = self.review_result.carried if self.review_result else {}
+        if carried:
+            # incremental 모드에서 바뀌지 않은 파일
+            carried_label = ttk.Label(
+                result_frame,
+                text=(
+                    f"마지막 리뷰 이후 바뀌지 않은 {len(carried)}개 파일은 다시 요청하지 않고 "
+                    f"이전 코멘트를 유지했습니다."
+                ),
+                font=("", 9),
+                foreground="gray",
+                wraplength=780
+            )
+            carried_label.pack(anchor=tk.W, pady=(0, 5))
+
+        reused = self.review_result.reused if self.review_result else []
+        if reused:
+            # 이전 리뷰에서 본 hunk
+            reused_label = ttk.Label(
+                result_frame,
+                text=(
+                    f"이전에 리뷰한 hunk {sum(r.hunks for r in reused)}개는 다시 요청하지 않고 "
+                    f"저장된 코멘트 {sum(len(r.comments) for r in reused)}개를 표시했습니다."
+                ),
+                font=("", 9),
+                foreground="gray",
+                wraplength=780
+            )
+            reused_label.pack(anchor=tk.W, pady=(0, 5))
+
+        coverage = self.review_result.coverage if self.review_result else None
+        if coverage:
+            # 마감 모드 리뷰 범위
+            skipped = list(coverage.skipped_files.items())
+            coverage_text = coverage.describe()
+            if skipped:
+                coverage_text += "\n제외된 파일: " + ", ".join(
+                    path.rsplit("/", 1)[-1] for path, _ in skipped[:5]
+                )
+                if len(skipped) > 5:
+                    coverage_text += f" 외 {len(skipped) - 5}개"
+            coverage_label = ttk.Label(
+                result_frame,
+                text=coverage_text,
+                font=("", 9),
+                foreground="steelblue",
+                wraplength=780
+            )
+            coverage_label.pack(anchor=tk.W, pady=(0, 5))
 
         if success and self.review_result:
             # 헤더 프레임 (점수 + 통계)
@@ -432,6 +553,16 @@ class ReviewDialog:
             stats_label = ttk.Label(header_frame, text=stats_text, font=("", 9))
             stats_label.pack(side=tk.RIGHT, pady=(5, 0))
 
+            # 페이로드 압축 절감량
+            if self.review_result.compaction:
+                compaction_label = ttk.Label(
+                    result_frame,
+                    text=self.review_result.compaction.describe(),
+                    font=("", 8),
+                    foreground="gray"
+                )
+                compaction_label.pack(anchor=tk.E, pady=(0, 5))
+
             # 요약
             summary_frame = ttk.LabelFrame(result_frame, text="요약", padding=10)
             summary_frame.pack(fill=tk.X, pady=(0, 10))
@@ -508,6 +639,10 @@ class ReviewDialog:
         btn_frame = ttk.Frame(result_frame)
         btn_frame.pack(pady=(5, 0))
 
+        if success and self.review_result.partial and self.on_retry_callback:
+            retry_btn = ttk.Button(btn_frame, text="실패 배치 재시도", command=self._on_retry, width=15)
+            retry_btn.pack(side=tk.LEFT, padx=5)
+
         if success:
             view_btn = ttk.Button(btn_frame, text="HTML로 보기", command=self._on_view_html, width=12)
             view_btn.pack(side=tk.LEFT, padx=5)
@@ -520,6 +655,15 @@ class ReviewDialog:
 
         self.root.bind("<Escape>", lambda e: self._on_close())
 
+    def _on_retry(self) -> None:
+        """실패한 배치만 다시 리뷰 (진행 UI로 전환)"""
+        previous = self.review_result
+        self.result_frame.destroy()
+        self.root.protocol("WM_DELETE_WINDOW", lambda: None)
+        self._build_progress_ui()
+        self.update_status(f"실패한 배치 {len(previous.failed_batches)}개 재시도 중...")
+        self.on_retry_callback(previous)
+
     def _on_select_comment(self, event) -> None:
         """코멘트 선택 시 상세 정보 표시"""
         selection = self.tree.selection()
@@ -599,6 +743,49 @@ class ReviewDialog:
         if not self._closed:
             self.root.after(0, lambda: self.status_label.config(text=message))
 
+    def update_progress(self, fraction: float, eta_seconds: Optional[float]) -> None:
+        """
+        진행률과 남은 시간 업데이트
+
+        Args:
+            fraction: 진행률 (0~1)
+            eta_seconds: 남은 시간 (초), 추정할 수 없으면 None
+        """
+        if not self._closed:
+            self.root.after(0, lambda: self._apply_progress(fraction, eta_seconds))
+
+    def _apply_progress(self, fraction: float, eta_seconds: Optional[float]) -> None:
+        if not self.progress_frame.winfo_exists():
+            return
+        if str(self.progress_bar.cget("mode")) != "determinate":
+            self.progress_bar.stop()
+            self.progress_bar.config(mode="determinate", maximum=100)
+        self.progress_bar.config(value=max(0.0, min(fraction, 1.0)) * 100)
+
+        self._stop_eta_countdown()
+        if eta_seconds is None:
+            self.eta_label.config(text="")
+            return
+        self._eta_deadline = time.time() + eta_seconds
+        self._tick_eta()
+
+    def _tick_eta(self) -> None:
+        """남은 시간 표시를 1초마다 갱신"""
+        remaining = max(int(self._eta_deadline - time.time()), 0)
+        if remaining >= 60:
+            text = f"약 {remaining // 60}분 {remaining % 60}초 남음"
+        elif remaining > 0:
+            text = f"약 {remaining}초 남음"
+        else:
+            text = "곧 완료"
+        self.eta_label.config(text=text)
+        self._eta_tick_id = self.root.after(1000, self._tick_eta)
+
+    def _stop_eta_countdown(self) -> None:
+        if self._eta_tick_id is not None:
+            self.root.after_cancel(self._eta_tick_id)
+            self._eta_tick_id = None
+
     def show_result(self, result) -> None:
         """결과 표시로 전환"""
         self.review_result = result
@@ -0,0 +1,256 @@
+"""
+Unity YAML diff 압축 모듈
+.prefab/.unity/.asset 등 Unity 직렬화 파일의 diff에서 참조 ID(fileID/guid)만 바뀐 라인과
+미세한 float 오차 변경을 요약으로 대체하고, 컴포넌트/필드의 의미 있는 변경만 남김
+"""
+import posixpath
+import re
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+
+# Unity가 텍스트(YAML)로 직렬화하는 확장자
+UNITY_YAML_EXTENSIONS = {
+    ".unity", ".prefab", ".asset", ".mat", ".anim", ".controller", ".overridecontroller",
+    ".physicmaterial", ".mask", ".playable", ".spriteatlas", ".lighting", ".rendertexture",
+    ".mixer"
+}
+
+# 같은 값으로 보는 float 차이 (절대값 1 이상은 상대 오차)
+FLOAT_EPSILON = 1e-4
+
+# 요약으로 대체한 라인 주변에 남길 context 라인 수
+COLLAPSED_CONTEXT = 1
+
+HUNK_HEADER_PATTERN = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@(.*)$")
+
+# 참조 ID: fileID, guid, 문서 앵커(--- !u!114 &123456)
+REFERENCE_PATTERN = re.compile(r"(fileID: *)-?\d+|(guid: *)[0-9a-fA-F]{32}|(&)-?\d+")
+NUMBER_PATTERN = re.compile(r"-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?")
+
+# 문서 헤더 "--- !u!<classID> &<fileID>" 와 최상위 타입 라인 "MonoBehaviour:"
+DOCUMENT_PATTERN = re.compile(r"^--- !u!(\d+)")
+COMPONENT_PATTERN = re.compile(r"^([A-Za-z][A-Za-z0-9_]*):\s*$")
+
+# 자주 쓰이는 Unity classID (hunk 헤더에 변경 위치 표시용)
+UNITY_CLASS_NAMES = {
+    1: "GameObject", 4: "Transform", 20: "Camera", 23: "MeshRenderer", 33: "MeshFilter",
+    54: "Rigidbody", 65: "BoxCollider", 82: "AudioSource", 95: "Animator", 108: "Light",
+    114: "MonoBehaviour", 135: "SphereCollider", 136: "CapsuleCollider", 137: "SkinnedMeshRenderer",
+    198: "ParticleSystem", 212: "SpriteRenderer", 222: "CanvasRenderer", 223: "Canvas",
+    224: "RectTransform", 1001: "PrefabInstance"
+}
+
+
+@dataclass
+class _Pair:
+    """삭제/추가 라인 쌍 (한쪽이 없을 수 있음)"""
+    removed: Optional[str]
+    added: Optional[str]
+    collapsed: bool = False
+
+
+def is_unity_yaml(depot_path: str) -> bool:
+    """Unity YAML 직렬화 파일인지 확인"""
+    return posixpath.splitext(depot_path.lower())[1] in UNITY_YAML_EXTENSIONS
+
+
+def _is_reference_only(old: str, new: str) -> bool:
+    """참조 ID만 다른 라인인지 확인"""
+    if old == new:
+        return False
+    return REFERENCE_PATTERN.sub(r"\1\2\3#", old) == REFERENCE_PATTERN.sub(r"\1\2\3#", new)
+
+
+def _is_float_noise(old: str, new: str) -> bool:
+    """숫자 값이 FLOAT_EPSILON 이내로만 다른 라인인지 확인"""
+    if old == new or NUMBER_PATTERN.sub("#", old) != NUMBER_PATTERN.sub("#", new):
+        return False
+    for a, b in zip(NUMBER_PATTERN.findall(old), NUMBER_PATTERN.findall(new)):
+        x, y = float(a), float(b)
+        if abs(x - y) > FLOAT_EPSILON * max(1.0, abs(x), abs(y)):
+            return False
+    return True
+
+
+def _component_name(line: str) -> Optional[str]:
+    """문서 헤더/최상위 타입 라인이면 컴포넌트 이름 반환"""
+    document = DOCUMENT_PATTERN.match(line)
+    if document:
+        class_id = int(document.group(1))
+        return UNITY_CLASS_NAMES.get(class_id, f"!u!{class_id}")
+    component = COMPONENT_PATTERN.match(line)
+    return component.group(1) if component else None
+
+
+def _pair_block(removed: List[str], added: List[str]) -> Tuple[List[_Pair], int, int]:
+    """
+    연속된 삭제/추가 블록을 라인 쌍으로 묶고 노이즈 쌍 표시
+
+    Returns:
+        (라인 쌍 목록, 참조 ID 변경 수, float 변경 수)
+    """
+    pairs: List[_Pair] = []
+    references = floats = 0
+    for i in range(max(len(removed), len(added))):
+        old = removed[i] if i < len(removed) else None
+        new = added[i] if i < len(added) else None
+        pair = _Pair(old, new)
+        if old is not None and new is not None:
+            if _is_reference_only(old, new):
+                pair.collapsed = True
+                references += 1
+            elif _is_float_noise(old, new):
+                pair.collapsed = True
+                floats += 1
+        pairs.append(pair)
+    return pairs, references, floats
+
+
+def _compact_hunk(hunk: List[str]) -> Tuple[List[str], int, int]:
+    """
+    hunk 하나 압축
+
+    노이즈 쌍은 새 값의 context 라인으로 바꾼 뒤, 남은 변경 주변 COLLAPSED_CONTEXT 라인만
+    남기도록 hunk를 다시 나누고 헤더의 라인 번호를 재계산
+
+    Returns:
+        (압축된 hunk 라인 목록 (여러 hunk일 수 있음), 참조 ID 변경 수, float 변경 수)
+    """
+    match = HUNK_HEADER_PATTERN.match(hunk[0])
+    if not match:
+        return hunk, 0, 0
+    old_line = int(match.group(1))
+    new_line = int(match.group(3))
+
+    # (종류, 내용) 목록: " " context, "-" 삭제, "+" 추가, "~" 노이즈 (버릴 수 있는 context)
+    entries: List[Tuple[str, str]] = []
+    references = floats = 0
+    removed: List[str] = []
+    added: List[str] = []
+
+    def flush() -> None:
+        nonlocal references, floats
+        pairs, refs, flts = _pair_block(removed, added)
+        references += refs
+        floats += flts
+        for pair in pairs:
+            if pair.collapsed:
+                entries.append(("~", pair.added))
+                continue
+            if pair.removed is not None:
+                entries.append(("-", pair.removed))
+            if pair.added is not None:
+                entries.append(("+", pair.added))
+        removed.clear()
+        added.clear()
+
+    for line in hunk[1:]:
+        if not line or line.startswith("\\"):
+            # 파일 사이 빈 줄, "\ No newline at end of file" 표시는 라인 수에 포함되지 않음
+            continue
+        if line.startswith("-"):
+            if added:
+                flush()
+            removed.append(line[1:])
+        elif line.startswith("+"):
+            added.append(line[1:])
+        else:
+            flush()
+            entries.append((" ", line[1:]))
+    flush()
+
+    if not references and not floats:
+        return hunk, 0, 0
+
+    # 남은 변경 주변 context만 유지
+    changed = [i for i, (kind, _) in enumerate(entries) if kind in "-+"]
+    keep = [False] * len(entries)
+    for i in changed:
+        for j in range(max(i - COLLAPSED_CONTEXT, 0), min(i + COLLAPSED_CONTEXT + 1, len(entries))):
+            keep[j] = True
+
+    lines: List[str] = []
+    component = match.group(5).strip() or None
+    block: List[str] = []
+    block_old = block_new = 0
+    old_count = new_count = 0
+    section = ""
+
+    def emit() -> None:
+        if not block:
+            return
+        start_old = block_old if old_count else block_old - 1
+        start_new = block_new if new_count else block_new - 1
+        lines.append(f"@@ -{start_old},{old_count} +{start_new},{new_count} @@{section}")
+        lines.extend(block)
+
+    for i, (kind, text) in enumerate(entries):
+        if keep[i]:
+            if not block:
+                block_old, block_new = old_line, new_line
+                old_count = new_count = 0
+                section = f" {component}" if component else ""
+            prefix = " " if kind == "~" else kind
+            block.append(prefix + text)
+            old_count += kind != "+"
+            new_count += kind != "-"
+        elif block:
+            emit()
+            block = []
+        if kind != "-":
+            component = _component_name(text) or component
+        old_line += kind != "+"
+        new_line += kind != "-"
+    emit()
+    return lines, references, floats
+
+
+def compact_unity_yaml_diff(diff: str) -> str:
+    """
+    Unity YAML diff 압축
+
+    - fileID/guid/앵커만 바뀐 라인 쌍과 FLOAT_EPSILON 이내의 float 변경은 제거하고
+      diff 앞에 생략한 개수를 한 줄로 표시
+    - 나머지 변경은 그대로 두고, hunk 헤더 뒤에 변경이 속한 컴포넌트 이름을 표시
+    - 노이즈만 있는 hunk는 통째로 제거 (남은 hunk 헤더의 라인 번호는 원본 기준으로 유지)
+
+    Args:
+        diff: p4 diff -du / describe -du 형식의 unified diff
+
+    Returns:
+        압축된 diff (압축할 변경이 없으면 원본 그대로)
+    """
+    if not diff or "@@" not in diff:
+        return diff
+
+    header: List[str] = []
+    hunks: List[List[str]] = []
+    for line in diff.split("\n"):
+        if HUNK_HEADER_PATTERN.match(line):
+            hunks.append([line])
+        elif hunks:
+            hunks[-1].append(line)
+        else:
+            header.append(line)
+
+    references = floats = 0
+    body: List[str] = []
+    for hunk in hunks:
+        lines, refs, flts = _compact_hunk(hunk)
+        references += refs
+        floats += flts
+        body.extend(lines)
+
+    if not references and not floats:
+        return diff
+
+    notes = []
+    if references:
+        notes.append(f"참조 ID(fileID/guid)만 바뀐 라인 {references}개")
+    if floats:
+        notes.append(f"미세한 float 변경 {floats}개")
+    summary = f"(Unity YAML: {', '.join(notes)} 생략)"
+    if not body:
+        summary = f"(Unity YAML: {', '.join(notes)}만 있음)"
+    return "\n".join(header + [summary] + body)
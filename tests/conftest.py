@@ -0,0 +1,71 @@
+"""
+pytest 공통 설정
+설정/캐시 디렉토리를 테스트마다 임시 디렉토리로 분리
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src import config_manager  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def isolated_config(tmp_path, monkeypatch):
+    """%APPDATA%를 임시 디렉토리로 바꾸고 설정 싱글톤 초기화"""
+    monkeypatch.setenv("APPDATA", str(tmp_path))
+    monkeypatch.setattr(config_manager, "_config_instance", None)
+    yield config_manager.get_config()
+    config_manager._config_instance = None
+
+
+@pytest.fixture
+def review_generator():
+    """p4/n8n 호출을 대체한 ReviewGenerator 생성 함수
+
+    make(files) - files: [(depot_path, diff), ...]
+    생성된 generator.sent에 전송한 페이로드가 기록되고, generator.fail(path)로 해당 파일이 든
+    배치 요청을 실패시킬 수 있음
+    """
+    from src.commands.review import ReviewGenerator
+    from src.n8n_client import N8NError
+    from src.p4_client import ChangelistInfo, FileChange
+
+    def make(files, use_cache=False):
+        generator = ReviewGenerator(webhook_url="http://localhost", use_cache=use_cache)
+        diffs = dict(files)
+        generator.sent = []
+        generator.failing = set()
+
+        def get_changelist_info(number):
+            return ChangelistInfo(
+                number=number, user="u", client="c", status="pending", description="d",
+                files=[FileChange(depot_path=path, action="edit", file_type="text") for path, _ in files]
+            )
+
+        def iter_diffs(info, profile=None):
+            for f in info.files:
+                f.diff = diffs[f.depot_path]
+                yield f
+
+        def post(payload):
+            paths = [f["depot_path"] for f in payload["files"]]
+            if generator.failing & set(paths):
+                raise N8NError("실패")
+            generator.sent.append(payload)
+            comments = [
+                {"file_path": path, "line_number": 1, "severity": "warning", "category": "bug", "message": path}
+                for path in paths
+            ]
+            return {"success": True, "comments": comments, "overall_score": 80, "summary": "ok"}
+
+        generator.p4.get_changelist_info = get_changelist_info
+        generator.p4.iter_diffs = iter_diffs
+        generator.p4.get_file_sizes = lambda files, status: {}
+        generator.n8n._post_request = post
+        generator.fail = generator.failing.add
+        return generator
+
+    return make
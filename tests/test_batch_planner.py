@@ -0,0 +1,140 @@
+import posixpath
+
+from src.batch_planner import (
+    HUNK_HEADER_PATTERN,
+    BatchPlanner,
+    drop_line_ranges,
+    estimate_file_tokens,
+    estimate_tokens,
+    split_diff_into_hunks,
+    split_file_change
+)
+from src.commands.review import ReviewGenerator
+from src.p4_client import FileChange
+
+
+HEADER = "--- //depot/Game/Player.cs\n+++ //depot/Game/Player.cs"
+
+
+def hunk(start, changed=20):
+    """start 라인부터 changed줄을 바꾼 hunk"""
+    lines = [f"@@ -{start},{changed} +{start},{changed} @@ class Player"]
+    lines += [f"-    int value{start + i} = {i};" for i in range(changed)]
+    lines += [f"+    long value{start + i} = {i};" for i in range(changed)]
+    return "\n".join(lines)
+
+
+def make_file(*hunks):
+    diff = "\n".join([HEADER] + list(hunks))
+    return FileChange(depot_path="//depot/Game/Player.cs", action="edit", file_type="text", diff=diff)
+
+
+def test_small_file_not_split():
+    file = make_file(hunk(1))
+    assert split_file_change(file, 100000) == [file]
+
+
+def test_split_keeps_header_and_original_line_ranges():
+    parts = split_file_change(make_file(hunk(10), hunk(200), hunk(500)), 400)
+    assert len(parts) == 3
+    assert [p.part_info["line_start"] for p in parts] == [10, 200, 500]
+    assert [p.part_info["line_end"] for p in parts] == [29, 219, 519]
+    for index, part in enumerate(parts, 1):
+        assert part.diff.startswith(HEADER)
+        assert part.part_info["index"] == index
+        assert part.part_info["total"] == 3
+        assert part.diff_full == ""
+
+
+def test_oversized_hunk_split_with_recomputed_offsets():
+    parts = split_file_change(make_file(hunk(100, changed=60)), 400)
+    assert len(parts) > 1
+    new_lines = []
+    for part in parts:
+        _, hunks = split_diff_into_hunks(part.diff)
+        for h in hunks:
+            match = HUNK_HEADER_PATTERN.match(h[0])
+            new_start = int(match.group(3))
+            added = [line for line in h[1:] if line.startswith("+")]
+            assert int(match.group(4)) == len(added)
+            new_lines += [(new_start + i, line) for i, line in enumerate(added)]
+    # 추가 라인이 원본 hunk의 새 파일 라인 번호를 그대로 유지
+    assert new_lines[0] == (100, "+    long value100 = 0;")
+    assert new_lines[-1] == (159, "+    long value159 = 59;")
+
+
+def test_drop_line_ranges_keeps_unsent_hunks():
+    file = make_file(hunk(10), hunk(200), hunk(500))
+    remaining = drop_line_ranges(file, [(10, 29), (200, 219)])
+    assert remaining.part_info is None
+    assert "@@ -500,20 +500,20 @@" in remaining.diff
+    assert "@@ -10," not in remaining.diff and "@@ -200," not in remaining.diff
+    assert drop_line_ranges(file, [(1, 100), (101, 600)]) is None
+
+
+def test_remap_part_line():
+    parts = [{"index": 2, "total": 3, "line_start": 200, "line_end": 219}]
+    remap = ReviewGenerator._remap_part_line
+    # 원본 라인 번호는 그대로
+    assert remap(205, parts) == 205
+    # 부분 diff 기준 상대 라인 번호는 부분 시작 라인만큼 이동
+    assert remap(3, parts) == 202
+    # 어느 범위에도 맞지 않으면 그대로
+    assert remap(900, parts) == 900
+    assert remap(0, parts) == 0
+    two = parts + [{"index": 3, "total": 3, "line_start": 500, "line_end": 519}]
+    assert remap(3, two) == 3
+
+
+def small_file(path, lines=5):
+    diff = "\n".join(["@@ -1,{0} +1,{0} @@".format(lines)] + [f"+line {i} {'x' * 60}" for i in range(lines)])
+    return FileChange(depot_path=path, action="edit", file_type="text", diff=diff)
+
+
+def test_estimate_tokens_counts_non_ascii_per_character():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("abcd" * 10) == 10
+    assert estimate_tokens("가나다") == 3
+
+
+def test_small_changelist_is_one_batch():
+    files = [small_file(f"//d/a/{i}.cs") for i in range(3)]
+    assert BatchPlanner().plan(files) == [files]
+    assert BatchPlanner().plan([]) == []
+
+
+def test_batches_respect_token_budget_and_file_limit():
+    files = [small_file(f"//d/{d}/{i}.cs", lines=20) for d in "abcd" for i in range(6)]
+    planner = BatchPlanner(max_tokens=2000, max_files=5, base_tokens=300)
+    batches = planner.plan(files)
+    assert sorted(f.depot_path for b in batches for f in b) == sorted(f.depot_path for f in files)
+    for batch in batches:
+        assert len(batch) <= 5
+        assert sum(estimate_file_tokens(f) for f in batch) <= planner.file_budget
+    # 같은 디렉토리 파일은 나뉘더라도 연속된 묶음으로 배치됨
+    for batch in batches:
+        assert len({posixpath.dirname(f.depot_path) for f in batch}) <= 2
+
+
+def test_batches_keep_original_order():
+    files = [small_file(f"//d/{d}/{i}.cs", lines=30) for d in "ab" for i in range(4)]
+    batches = BatchPlanner(max_tokens=2500).plan(files)
+    assert len(batches) > 1
+    position = {f.depot_path: i for i, f in enumerate(files)}
+    for batch in batches:
+        assert [position[f.depot_path] for f in batch] == sorted(position[f.depot_path] for f in batch)
+    assert [position[b[0].depot_path] for b in batches] == sorted(position[b[0].depot_path] for b in batches)
+
+
+def test_group_key_separates_batches():
+    files = [small_file("//d/a.cs"), small_file("//d/b.h"), small_file("//d/c.cs")]
+    planner = BatchPlanner(group_key=lambda path: path.rsplit(".", 1)[1])
+    batches = planner.plan(files)
+    assert [[f.depot_path for f in b] for b in batches] == [["//d/a.cs", "//d/c.cs"], ["//d/b.h"]]
+
+
+def test_oversized_file_is_split_into_parts():
+    batches = BatchPlanner(max_tokens=600).plan([make_file(hunk(10), hunk(200), hunk(500))])
+    parts = [f for b in batches for f in b]
+    assert len(parts) == 3
+    assert [p.part_info["index"] for p in parts] == [1, 2, 3]
@@ -0,0 +1,103 @@
+import time
+
+from src.changelist_snapshot import SNAPSHOT_VERSION, ChangelistSnapshot, fill_changelist_diffs
+from src.checkpoint import write_json_atomic
+from src.p4_client import FETCH_DESCRIPTION, FETCH_REVIEW, ChangelistInfo, FileChange
+
+
+class FakeP4:
+    """p4 diff 호출을 기록하는 P4Client 대체"""
+
+    def __init__(self, fingerprints=None):
+        self.fingerprints = fingerprints or {}
+        self.fetched = []
+
+    def get_file_fingerprints(self, info):
+        return {f.depot_path: self.fingerprints.get(f.depot_path, "edit#1") for f in info.files}
+
+    def iter_diffs(self, info, profile=FETCH_REVIEW):
+        for f in info.files:
+            self.fetched.append((f.depot_path, profile.short_context, profile.full_context))
+            if profile.short_context:
+                f.diff = f"@@ -1,1 +1,1 @@\n-a\n+{f.depot_path}"
+            if profile.full_context:
+                f.diff_full = f"full {f.depot_path}"
+            yield f
+
+
+def make_info(*paths):
+    files = [FileChange(depot_path=path, action="edit") for path in paths]
+    return ChangelistInfo(number=7, user="u", client="c", status="pending", description="d", files=files)
+
+
+def test_fill_returns_filled_files_in_order():
+    info = make_info("//d/a.cs", "//d/b.cs")
+    files = fill_changelist_diffs(FakeP4(), info, FETCH_DESCRIPTION)
+    assert [f.depot_path for f in files] == ["//d/a.cs", "//d/b.cs"]
+    assert all(f.diff.endswith(f.depot_path) for f in files)
+    assert all(not f.diff_full for f in files)
+
+
+def test_fill_without_cache_goes_to_p4():
+    p4 = FakeP4()
+    fill_changelist_diffs(p4, make_info("//d/a.cs"), use_cache=False)
+    fill_changelist_diffs(p4, make_info("//d/a.cs"), use_cache=False)
+    assert len(p4.fetched) == 2
+
+
+def test_load_keeps_only_matching_unexpired_entries(tmp_path, monkeypatch):
+    snapshot = ChangelistSnapshot(tmp_path / "cl_7.json", ttl_seconds=3600)
+    now = time.time()
+    snapshot.save({
+        "//d/a.cs": {"fingerprint": "edit#1", "created": now, "diff": "a"},
+        "//d/b.cs": {"fingerprint": "edit#1", "created": now, "diff": "b"},
+        "//d/c.cs": {"fingerprint": "edit#1", "created": now - 7200, "diff": "c"}
+    })
+    loaded = snapshot.load({"//d/a.cs": "edit#1", "//d/b.cs": "edit#2", "//d/c.cs": "edit#1"})
+    assert list(loaded) == ["//d/a.cs"]
+
+    monkeypatch.setattr(time, "time", lambda: now + 7200)
+    assert snapshot.load({"//d/a.cs": "edit#1"}) == {}
+
+
+def test_load_ignores_other_versions(tmp_path):
+    path = tmp_path / "cl_7.json"
+    entry = {"fingerprint": "edit#1", "created": time.time(), "diff": "a"}
+    write_json_atomic(path, {"version": SNAPSHOT_VERSION + 1, "files": {"//d/a.cs": entry}})
+    assert ChangelistSnapshot(path, 3600).load({"//d/a.cs": "edit#1"}) == {}
+
+
+def test_review_after_description_fetches_only_full_diff():
+    p4 = FakeP4()
+    fill_changelist_diffs(p4, make_info("//d/a.cs", "//d/b.cs"), FETCH_DESCRIPTION)
+    p4.fetched.clear()
+
+    files = fill_changelist_diffs(p4, make_info("//d/a.cs", "//d/b.cs"), FETCH_REVIEW)
+    assert p4.fetched == [("//d/a.cs", False, True), ("//d/b.cs", False, True)]
+    assert [f.diff_full for f in files] == ["full //d/a.cs", "full //d/b.cs"]
+    assert files[0].diff.endswith("//d/a.cs")
+
+    # 전체 소스 diff까지 저장되었으므로 다음 리뷰는 p4를 호출하지 않음
+    p4.fetched.clear()
+    fill_changelist_diffs(p4, make_info("//d/a.cs", "//d/b.cs"), FETCH_REVIEW)
+    assert p4.fetched == []
+
+
+def test_changed_file_is_fetched_again():
+    p4 = FakeP4()
+    fill_changelist_diffs(p4, make_info("//d/a.cs", "//d/b.cs"))
+    p4.fetched.clear()
+
+    p4.fingerprints["//d/b.cs"] = "edit#2"
+    files = fill_changelist_diffs(p4, make_info("//d/a.cs", "//d/b.cs"))
+    assert p4.fetched == [("//d/b.cs", True, True)]
+    assert [f.depot_path for f in files] == ["//d/a.cs", "//d/b.cs"]
+    assert files[0].diff_full == "full //d/a.cs"
+
+
+def test_disabled_snapshot_goes_to_p4(isolated_config):
+    isolated_config._config["changelist_snapshot"] = {"enabled": False}
+    p4 = FakeP4()
+    fill_changelist_diffs(p4, make_info("//d/a.cs"))
+    fill_changelist_diffs(p4, make_info("//d/a.cs"))
+    assert len(p4.fetched) == 2
@@ -0,0 +1,124 @@
+import pytest
+
+from src.batch_planner import hunk_new_range
+from src.checkpoint import ReviewCheckpoint
+from src.p4_client import ChangelistInfo, FileChange
+
+
+class Interrupted(BaseException):
+    """리뷰 도중 프로세스 중단 (Ctrl+C 등) 재현용"""
+
+
+def big_diff(tag, hunks=700):
+    """배치 하나를 거의 채우는 diff"""
+    return "\n".join(
+        f"@@ -{k * 10 + 1},1 +{k * 10 + 1},1 @@\n-old {tag} {k} {'x' * 100}\n+new {tag} {k} {'y' * 100}"
+        for k in range(hunks)
+    )
+
+
+def make_info(*paths):
+    files = [FileChange(depot_path=path, action="edit", diff=f"@@ -1 +1 @@\n-a\n+{path}") for path in paths]
+    return ChangelistInfo(number=31, user="u", client="c", status="pending", description="d", files=files)
+
+
+def interrupt_after(generator, count):
+    """count번 요청한 뒤 다음 요청에서 중단"""
+    post = generator.n8n._post_request
+
+    def interrupted(payload):
+        if len(generator.sent) >= count:
+            raise Interrupted()
+        return post(payload)
+
+    generator.n8n._post_request = interrupted
+
+
+def sent_paths(generator):
+    return [[f["depot_path"] for f in payload["files"]] for payload in generator.sent]
+
+
+def hunk_starts(generator, depot_path):
+    """전송한 diff의 hunk별 새 파일 시작 라인"""
+    return [
+        hunk_new_range([line])[0]
+        for payload in generator.sent for f in payload["files"] if f["depot_path"] == depot_path
+        for line in f["diff"].split("\n") if line.startswith("@@")
+    ]
+
+
+def test_plan_is_incremental_until_saved():
+    checkpoint = ReviewCheckpoint.for_changelist(31)
+    info = make_info("//d/a.cs", "//d/b.cs")
+    checkpoint.start(info, incremental=True)
+    checkpoint.add_batch(1, info.files[:1])
+    checkpoint.save_batch(1, {"success": True, "comments": []})
+
+    loaded_info, batches, results, complete = checkpoint.load()
+    assert not complete
+    assert checkpoint.is_incremental()
+    assert [f.depot_path for f in loaded_info.files] == ["//d/a.cs", "//d/b.cs"]
+    assert [[f.depot_path for f in b] for b in batches] == [["//d/a.cs"]]
+    assert results == [{"success": True, "comments": []}]
+
+    checkpoint.save_plan(info, [info.files[:1], info.files[1:]])
+    _, batches, results, complete = checkpoint.load()
+    assert complete
+    assert len(batches) == 2
+    assert results[1] is None
+    assert checkpoint.is_incremental()
+
+
+def test_complete_plan_with_missing_batch_is_ignored():
+    checkpoint = ReviewCheckpoint.for_changelist(31)
+    info = make_info("//d/a.cs", "//d/b.cs")
+    checkpoint.start(info)
+    checkpoint.save_plan(info, [info.files[:1], info.files[1:]])
+    (checkpoint.run_dir / "plan_0002.json").unlink()
+    assert checkpoint.load() is None
+
+    checkpoint.discard()
+    assert not checkpoint.exists()
+
+
+def test_resume_after_interrupted_pipeline(review_generator):
+    files = [(f"//d/f{i}.cs", big_diff(i)) for i in range(4)]
+    generator = review_generator(files)
+    interrupt_after(generator, 2)
+    with pytest.raises(Interrupted):
+        generator.generate(31)
+    assert sent_paths(generator) == [["//d/f0.cs"], ["//d/f1.cs"]]
+
+    checkpoint = ReviewCheckpoint.for_changelist(31)
+    _, batches, results, complete = checkpoint.load()
+    assert not complete
+    # 중단된 요청의 배치도 요청 전에 기록됨
+    assert [[f.depot_path for f in b] for b in batches] == [["//d/f0.cs"], ["//d/f1.cs"], ["//d/f2.cs"]]
+    assert all(r is not None for r in results[:2]) and results[2] is None
+
+    resumed = review_generator(files)
+    result = resumed.resume(31)
+    assert result.success and not result.partial
+    assert sent_paths(resumed) == [["//d/f2.cs"], ["//d/f3.cs"]]
+    assert sorted(c.file_path for c in result.comments) == [path for path, _ in files]
+    assert not checkpoint.exists()
+
+
+def test_resume_sends_only_unsent_parts_of_split_file(review_generator):
+    files = [("//d/huge.cs", big_diff("h", hunks=2500)), ("//d/small.cs", big_diff("s", hunks=10))]
+    generator = review_generator(files)
+    interrupt_after(generator, 2)
+    with pytest.raises(Interrupted):
+        generator.generate(32)
+    first_starts = hunk_starts(generator, "//d/huge.cs")
+
+    resumed = review_generator(files)
+    result = resumed.resume(32)
+    assert result.success and not result.partial
+
+    # 이미 응답받은 부분의 hunk는 다시 보내지 않고, 나머지 hunk는 빠짐없이 보냄
+    resumed_starts = hunk_starts(resumed, "//d/huge.cs")
+    assert first_starts and resumed_starts
+    assert not set(first_starts) & set(resumed_starts)
+    assert sorted(first_starts + resumed_starts) == [k * 10 + 1 for k in range(2500)]
+    assert {c.file_path for c in result.comments} == {"//d/huge.cs", "//d/small.cs"}
@@ -0,0 +1,11 @@
+from src.config_manager import ConfigManager
+
+
+def test_config_dir_uses_appdata(tmp_path):
+    assert ConfigManager().config_dir == tmp_path / "P4V-AI-Assistant"
+
+
+def test_config_dir_without_appdata_is_under_home(monkeypatch, tmp_path):
+    monkeypatch.delenv("APPDATA", raising=False)
+    monkeypatch.setenv("HOME", str(tmp_path))
+    assert ConfigManager().config_dir == tmp_path / ".config" / "P4V-AI-Assistant"
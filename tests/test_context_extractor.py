@@ -0,0 +1,73 @@
+from src.context_extractor import _parse_lines, detect_language, expand_diff_context
+
+
+SOURCE = [
+    "namespace Game",
+    "{",
+    "    public class Player",
+    "    {",
+    "        public void TakeDamage(int amount)",
+    "        {",
+    "            var before = health;",
+    "",
+    "            health -= amount;",
+    "",
+    "            Log(before);",
+    "            Notify();",
+    "            Save();",
+    "        }",
+    "",
+    "        public void Heal() { health = 100; }",
+    "    }",
+    "}",
+]
+
+
+def full_diff(changed_line, old_text, new_text):
+    """changed_line(1부터)을 바꾼 전체 소스 diff (빈 context 라인은 p4처럼 끝 공백 없이 빈 문자열)"""
+    body = []
+    for number, text in enumerate(SOURCE, 1):
+        if number == changed_line:
+            body += [f"-{old_text}", f"+{new_text}"]
+        else:
+            body.append(f" {text}" if text else "")
+    return "\n".join([f"@@ -1,{len(SOURCE)} +1,{len(SOURCE)} @@"] + body) + "\n"
+
+
+def short_diff(changed_line, old_text, new_text):
+    start = changed_line - 3
+    body = [f" {t}" if t else "" for t in SOURCE[start - 1:changed_line - 1]]
+    body += [f"-{old_text}", f"+{new_text}"]
+    body += [f" {t}" if t else "" for t in SOURCE[changed_line:changed_line + 3]]
+    return "\n".join([f"@@ -{start},7 +{start},7 @@"] + body)
+
+
+def test_blank_context_lines_keep_line_numbers():
+    lines = _parse_lines(full_diff(13, "            Save();", "            SaveAsync();"))
+    assert len(lines) == len(SOURCE) + 1
+    removed = next(line for line in lines if line.kind == "-")
+    added = next(line for line in lines if line.kind == "+")
+    assert (removed.old, added.new) == (13, 13)
+    assert [line.new for line in lines if line.kind != "-"] == list(range(1, len(SOURCE) + 1))
+
+
+def test_expands_to_enclosing_method_with_original_numbers():
+    old, new = "            Save();", "            SaveAsync();"
+    expanded = expand_diff_context(short_diff(13, old, new), full_diff(13, old, new), "brace", 3000)
+    header = expanded.split("\n")[0]
+    # 메서드 시작(5)부터 기본 context 끝(16)까지, 빈 라인 포함 원본 라인 번호 유지
+    assert header == "@@ -5,12 +5,12 @@ public void TakeDamage(int amount)"
+    assert expanded.split("\n")[1] == "         public void TakeDamage(int amount)"
+    assert "class Player" not in expanded
+
+
+def test_over_budget_keeps_original_diff():
+    old, new = "            Save();", "            SaveAsync();"
+    diff = short_diff(13, old, new)
+    assert expand_diff_context(diff, full_diff(13, old, new), "brace", 5) == diff
+
+
+def test_detect_language():
+    assert detect_language("//d/Player.CS") == "brace"
+    assert detect_language("//d/tool.py") == "python"
+    assert detect_language("//d/readme.md") is None
@@ -0,0 +1,87 @@
+from src.batch_planner import estimate_file_tokens
+from src.commands.review import CoverageReport, ReviewGenerator
+from src.p4_client import FileChange
+
+
+def diff(tag, hunks=1, context=3):
+    """hunk마다 context줄 앞뒤 문맥이 있는 diff"""
+    lines = []
+    for k in range(hunks):
+        start = k * 100 + 1
+        size = context * 2 + 1
+        lines.append(f"@@ -{start},{size} +{start},{size} @@")
+        lines += [f" ctx {tag} {k} {i} {'c' * 40}" for i in range(context)]
+        lines += [f"-old {tag} {k}", f"+new {tag} {k}"]
+        lines += [f" ctx {tag} {k} {i + context} {'c' * 40}" for i in range(context)]
+    return "\n".join(lines)
+
+
+def change(path, text):
+    return FileChange(depot_path=path, action="edit", file_type="text", diff=text)
+
+
+def test_take_deadline_batch_keeps_risk_order_within_budget():
+    files = [change(f"//d/{i}.cs", diff(i)) for i in range(4)]
+    budget = estimate_file_tokens(files[0]) * 2 + 1
+    batch, rest, trimmed = ReviewGenerator._take_deadline_batch(files, budget, 50)
+    assert [f.depot_path for f in batch] == ["//d/0.cs", "//d/1.cs"]
+    assert [f.depot_path for f in rest] == ["//d/2.cs", "//d/3.cs"]
+    assert trimmed == []
+
+
+def test_take_deadline_batch_trims_context_before_skipping():
+    files = [change("//d/a.cs", diff("a")), change("//d/b.cs", diff("b"))]
+    budget = estimate_file_tokens(files[0]) + estimate_file_tokens(files[1]) // 2
+    batch, rest, trimmed = ReviewGenerator._take_deadline_batch(files, budget, 50)
+    assert [f.depot_path for f in batch] == ["//d/a.cs", "//d/b.cs"]
+    assert trimmed == ["//d/b.cs"]
+    assert " ctx b" not in batch[1].diff and "+new b 0" in batch[1].diff
+    assert rest == []
+
+
+def test_take_deadline_batch_sends_front_of_large_first_file():
+    big = change("//d/big.cs", diff("big", hunks=40, context=0))
+    batch, rest, trimmed = ReviewGenerator._take_deadline_batch([big], 300, 50)
+    assert len(batch) == 1 and batch[0].part_info["index"] == 1
+    assert "+new big 0" in batch[0].diff
+    assert all(part.depot_path == "//d/big.cs" for part in rest) and rest
+    assert trimmed == ["//d/big.cs"]
+
+
+def test_take_deadline_batch_respects_file_limit_and_group_key():
+    files = [change("//d/a.cs", diff("a")), change("//d/b.h", diff("b")), change("//d/c.cs", diff("c"))]
+    batch, rest, _ = ReviewGenerator._take_deadline_batch(files, 10 ** 6, 50, lambda p: p[-2:])
+    assert [f.depot_path for f in batch] == ["//d/a.cs", "//d/c.cs"]
+    assert [f.depot_path for f in rest] == ["//d/b.h"]
+    batch, rest, _ = ReviewGenerator._take_deadline_batch(files, 10 ** 6, 1)
+    assert len(batch) == 1 and len(rest) == 2
+
+
+def test_deadline_review_sends_risky_files_first_and_reports_coverage(review_generator):
+    files = [
+        ("//d/ui/Button.cs", diff("ui")),
+        ("//d/thirdparty/Json.cs", diff("lib")),
+        ("//d/net/AuthServer.cs", diff("auth")),
+        ("//d/readme.txt", diff("doc"))
+    ]
+    generator = review_generator(files)
+    result = generator.generate(35, deadline=120)
+    sent = [f["depot_path"] for payload in generator.sent for f in payload["files"]]
+    assert sent[0] == "//d/net/AuthServer.cs"
+    assert "//d/thirdparty/Json.cs" not in sent
+
+    coverage = result.coverage
+    assert coverage.total_files == 4
+    assert sorted(coverage.reviewed_files) == ["//d/net/AuthServer.cs", "//d/readme.txt", "//d/ui/Button.cs"]
+    assert list(coverage.skipped_files) == ["//d/thirdparty/Json.cs"]
+    assert result.summary.startswith("[마감 120초 모드")
+
+
+def test_coverage_describe():
+    coverage = CoverageReport(deadline=60, elapsed=12.34, total_files=4, reviewed_files=["a", "b"])
+    coverage.reduced_files = ["b"]
+    coverage.skipped_files = {"c": "시간 부족: diff 미수집", "d": "시간 부족: 리뷰 미요청"}
+    assert coverage.ratio == 0.5
+    assert coverage.describe() == (
+        "마감 60초 모드 (12.3초 소요): 전체 4개 파일 중 2개 리뷰 (축소 리뷰 1개), 제외: 시간 부족 2개"
+    )
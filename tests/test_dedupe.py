@@ -0,0 +1,70 @@
+from src.commands.review import ReviewGenerator
+from src.p4_client import FileChange
+
+
+DIFF = "@@ -1,2 +1,2 @@\n int a;\n-int b;\n+int c;"
+
+
+def change(path, diff):
+    return FileChange(depot_path=path, action="edit", file_type="text", diff=diff)
+
+
+def test_dedupe_ignores_headers_and_line_endings():
+    unique = {}
+    first = change("//d/a/Util.cs", f"==== //d/a/Util.cs#3 ====\n{DIFF}")
+    second = change("//d/b/Util.cs", f"==== //d/b/Util.cs#1 ====\n{DIFF.replace(chr(10), chr(13) + chr(10))}  \n")
+    other = change("//d/c/Util.cs", DIFF.replace("int c", "int d"))
+
+    assert not ReviewGenerator._dedupe(first, unique)
+    assert ReviewGenerator._dedupe(second, unique)
+    assert not ReviewGenerator._dedupe(other, unique)
+    assert first.shared_paths == ["//d/b/Util.cs"]
+    assert other.shared_paths == []
+
+
+def test_dedupe_skips_diffs_without_hunks():
+    unique = {}
+    first = change("//d/a.png", "(바이너리 파일)")
+    second = change("//d/b.png", "(바이너리 파일)")
+
+    assert not ReviewGenerator._dedupe(first, unique)
+    assert not ReviewGenerator._dedupe(second, unique)
+    assert first.shared_paths == []
+
+
+def test_merge_copies_comments_to_shared_paths():
+    generator = ReviewGenerator(webhook_url="http://localhost", use_cache=False)
+    sent = change("//d/a/Util.cs", DIFF)
+    sent.shared_paths = ["//d/b/Util.cs", "//d/c/Util.cs"]
+    response = {
+        "success": True,
+        "comments": [{"file_path": "//d/a/Util.cs", "line_number": 2, "severity": "warning", "message": "m"}],
+        "overall_score": 70,
+        "statistics": {"warning": 1}
+    }
+
+    merged = generator._merge_results([response], [[sent]])
+
+    assert [(c.file_path, c.line_number, c.message) for c in merged.comments] == [
+        ("//d/a/Util.cs", 2, "m"),
+        ("//d/b/Util.cs", 2, "m"),
+        ("//d/c/Util.cs", 2, "m"),
+    ]
+    assert merged.statistics["warning"] == 3
+
+
+def test_identical_diffs_are_sent_once(review_generator):
+    generator = review_generator([
+        ("//d/a/Util.cs", DIFF),
+        ("//d/b/Util.cs", DIFF),
+        ("//d/Other.cs", DIFF.replace("int c", "int d")),
+    ])
+
+    result = generator.generate(42)
+
+    sent = [f["depot_path"] for payload in generator.sent for f in payload["files"]]
+    assert sent == ["//d/a/Util.cs", "//d/Other.cs"]
+    assert result.shared_files == {"//d/b/Util.cs": "//d/a/Util.cs"}
+    assert sorted(c.file_path for c in result.comments) == ["//d/Other.cs", "//d/a/Util.cs", "//d/b/Util.cs"]
+    shared = [c for c in result.comments if c.file_path == "//d/b/Util.cs"]
+    assert shared[0].message == "//d/a/Util.cs"
@@ -0,0 +1,132 @@
+import pytest
+
+from src.commands.description import DescriptionGenerator, extract_prefix
+from src.p4_client import ChangelistInfo, FileChange
+
+
+def big_diff(tag, hunks=700):
+    """배치 하나를 거의 채우는 diff"""
+    return "\n".join(
+        f"@@ -{k * 10 + 1},1 +{k * 10 + 1},1 @@\n-old {tag} {k} {'x' * 100}\n+new {tag} {k} {'y' * 100}"
+        for k in range(hunks)
+    )
+
+
+SMALL = "@@ -1,1 +1,1 @@\n-int a;\n+int b;"
+
+
+@pytest.fixture
+def description_generator():
+    """p4/n8n 호출을 대체한 DescriptionGenerator 생성 함수
+
+    make(files) - files: [(depot_path, diff), ...]
+    map 요청은 "part <배치 번호>", reduce/단일 요청은 "merged"를 description으로 응답
+    """
+    def make(files, empty_parts=()):
+        generator = DescriptionGenerator(webhook_url="http://localhost", use_cache=False)
+        diffs = dict(files)
+        generator.sent = []
+        generator.applied = []
+
+        def get_changelist_info(number):
+            return ChangelistInfo(
+                number=number, user="u", client="c", status="pending", description="[UI][홍길동] 작업 중",
+                files=[FileChange(depot_path=path, action="edit", file_type="text") for path, _ in files]
+            )
+
+        def iter_diffs(info, profile=None):
+            for f in info.files:
+                f.diff = diffs[f.depot_path]
+                yield f
+
+        def post(payload):
+            generator.sent.append(payload)
+            if payload.get("description_stage") == "map":
+                current = payload["batch_info"]["current"]
+                text = "" if current in empty_parts else f"part {current}"
+                return {"success": True, "description": text}
+            return {"success": True, "description": "merged", "summary": "s"}
+
+        generator.p4.get_changelist_info = get_changelist_info
+        generator.p4.iter_diffs = iter_diffs
+        generator.p4.update_changelist_description = lambda number, text: generator.applied.append(text)
+        generator.n8n._post_request = post
+        return generator
+
+    return make
+
+
+def test_extract_prefix():
+    assert extract_prefix("[1UD][클라/홍길동] 작업 중") == "[1UD][클라/홍길동]"
+    assert extract_prefix("[클라/홍길동] 버그 수정") == "[클라/홍길동]"
+    assert extract_prefix("작업 중...") == ""
+    assert extract_prefix("") == ""
+
+
+def test_small_changelist_is_one_request(description_generator):
+    generator = description_generator([("//d/a.cs", SMALL), ("//d/b.cs", SMALL)])
+
+    result = generator.generate(48)
+
+    assert result["success"] and result["applied"]
+    assert result["batches"] == 1
+    assert len(generator.sent) == 1
+    assert "description_stage" not in generator.sent[0]
+    assert result["description"] == "[UI][홍길동]merged"
+    assert generator.applied == [result["description"]]
+
+
+def test_large_changelist_maps_batches_and_merges(description_generator):
+    files = [(f"//d/f{i}.cs", big_diff(i)) for i in range(3)]
+    generator = description_generator(files)
+
+    result = generator.generate(49)
+
+    assert result["success"]
+    assert result["batches"] == 3
+    maps = [p for p in generator.sent if p.get("description_stage") == "map"]
+    reduces = [p for p in generator.sent if p.get("description_stage") == "reduce"]
+    assert sorted(p["batch_info"]["current"] for p in maps) == [1, 2, 3]
+    assert all(p["batch_info"]["total"] == 3 for p in maps)
+    assert len(reduces) == 1 and generator.sent[-1] is reduces[0]
+
+    # 배치 순서대로 요약을 합치고, reduce 요청에는 diff 없이 경로만 보냄
+    assert reduces[0]["partial_descriptions"] == [
+        {"files": ["//d/f0.cs"], "description": "part 1"},
+        {"files": ["//d/f1.cs"], "description": "part 2"},
+        {"files": ["//d/f2.cs"], "description": "part 3"},
+    ]
+    assert [f["depot_path"] for f in reduces[0]["files"]] == [path for path, _ in files]
+    assert not any(f.get("diff") for f in reduces[0]["files"])
+    assert result["description"] == "[UI][홍길동]merged"
+
+
+def test_empty_batch_summaries_are_left_out(description_generator):
+    generator = description_generator([(f"//d/f{i}.cs", big_diff(i)) for i in range(3)], empty_parts={2})
+
+    result = generator.generate(50)
+
+    assert result["success"]
+    assert [p["files"] for p in generator.sent[-1]["partial_descriptions"]] == [["//d/f0.cs"], ["//d/f2.cs"]]
+
+
+def test_no_batch_summary_is_an_error(description_generator):
+    generator = description_generator([(f"//d/f{i}.cs", big_diff(i)) for i in range(2)], empty_parts={1, 2})
+
+    result = generator.generate(51)
+
+    assert not result["success"]
+    assert "배치별 요약을 생성하지 못했습니다" in result["error"]
+    assert not any(p.get("description_stage") == "reduce" for p in generator.sent)
+    assert generator.applied == []
+
+
+def test_map_reduce_disabled_sends_one_request(description_generator, isolated_config):
+    isolated_config._config["description_map_reduce"] = {"enabled": False}
+    generator = description_generator([(f"//d/f{i}.cs", big_diff(i)) for i in range(3)])
+
+    result = generator.generate(52)
+
+    assert result["batches"] == 1
+    assert len(generator.sent) == 1
+    assert len(generator.sent[0]["files"]) == 3
@@ -0,0 +1,91 @@
+import json
+import threading
+import time
+
+from src.governor import Governor
+
+
+def run_threads(count, target):
+    threads = [threading.Thread(target=target, args=(i,)) for i in range(count)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(10)
+
+
+def test_slots_limit_concurrency(tmp_path):
+    governor = Governor(tmp_path, {"max_concurrent_p4": 2})
+    lock = threading.Lock()
+    state = {"running": 0, "peak": 0}
+
+    def work(_):
+        with governor.slot("p4"):
+            with lock:
+                state["running"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+            time.sleep(0.15)
+            with lock:
+                state["running"] -= 1
+
+    run_threads(5, work)
+    assert state["peak"] == 2
+
+
+def test_waiters_get_slot_in_arrival_order(tmp_path):
+    governor = Governor(tmp_path, {"max_concurrent_webhook": 1})
+    order = []
+    holder = governor.slot("webhook")
+    holder.__enter__()
+
+    def wait(i):
+        with governor.slot("webhook"):
+            order.append(i)
+
+    threads = []
+    for i in range(4):
+        thread = threading.Thread(target=wait, args=(i,))
+        thread.start()
+        threads.append(thread)
+        time.sleep(0.05)  # 대기열 등록 순서를 고정
+    holder.__exit__(None, None, None)
+    for thread in threads:
+        thread.join(10)
+    assert order == [0, 1, 2, 3]
+
+
+def test_stale_queue_ticket_is_skipped(tmp_path):
+    governor = Governor(tmp_path, {"max_concurrent_p4": 1})
+    queue_dir = tmp_path / "p4" / "queue"
+    queue_dir.mkdir(parents=True)
+    # 비정상 종료된 프로세스가 남긴 (잠금이 풀린) 대기 파일
+    (queue_dir / f"{0:020d}_1_1.q").write_text("")
+
+    started = time.time()
+    with governor.slot("p4"):
+        pass
+    assert time.time() - started < 1
+    assert list(queue_dir.glob("*.q")) == []
+
+
+def test_token_bucket_waits_for_refill(tmp_path):
+    governor = Governor(tmp_path, {"max_concurrent_webhook": 1, "webhook_rate_per_minute": 600})
+    bucket_path = tmp_path / "webhook" / "bucket.json"
+    bucket_path.parent.mkdir(parents=True)
+    bucket_path.write_text(json.dumps({"tokens": 0.0, "updated": time.time()}))
+
+    started = time.time()
+    with governor.slot("webhook"):
+        pass
+    # 분당 600개 = 0.1초에 토큰 1개
+    assert 0.05 <= time.time() - started < 1
+    assert json.loads(bucket_path.read_text())["tokens"] < 1
+
+
+def test_disabled_governor_does_not_lock(tmp_path):
+    settings = [{"enabled": False, "max_concurrent_p4": 1}, {"max_concurrent_p4": 0}]
+    for i, resource_settings in enumerate(settings):
+        governor = Governor(tmp_path / str(i), resource_settings)
+        with governor.slot("p4"):
+            with governor.slot("p4"):
+                pass
+        assert not (tmp_path / str(i)).exists()
@@ -0,0 +1,50 @@
+from src.batch_planner import split_diff_into_hunks
+from src.p4_client import P4Error
+from src.review_history import ReviewHistory
+
+
+def diff(tag):
+    return "\n".join(f"@@ -{k * 10 + 1},1 +{k * 10 + 1},1 @@\n-old {tag} {k}\n+new {tag} {k}" for k in range(3))
+
+
+FILES = [("//d/a.cs", diff("a")), ("//d/b.cs", diff("b"))]
+
+
+def cached_generator(review_generator):
+    """hunk 저장소를 사용하는 generator (스냅샷 지문 조회는 p4 없이 실패 처리)"""
+    generator = review_generator(FILES, use_cache=True)
+
+    def no_fingerprints(info):
+        raise P4Error("p4 없음")
+
+    generator.p4.get_file_fingerprints = no_fingerprints
+    return generator
+
+
+def test_all_reused_review_keeps_score_and_summary(review_generator):
+    first = cached_generator(review_generator)
+    fresh = first.generate(43)
+    assert fresh.overall_score == 80
+
+    again = cached_generator(review_generator)
+    result = again.generate(43)
+    assert again.sent == []
+    assert result.overall_score == 80
+    assert result.summary.endswith("ok")
+    assert sorted(c.file_path for c in result.comments) == ["//d/a.cs", "//d/b.cs"]
+
+    history = ReviewHistory.for_changelist(43, again.scope).load()
+    assert history["overall_score"] == 80
+
+
+def test_reused_hunks_without_score_are_not_saved(review_generator):
+    generator = cached_generator(review_generator)
+    # 점수를 함께 저장하기 전에 기록된 hunk 항목
+    for _, text in FILES:
+        for hunk in split_diff_into_hunks(text)[1]:
+            generator.hunk_store.cache.put(generator.hunk_store.key(hunk), {"comments": []})
+
+    result = generator.generate(45)
+    assert generator.sent == []
+    assert result.overall_score == 0
+    assert ReviewHistory.for_changelist(45, generator.scope).load() == {}
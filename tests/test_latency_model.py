@@ -0,0 +1,51 @@
+import json
+import threading
+
+from src.checkpoint import write_json_atomic
+from src.latency_model import HISTORY_LIMIT, LatencyModel
+
+
+def test_concurrent_writes_leave_valid_file_and_no_temp_files(tmp_path):
+    path = tmp_path / "data.json"
+    errors = []
+
+    def writer(n):
+        try:
+            for i in range(50):
+                write_json_atomic(path, {"writer": n, "i": i, "pad": "x" * 2000})
+        except OSError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=writer, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert json.loads(path.read_text(encoding="utf-8"))["i"] == 49
+    assert [p.name for p in tmp_path.iterdir()] == ["data.json"]
+
+
+def test_concurrent_records_are_all_saved(tmp_path):
+    model = LatencyModel(tmp_path / "latency_history.json")
+    threads = [
+        threading.Thread(target=lambda n=n: [model.record(100 * n, 1.0, "review") for _ in range(10)])
+        for n in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    saved = json.loads((tmp_path / "latency_history.json").read_text(encoding="utf-8"))
+    assert len(saved) == min(80, HISTORY_LIMIT)
+    assert LatencyModel(tmp_path / "latency_history.json").predict(100) is not None
+
+
+def test_prediction_follows_tokens(tmp_path):
+    model = LatencyModel(tmp_path / "latency_history.json")
+    assert model.predict(1000) is None
+    for tokens in (1000, 2000, 3000, 4000, 5000):
+        model.record(tokens, 1.0 + tokens / 1000, "review")
+    assert abs(model.predict(6000) - 7.0) < 0.01
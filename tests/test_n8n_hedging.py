@@ -0,0 +1,58 @@
+import threading
+import time
+
+import pytest
+
+from src.endpoint_pool import EndpointPool
+from src.n8n_client import N8NClient, N8NError
+
+
+@pytest.fixture
+def client():
+    n8n = N8NClient(webhook_url="http://a", timeout=1, use_cache=False)
+    n8n.pool = EndpointPool(["http://a", "http://b"])
+    n8n.hedging = {"enabled": True, "initial_delay": 0.05}
+    return n8n
+
+
+def test_unexpected_worker_error_is_reported(client, monkeypatch):
+    def post_to(endpoint, payload, cancel_event=None):
+        raise PermissionError("governor lock denied")
+
+    monkeypatch.setattr(client, "_post_to", post_to)
+    with pytest.raises(N8NError, match="governor lock denied"):
+        client._post_hedged({"request_type": "review"})
+
+
+def test_hung_requests_time_out(client, monkeypatch):
+    monkeypatch.setattr("src.n8n_client.HEDGE_GRACE_SECONDS", 0.1)
+    released = threading.Event()
+
+    def post_to(endpoint, payload, cancel_event=None):
+        released.wait(5)
+        return {"success": True}
+
+    monkeypatch.setattr(client, "_post_to", post_to)
+    started = time.time()
+    try:
+        with pytest.raises(N8NError) as info:
+            client._post_hedged({"request_type": "review"})
+    finally:
+        released.set()
+    assert info.value.transient
+    assert time.time() - started < 3
+
+
+def test_second_endpoint_answers_first(client, monkeypatch):
+    released = threading.Event()
+
+    def post_to(endpoint, payload, cancel_event=None):
+        if endpoint.url == "http://a":
+            released.wait(5)
+        return {"success": True, "from": endpoint.url}
+
+    monkeypatch.setattr(client, "_post_to", post_to)
+    try:
+        assert client._post_hedged({"request_type": "review"})["from"] == "http://b"
+    finally:
+        released.set()
@@ -0,0 +1,117 @@
+from src.p4_client import (
+    FETCH_DESCRIPTION,
+    FETCH_REVIEW,
+    FSTAT_CHUNK_SIZE,
+    ChangelistInfo,
+    FetchProfile,
+    FileChange,
+    P4Client,
+    P4Error
+)
+
+
+class RecordingP4(P4Client):
+    """p4 명령을 기록하고 준비된 출력을 돌려주는 P4Client"""
+
+    def __init__(self, responder):
+        super().__init__()
+        self.commands = []
+        self.responder = responder
+
+    def _run(self, *args):
+        self.commands.append(args)
+        return self.responder(args)
+
+
+def fstat_output(records):
+    return "\n\n".join("\n".join(f"... {k} {v}" for k, v in r.items()) for r in records) + "\n\n"
+
+
+def test_fstat_chunks_split_and_skip_failed_chunks():
+    paths = [f"//d/f{i}.cs" for i in range(FSTAT_CHUNK_SIZE * 2 + 1)]
+
+    def responder(args):
+        specs = [a.split("#")[0] for a in args if a.startswith("//")]
+        if specs[0] == paths[FSTAT_CHUNK_SIZE]:
+            raise P4Error("fstat 실패")
+        return fstat_output([{"depotFile": s, "fileSize": 10} for s in specs])
+
+    p4 = RecordingP4(responder)
+    files = [FileChange(depot_path=p, action="edit", revision=3) for p in paths]
+    sizes = p4.get_file_sizes(files, "submitted")
+    assert len(p4.commands) == 3
+    assert p4.commands[0][:5] == ("-ztag", "fstat", "-Ol", "-T", "depotFile,fileSize")
+    assert p4.commands[0][5] == "//d/f0.cs#3"
+    assert len(sizes) == FSTAT_CHUNK_SIZE + 1
+    assert paths[FSTAT_CHUNK_SIZE] not in sizes
+
+
+def test_pending_fingerprints_follow_local_file(tmp_path):
+    local = tmp_path / "a.cs"
+    local.write_text("a")
+
+    def responder(args):
+        return fstat_output([
+            {"depotFile": "//d/a.cs", "clientFile": str(local), "haveRev": 2, "action": "edit"},
+            {"depotFile": "//d/b.cs", "clientFile": str(tmp_path / "none.cs"), "haveRev": 1, "action": "edit"}
+        ])
+
+    p4 = RecordingP4(responder)
+    info = ChangelistInfo(number=9, status="pending", files=[
+        FileChange(depot_path="//d/a.cs", action="edit"), FileChange(depot_path="//d/b.cs", action="edit")
+    ])
+    before = p4.get_file_fingerprints(info)
+    assert before["//d/a.cs"].startswith("edit#2:1:")
+    assert before["//d/b.cs"] == "edit#1:missing"
+
+    local.write_text("changed")
+    assert p4.get_file_fingerprints(info)["//d/a.cs"] != before["//d/a.cs"]
+
+
+def test_submitted_fingerprints_need_no_p4():
+    p4 = RecordingP4(lambda args: "")
+    info = ChangelistInfo(
+        number=9, status="submitted", files=[FileChange(depot_path="//d/a.cs", action="edit", revision=4)]
+    )
+    assert p4.get_file_fingerprints(info) == {"//d/a.cs": "edit#4"}
+    assert p4.commands == []
+
+
+def pending_responder(args):
+    if args[0] == "diff":
+        context = "short" if args[1] == "-du" else "full"
+        return f"@@ -1 +1 @@\n-{context} {args[2]}\n+{'x' * 500}"
+    raise P4Error(f"예상하지 않은 명령: {args}")
+
+
+def pending_info():
+    return ChangelistInfo(number=9, status="pending", files=[FileChange(depot_path="//d/a.cs", action="edit")])
+
+
+def test_review_profile_collects_both_diffs():
+    p4 = RecordingP4(pending_responder)
+    (file_change,) = p4.iter_diffs(pending_info(), FETCH_REVIEW)
+    assert [c[:2] for c in p4.commands] == [("diff", "-du"), ("diff", "-du10000")]
+    assert "short" in file_change.diff and "full" in file_change.diff_full
+
+
+def test_description_profile_skips_full_diff():
+    p4 = RecordingP4(pending_responder)
+    (file_change,) = p4.iter_diffs(pending_info(), FETCH_DESCRIPTION)
+    assert [c[:2] for c in p4.commands] == [("diff", "-du")]
+    assert file_change.diff_full == ""
+
+
+def test_full_only_profile_keeps_existing_diff():
+    p4 = RecordingP4(pending_responder)
+    info = pending_info()
+    info.files[0].diff = "cached"
+    (file_change,) = p4.iter_diffs(info, FetchProfile(short_context=False))
+    assert [c[:2] for c in p4.commands] == [("diff", "-du10000")]
+    assert file_change.diff == "cached"
+
+
+def test_summarize_over_replaces_large_diff():
+    p4 = RecordingP4(pending_responder)
+    (file_change,) = p4.iter_diffs(pending_info(), FetchProfile(full_context=False, summarize_over=100))
+    assert file_change.diff.startswith("(대용량 diff 요약")
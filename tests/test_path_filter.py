@@ -0,0 +1,82 @@
+import pytest
+
+from src.p4_client import FileChange
+from src.path_filter import PathFilter, compile_rule, describe_excluded
+
+
+def make_files(*paths):
+    return [FileChange(depot_path=path, action="edit", file_type="text") for path in paths]
+
+
+def test_glob_and_regex_rules_ignore_case():
+    assert compile_rule("*.META").regex.match("//depot/Game/Assets/a.cs.meta")
+    assert compile_rule(r"re:.*\.gen\.cpp$").regex.match("//depot/Game/A.GEN.CPP")
+    assert not compile_rule("*/vendor/*").regex.match("//depot/Game/vendors.txt")
+
+
+def test_invalid_regex_raises_value_error():
+    with pytest.raises(ValueError):
+        compile_rule("re:([")
+
+
+def test_include_rules_keep_only_matching_files():
+    path_filter = PathFilter(include=["*.cs"])
+    kept, excluded = path_filter.split(make_files("//depot/a.cs", "//depot/b.png"))
+    assert [f.depot_path for f in kept] == ["//depot/a.cs"]
+    assert excluded == {"//depot/b.png": "include 규칙 불일치"}
+
+
+def test_root_rules_exclude_only_project_root_folders():
+    path_filter = PathFilter(
+        exclude=["root:Library/*", "root:Temp/*"], project_markers=["Assets", "ProjectSettings"]
+    )
+    kept, excluded = path_filter.split(make_files(
+        "//depot/Game/Assets/Scripts/Player.cs",
+        "//depot/Game/Library/ArtifactDB",
+        "//depot/Game/Source/Library/Json.cs",
+        "//depot/Game/Assets/Library/Inventory.cs",
+        "//depot/Game/temp/build.log"
+    ))
+    assert [f.depot_path for f in kept] == [
+        "//depot/Game/Assets/Scripts/Player.cs",
+        "//depot/Game/Source/Library/Json.cs",
+        "//depot/Game/Assets/Library/Inventory.cs"
+    ]
+    assert excluded == {
+        "//depot/Game/Library/ArtifactDB": "root:Library/*",
+        "//depot/Game/temp/build.log": "root:Temp/*"
+    }
+
+
+def test_root_rules_skipped_without_project_root():
+    path_filter = PathFilter(exclude=["root:Library/*"], project_markers=["Assets"])
+    kept, excluded = path_filter.split(make_files("//depot/Game/Library/Json.cs"))
+    assert len(kept) == 1
+    assert excluded == {}
+
+
+def test_unity_profile_defaults(isolated_config):
+    isolated_config._config["expert_profile"] = "unity"
+    kept, excluded = PathFilter.from_config().split(make_files(
+        "//depot/Game/ProjectSettings/ProjectVersion.txt",
+        "//depot/Game/Assets/Player.cs.meta",
+        "//depot/Game/Library/PackageCache/com.unity.ugui/Runtime/Button.cs",
+        "//depot/Game/Packages/manifest.json",
+        "//depot/Game/Packages/packages-lock.json",
+        "//depot/Game/Packages/com.studio.net/Runtime/Client.cs",
+        "//depot/Engine/Source/Library/Packages/Pool.cs"
+    ))
+    # 의존성 목록과 임베디드 패키지 소스는 리뷰
+    assert [f.depot_path for f in kept] == [
+        "//depot/Game/ProjectSettings/ProjectVersion.txt",
+        "//depot/Game/Packages/manifest.json",
+        "//depot/Game/Packages/com.studio.net/Runtime/Client.cs",
+        "//depot/Engine/Source/Library/Packages/Pool.cs"
+    ]
+    assert set(excluded.values()) == {"*.meta", "root:Library/*", "root:Packages/packages-lock.json"}
+
+
+def test_describe_excluded_counts_rules():
+    excluded = {"//a.meta": "*.meta", "//b.meta": "*.meta", "//Game/Library/x": "root:Library/*"}
+    assert describe_excluded(excluded) == "제외 규칙으로 3개 파일 제외 (*.meta 2개, root:Library/* 1개)"
+    assert describe_excluded({}) == ""
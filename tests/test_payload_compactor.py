@@ -0,0 +1,63 @@
+from src.payload_compactor import WHITESPACE_ONLY_NOTE, compact_diff, compact_payload
+
+
+HEADER = "--- //depot/a.py\n+++ //depot/a.py"
+
+
+def test_trailing_whitespace_and_crlf_hunk_dropped():
+    diff = f"{HEADER}\n@@ -1,1 +1,1 @@\n-foo  \r\n+foo\n@@ -5,1 +5,1 @@\n-a\n+b"
+    compacted, dropped, stripped = compact_diff(diff)
+    assert compacted == "@@ -5,1 +5,1 @@\n-a\n+b"
+    assert dropped == 1
+    assert stripped == 2
+
+
+def test_indentation_change_kept():
+    diff = "@@ -1,2 +1,2 @@\n if x:\n-    y()\n+        y()"
+    compacted, dropped, _ = compact_diff(diff)
+    assert dropped == 0
+    assert "+        y()" in compacted
+
+
+def test_whitespace_inside_string_kept():
+    diff = '@@ -1,1 +1,1 @@\n-s = "a b"\n+s = "ab"'
+    assert compact_diff(diff)[1] == 0
+
+
+def test_whitespace_moved_between_lines_kept():
+    diff = "@@ -1,2 +1,1 @@\n-a\n-b\n+a b"
+    assert compact_diff(diff)[1] == 0
+
+
+def test_added_blank_line_kept():
+    diff = "@@ -1,1 +1,2 @@\n a\n+"
+    assert compact_diff(diff)[1] == 0
+
+
+def test_all_hunks_dropped_leaves_note():
+    diff = "@@ -1,1 +1,1 @@\n-a \n+a"
+    compacted, dropped, _ = compact_diff(diff)
+    assert dropped == 1
+    assert compacted == WHITESPACE_ONLY_NOTE
+
+
+def test_drop_disabled():
+    diff = "@@ -1,1 +1,1 @@\n-a \n+a"
+    compacted, dropped, _ = compact_diff(diff, drop_whitespace_hunks=False)
+    assert dropped == 0
+    assert compacted == "@@ -1,1 +1,1 @@\n-a\n+a"
+
+
+def test_diff_without_hunks_only_normalized():
+    assert compact_diff("new file  \r\nline\r\n") == ("new file\nline", 0, 0)
+
+
+def test_compact_payload_removes_default_fields():
+    payload = {
+        "request_type": "review",
+        "files": [{"depot_path": "//d/a.py", "diff": "@@ -1,1 +1,1 @@\n-a\n+b", "content": "",
+                   "revision": 0, "file_type": ""}]
+    }
+    report = compact_payload(payload)
+    assert set(payload["files"][0]) == {"depot_path", "diff"}
+    assert report.tokens_after <= report.tokens_before
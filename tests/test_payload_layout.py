@@ -0,0 +1,56 @@
+import hashlib
+import json
+
+from src.context_registry import ContextRegistry, expert_context_id
+from src.payload_layout import stabilize_payload
+
+
+URL = "http://localhost/webhook"
+
+
+def make_payload():
+    context = "## 전문가\r\nUnity 전문가입니다   \r\n"
+    return stabilize_payload({
+        "files": [{"depot_path": "//d/a.cs", "diff": "+a"}],
+        "batch_info": {"index": 1},
+        "changelist": {"number": 7, "current_description": "설명  \r\n"},
+        "expert_context": context,
+        "expert_context_id": expert_context_id(context),
+        "request_type": "review"
+    })
+
+
+def assert_prefix_matches(body):
+    """cache_prefix가 실제로 보내는 본문 앞부분의 바이트를 가리키는지 확인"""
+    marker = body["cache_prefix"]
+    prefix = {key: body[key] for key in marker["fields"]}
+    encoded = json.dumps(prefix, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    assert list(body)[:len(marker["fields"])] == marker["fields"]
+    assert marker["bytes"] == len(encoded)
+    assert marker["sha256"] == hashlib.sha256(encoded).hexdigest()
+
+
+def test_stable_fields_first_and_files_last():
+    payload = make_payload()
+    assert list(payload) == [
+        "request_type", "expert_context_id", "expert_context", "changelist",
+        "cache_prefix", "batch_info", "files"
+    ]
+    assert payload["expert_context"] == "## 전문가\nUnity 전문가입니다"
+    assert payload["changelist"]["current_description"] == "설명"
+    assert_prefix_matches(payload)
+
+
+def test_prefix_recomputed_after_context_is_referenced():
+    payload = make_payload()
+    registry = ContextRegistry()
+    assert registry.reference(URL, payload) is payload
+
+    registry.acknowledge(URL, payload, {"expert_context_id": payload["expert_context_id"]})
+    body = registry.reference(URL, payload)
+    assert "expert_context" not in body
+    assert "expert_context" not in body["cache_prefix"]["fields"]
+    assert body["cache_prefix"]["bytes"] < payload["cache_prefix"]["bytes"]
+    assert_prefix_matches(body)
+    # 원본은 그대로 (서버가 ID를 모르면 전문으로 재전송)
+    assert_prefix_matches(payload)
@@ -0,0 +1,89 @@
+from src.context_registry import expert_context_id
+from src.expert_profiles import get_prompt
+from src.profile_router import ProfileRouter
+
+
+def enable_routing(config, profile="unity", profiles=None):
+    config._config["expert_profile"] = profile
+    config._config["profile_routing"] = {"enabled": True, "profiles": profiles or ["unity", "unreal"]}
+
+
+def test_route_by_longest_pattern():
+    router = ProfileRouter("unity", ["unity", "unreal"])
+
+    assert router.enabled
+    assert router.route("//d/Assets/Scripts/Player.cs") == "unity"
+    assert router.route("//d/Source/Game/Game.Build.cs") == "unreal"
+    assert router.route("//d/Source/Game/Player.CPP") == "unreal"
+    # 어느 프로필에도 해당하지 않는 파일은 설정된 프로필
+    assert router.route("//d/docs/README.md") == "unity"
+
+
+def test_routing_disabled_by_default():
+    router = ProfileRouter.from_config("review")
+
+    assert not router.enabled
+    assert router.profiles == ["generic"]
+    assert router.route("//d/Source/Game/Player.cpp") == "generic"
+    assert router.signature("review") == ""
+
+
+def test_routing_enabled_from_config(isolated_config):
+    enable_routing(isolated_config)
+    router = ProfileRouter.from_config("review")
+
+    assert router.enabled
+    assert router.profiles == ["unity", "unreal"]
+    assert router.route("//d/Source/Game/Player.cpp") == "unreal"
+    assert router.signature("review") != ""
+
+
+def test_configured_profile_outside_routing_is_kept(isolated_config):
+    enable_routing(isolated_config, profile="generic")
+    router = ProfileRouter.from_config("review")
+
+    assert not router.enabled
+    assert router.route("//d/Source/Game/Player.cpp") == "generic"
+
+
+def test_custom_prompt_disables_routing(isolated_config):
+    enable_routing(isolated_config)
+    isolated_config._config["custom_prompts"] = {"description": "", "review": "custom"}
+
+    assert not ProfileRouter.from_config("review").enabled
+    assert ProfileRouter.from_config("description").enabled
+
+
+def test_review_batches_use_routed_profile(review_generator, isolated_config):
+    enable_routing(isolated_config)
+    diff = "@@ -1,1 +1,1 @@\n-int a;\n+int b;"
+    generator = review_generator([
+        ("//d/Assets/Player.cs", diff),
+        ("//d/Source/Player.cpp", diff.replace("int b", "int c")),
+    ])
+
+    result = generator.generate(47)
+
+    assert result.success
+    profiles = {
+        payload["files"][0]["depot_path"]: payload["expert_context_id"] for payload in generator.sent
+    }
+    assert profiles == {
+        "//d/Assets/Player.cs": expert_context_id(get_prompt("unity", "review")),
+        "//d/Source/Player.cpp": expert_context_id(get_prompt("unreal", "review")),
+    }
+    assert all(len(payload["files"]) == 1 for payload in generator.sent)
+
+
+def test_review_without_routing_uses_one_profile(review_generator, isolated_config):
+    isolated_config._config["expert_profile"] = "unity"
+    diff = "@@ -1,1 +1,1 @@\n-int a;\n+int b;"
+    generator = review_generator([
+        ("//d/Assets/Player.cs", diff),
+        ("//d/Source/Player.cpp", diff.replace("int b", "int c")),
+    ])
+
+    generator.generate(48)
+
+    assert len(generator.sent) == 1
+    assert generator.sent[0]["expert_context_id"] == expert_context_id(get_prompt("unity", "review"))
@@ -0,0 +1,68 @@
+import os
+import time
+
+from src.response_cache import ResponseCache, make_cache_key
+
+
+def payload(**overrides):
+    base = {
+        "request_type": "review",
+        "session_key": "session-1",
+        "changelist": {"number": 7, "current_description": "설명\r\n"},
+        "files": [
+            {"depot_path": "//d/b.cs", "diff": "@@ -1 +1 @@\r\n-a\r\n+b"},
+            {"depot_path": "//d/a.cs", "diff": "@@ -1 +1 @@\n-a\n+b"}
+        ]
+    }
+    base.update(overrides)
+    return base
+
+
+def test_key_ignores_session_file_order_and_line_endings():
+    key = make_cache_key(payload())
+    reordered = payload(session_key="session-2", files=list(reversed(payload()["files"])))
+    assert make_cache_key(reordered) == key
+    lf = payload(changelist={"number": 7, "current_description": "설명\n"})
+    assert make_cache_key(lf) == key
+    assert make_cache_key(payload(request_type="description")) != key
+
+
+def test_get_returns_stored_response(tmp_path):
+    cache = ResponseCache(tmp_path, ttl_seconds=60)
+    cache.put("k", {"success": True, "summary": "ok"})
+    assert cache.get("k") == {"success": True, "summary": "ok"}
+    assert cache.get("missing") is None
+
+
+def test_expired_entry_is_removed(tmp_path, monkeypatch):
+    cache = ResponseCache(tmp_path, ttl_seconds=60)
+    cache.put("k", {"success": True})
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 61)
+    assert cache.get("k") is None
+    assert not (tmp_path / "k.json").exists()
+
+
+def test_eviction_removes_least_recently_used_first(tmp_path):
+    cache = ResponseCache(tmp_path, ttl_seconds=3600, max_bytes=10 ** 9)
+    for key in ("old", "used", "new"):
+        cache.put(key, {"text": "x" * 1000})
+    now = time.time()
+    os.utime(tmp_path / "old.json", (now - 30, now - 30))
+    os.utime(tmp_path / "used.json", (now - 20, now - 20))
+    os.utime(tmp_path / "new.json", (now - 10, now - 10))
+    # 조회하면 마지막 사용 시각이 갱신됨
+    assert cache.get("used") is not None
+
+    # 엔트리 2개 용량 (생성 시각 자릿수에 따라 크기가 몇 바이트 다를 수 있음)
+    cache.max_bytes = (tmp_path / "new.json").stat().st_size * 2 + 100
+    cache.put("latest", {"text": "x" * 1000})
+    assert sorted(p.stem for p in tmp_path.glob("*.json")) == ["latest", "used"]
+
+
+def test_clear(tmp_path):
+    cache = ResponseCache(tmp_path)
+    cache.put("a", {})
+    cache.put("b", {})
+    cache.clear()
+    assert list(tmp_path.glob("*.json")) == []
@@ -0,0 +1,115 @@
+import pytest
+import requests
+
+from src.commands.review import ReviewGenerator
+from src.n8n_client import N8NClient, N8NError
+
+
+class FakeResponse:
+    def __init__(self, status):
+        self.status_code = status
+
+    def raise_for_status(self):
+        raise requests.exceptions.HTTPError(response=self)
+
+
+class FakeSession:
+    def __init__(self, error):
+        self.error = error
+
+    def post(self, *args, **kwargs):
+        if isinstance(self.error, int):
+            return FakeResponse(self.error)
+        raise self.error
+
+
+def big_diff(tag, hunks=700):
+    """배치 하나를 거의 채우는 diff"""
+    return "\n".join(
+        f"@@ -{k * 10 + 1},1 +{k * 10 + 1},1 @@\n-old {tag} {k} {'x' * 100}\n+new {tag} {k} {'y' * 100}"
+        for k in range(hunks)
+    )
+
+
+@pytest.mark.parametrize("error, transient", [
+    (requests.exceptions.Timeout(), True),
+    (requests.exceptions.ConnectionError(), True),
+    (503, True),
+    (429, True),
+    (400, False),
+    (404, False)
+])
+def test_transient_error_classification(error, transient):
+    client = N8NClient(webhook_url="http://a", use_cache=False)
+    with pytest.raises(N8NError) as info:
+        client._post(FakeSession(error), "http://a", {}, 1)
+    assert info.value.transient is transient
+
+
+@pytest.fixture
+def generator(isolated_config, monkeypatch):
+    isolated_config._config["retry"] = {"max_attempts": 4, "base_delay": 2.0, "max_delay": 5.0}
+    generator = ReviewGenerator(webhook_url="http://localhost", use_cache=False)
+    generator.bounds = []
+    generator.sleeps = []
+
+    def uniform(low, high):
+        generator.bounds.append(high)
+        return high
+
+    monkeypatch.setattr("src.commands.review.random.uniform", uniform)
+    monkeypatch.setattr("src.commands.review.time.sleep", generator.sleeps.append)
+    return generator
+
+
+def fail_then_succeed(generator, errors):
+    calls = []
+
+    def review_batch(files, info, index):
+        calls.append(index)
+        if len(calls) <= len(errors):
+            raise errors[len(calls) - 1]
+        return {"success": True}
+
+    generator._review_batch = review_batch
+    return calls
+
+
+def test_backoff_doubles_up_to_max_delay(generator):
+    calls = fail_then_succeed(generator, [N8NError("timeout", transient=True)] * 3)
+    progress = []
+    result = generator._review_batch_with_retry([], None, {"current": 2, "total": 5}, progress.append)
+    assert result == {"success": True}
+    assert len(calls) == 4
+    # full jitter 상한: base_delay * 2^(시도-1), max_delay로 제한
+    assert generator.bounds == [2.0, 4.0, 5.0]
+    assert generator.sleeps == [2.0, 4.0, 5.0]
+    assert progress[-1] == "배치 2/5 재시도 중 (4/4)..."
+
+
+def test_gives_up_after_max_attempts(generator):
+    calls = fail_then_succeed(generator, [N8NError("HTTP 오류: 503", transient=True)] * 4)
+    with pytest.raises(N8NError, match="503"):
+        generator._review_batch_with_retry([], None, {"current": 1, "total": 1})
+    assert len(calls) == 4
+    assert len(generator.sleeps) == 3
+
+
+def test_permanent_error_is_not_retried(generator):
+    calls = fail_then_succeed(generator, [N8NError("HTTP 오류: 400")])
+    with pytest.raises(N8NError):
+        generator._review_batch_with_retry([], None, {"current": 1, "total": 1})
+    assert len(calls) == 1
+    assert generator.sleeps == []
+
+
+def test_failed_batch_keeps_partial_result(review_generator, isolated_config):
+    isolated_config._config["retry"] = {"max_attempts": 1}
+    files = [(f"//d/f{i}.cs", big_diff(i)) for i in range(3)]
+    generator = review_generator(files)
+    generator.fail("//d/f1.cs")
+    result = generator.generate(29)
+    assert result.success and result.partial
+    assert len(result.failed_batches) == 1
+    assert result.summary.startswith("[부분 결과: 3개 배치 중 1개 실패]")
+    assert sorted(c.file_path for c in result.comments) == ["//d/f0.cs", "//d/f2.cs"]
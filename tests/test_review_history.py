@@ -0,0 +1,68 @@
+from src.review_history import ReviewHistory
+
+
+def big_diff(tag, hunks=700):
+    """배치 하나를 거의 채우는 diff"""
+    return "\n".join(
+        f"@@ -{k * 10 + 1},1 +{k * 10 + 1},1 @@\n-old {tag} {k} {'x' * 100}\n+new {tag} {k} {'y' * 100}"
+        for k in range(hunks)
+    )
+
+
+FILES = [(f"//d/f{i}.cs", big_diff(i)) for i in range(3)]
+
+
+def history_files(generator, changelist):
+    return ReviewHistory.for_changelist(changelist, generator.scope).load().get("files", {})
+
+
+def test_partial_review_leaves_no_history(review_generator, isolated_config):
+    isolated_config._config["retry"] = {"max_attempts": 1}
+    generator = review_generator(FILES)
+    generator.fail("//d/f1.cs")
+    result = generator.generate(21)
+    assert result.partial
+    assert history_files(generator, 21) == {}
+
+
+def test_retry_saves_history(review_generator, isolated_config):
+    isolated_config._config["retry"] = {"max_attempts": 1}
+    generator = review_generator(FILES)
+    generator.fail("//d/f1.cs")
+    partial = generator.generate(22)
+
+    retry = review_generator(FILES)
+    result = retry.retry_failed(partial)
+    assert result.success and not result.partial
+    assert set(history_files(retry, 22)) == {path for path, _ in FILES}
+
+    # 다음 incremental 리뷰는 바뀐 파일이 없으므로 요청하지 않음
+    again = review_generator(FILES)
+    result = again.generate(22, incremental=True)
+    assert again.sent == []
+    assert len(result.comments) == len(FILES)
+
+
+def test_resume_saves_history(review_generator, isolated_config):
+    isolated_config._config["retry"] = {"max_attempts": 1}
+    generator = review_generator(FILES)
+    generator.fail("//d/f2.cs")
+    generator.generate(23)
+
+    resumed = review_generator(FILES)
+    result = resumed.resume(23)
+    assert result.success and not result.partial
+    assert set(history_files(resumed, 23)) == {path for path, _ in FILES}
+
+
+def test_repeated_incremental_runs_keep_summary_and_score(review_generator):
+    summaries = []
+    for _ in range(3):
+        generator = review_generator(FILES)
+        result = generator.generate(24, incremental=True)
+        summaries.append(result.summary)
+        assert result.overall_score == 80
+        assert ReviewHistory.for_changelist(24, generator.scope).load()["summary"] == summaries[0]
+
+    # 안내 문구는 표시할 때만 붙이고 실행마다 쌓이지 않음
+    assert summaries[1] == summaries[2] == f"마지막 리뷰 이후 바뀐 파일이 없습니다. {summaries[0]}"
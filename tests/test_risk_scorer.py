@@ -0,0 +1,76 @@
+from src.p4_client import FileChange
+from src.risk_scorer import RiskScorer, count_changed_lines
+
+
+SETTINGS = {"critical_paths": ["*auth*", "*/net/*"], "low_value_paths": ["*/thirdparty/*"]}
+
+
+def change(path, action="edit", lines=0, file_type="text"):
+    diff = "\n".join(["--- a", "+++ b", "@@ -1 +1 @@"] + [f"+line {i}" for i in range(lines)])
+    return FileChange(depot_path=path, action=action, file_type=file_type, diff=diff)
+
+
+def big_diff(tag, hunks=700):
+    """배치 하나를 거의 채우는 diff"""
+    return "\n".join(
+        f"@@ -{k * 10 + 1},1 +{k * 10 + 1},1 @@\n-old {tag} {k} {'x' * 100}\n+new {tag} {k} {'y' * 100}"
+        for k in range(hunks)
+    )
+
+
+def test_count_changed_lines_ignores_file_headers():
+    assert count_changed_lines("--- a\n+++ b\n@@ -1,2 +1,2 @@\n-a\n+b\n c") == 2
+
+
+def test_rank_orders_by_kind_path_and_size():
+    scorer = RiskScorer(SETTINGS, profile_paths=["*/managers/*"])
+    files = [
+        change("//d/docs/notes.txt", lines=7),
+        change("//d/art/hero.png", file_type="binary"),
+        change("//d/game/Player.cs"),
+        change("//d/game/Config.json"),
+        change("//d/game/managers/Pool.cs"),
+        change("//d/net/Session.cs"),
+        change("//d/game/Enemy.cs", action="delete"),
+    ]
+    assert [f.depot_path for f in scorer.rank(files)] == [
+        "//d/net/Session.cs",
+        "//d/game/managers/Pool.cs",
+        "//d/docs/notes.txt",
+        "//d/game/Player.cs",
+        "//d/game/Config.json",
+        "//d/game/Enemy.cs",
+        "//d/art/hero.png",
+    ]
+
+
+def test_larger_change_ranks_higher_and_ties_keep_order():
+    scorer = RiskScorer(SETTINGS)
+    small, large = change("//d/a.cs", lines=1), change("//d/b.cs", lines=100)
+    assert scorer.rank([small, large]) == [large, small]
+    first, second = change("//d/c.cs"), change("//d/d.cs")
+    assert scorer.rank([first, second]) == [first, second]
+    assert scorer.batch_score([small, large]) == scorer.score(large)
+    assert scorer.batch_score([]) == 0.0
+
+
+def test_low_value_files():
+    scorer = RiskScorer(SETTINGS)
+    assert scorer.is_low_value(change("//d/thirdparty/json.cs"))
+    assert scorer.is_low_value(change("//d/a.cs", action="delete"))
+    assert scorer.is_low_value(change("//d/a.png"))
+    assert not scorer.is_low_value(change("//d/a.cs"))
+    # 중요 경로는 제외하지 않음
+    assert not scorer.is_low_value(change("//d/thirdparty/auth.cs", action="delete"))
+
+
+def test_review_dispatches_risky_batches_first(review_generator, isolated_config):
+    files = [("//d/ui/Button.cs", big_diff("ui")), ("//d/auth/Login.cs", big_diff("auth"))]
+    generator = review_generator(files)
+    generator.generate(36)
+    assert [p["files"][0]["depot_path"] for p in generator.sent] == ["//d/auth/Login.cs", "//d/ui/Button.cs"]
+
+    isolated_config._config["risk"] = dict(isolated_config.risk, prioritize=False)
+    generator = review_generator(files)
+    generator.generate(37)
+    assert [p["files"][0]["depot_path"] for p in generator.sent] == ["//d/ui/Button.cs", "//d/auth/Login.cs"]
@@ -0,0 +1,76 @@
+from src.unity_yaml import compact_unity_yaml_diff, is_unity_yaml
+
+
+OLD_GUID = "a" * 32
+NEW_GUID = "b" * 32
+
+HEADER = "==== //depot/Game/Assets/Player.prefab#3 - /ws/Assets/Player.prefab ===="
+
+
+def prefab_diff(script_guid, speed, jump):
+    """GameObject + MonoBehaviour 프리팹의 m_Script/speed/jump 라인을 바꾼 diff (그대로인 라인은 context)"""
+    fields = [
+        (f"m_Script: {{fileID: 11500000, guid: {OLD_GUID}, type: 3}}",
+         f"m_Script: {{fileID: 11500000, guid: {script_guid}, type: 3}}"),
+        ("speed: 5", f"speed: {speed}"),
+        ("jump: 1.0", f"jump: {jump}"),
+    ]
+    body = [" --- !u!1 &100", " GameObject:", "   m_Name: Player", " --- !u!114 &200", " MonoBehaviour:"]
+    for old, new in fields:
+        body += [f"   {old}"] if old == new else [f"-  {old}", f"+  {new}"]
+    return "\n".join([HEADER, "@@ -1,8 +1,8 @@"] + body)
+
+
+def test_is_unity_yaml():
+    assert is_unity_yaml("//depot/Game/Assets/Player.prefab")
+    assert is_unity_yaml("//depot/Game/Assets/Scenes/Main.UNITY")
+    assert is_unity_yaml("//depot/Game/Assets/Materials/Wall.mat")
+    assert not is_unity_yaml("//depot/Game/Assets/Scripts/Player.cs")
+    assert not is_unity_yaml("//depot/Game/Assets/Player.prefab.meta")
+
+
+def test_noise_is_collapsed_and_real_change_kept():
+    compacted = compact_unity_yaml_diff(prefab_diff(NEW_GUID, 7, "1.00001"))
+
+    assert compacted.split("\n") == [
+        HEADER,
+        "(Unity YAML: 참조 ID(fileID/guid)만 바뀐 라인 1개, 미세한 float 변경 1개 생략)",
+        "@@ -6,3 +6,3 @@ MonoBehaviour",
+        f"   m_Script: {{fileID: 11500000, guid: {NEW_GUID}, type: 3}}",
+        "-  speed: 5",
+        "+  speed: 7",
+        "   jump: 1.00001",
+    ]
+
+
+def test_noise_only_hunk_is_dropped():
+    compacted = compact_unity_yaml_diff(prefab_diff(NEW_GUID, 5, "1.0"))
+
+    assert compacted.split("\n") == [
+        HEADER,
+        "(Unity YAML: 참조 ID(fileID/guid)만 바뀐 라인 1개만 있음)",
+    ]
+
+
+def test_diff_without_noise_is_unchanged():
+    diff = prefab_diff(OLD_GUID, 7, "1.0")
+
+    assert compact_unity_yaml_diff(diff) == diff
+
+
+def test_float_change_beyond_epsilon_is_kept():
+    compacted = compact_unity_yaml_diff(prefab_diff(NEW_GUID, 5, "1.5"))
+
+    assert compacted.split("\n") == [
+        HEADER,
+        "(Unity YAML: 참조 ID(fileID/guid)만 바뀐 라인 1개 생략)",
+        "@@ -7,2 +7,2 @@ MonoBehaviour",
+        "   speed: 5",
+        "-  jump: 1.0",
+        "+  jump: 1.5",
+    ]
+
+
+def test_diff_without_hunks_is_unchanged():
+    assert compact_unity_yaml_diff("") == ""
+    assert compact_unity_yaml_diff(HEADER) == HEADER